@@ -0,0 +1,293 @@
+import argparse
+import hashlib
+import inspect
+import io
+import json
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import pandas as pd
+
+import cache
+import preprocessing
+import helper
+
+
+def _bool(value):
+    if value.lower() in ("1", "true", "yes"):
+        return True
+    if value.lower() in ("0", "false", "no"):
+        return False
+    raise ValueError(f"bukan boolean: {value!r}")
+
+
+# Endpoint: nama -> (fungsi, konverter per parameter query). Nama endpoint sama dengan nama fungsinya.
+ENDPOINTS = {
+    "subset_and_display_medal": (preprocessing.subset_and_display_medal, {"region": str, "season": str, "from_year": int, "to_year": int}),
+    "medal_time_series": (preprocessing.medal_time_series, {"region": str, "from_year": int, "to_year": int, "season": str}),
+    "plot_data": (preprocessing.plot_data, {}),
+    "games_dimension": (preprocessing.games_dimension, {}),
+    "country_game": (preprocessing.country_game, {}),
+    "participant_data": (preprocessing.participant_data, {}),
+    "city_data": (preprocessing.city_data, {}),
+    "season_data": (preprocessing.season_data, {}),
+    "sport_data_count_page": (preprocessing.sport_data_count_page, {"page": int, "page_size": int, "sort": str, "ascending": _bool}),
+    "athlete_per_country_page": (preprocessing.athlete_per_country_page, {"sort": str, "ascending_pram": _bool, "page": int, "page_size": int}),
+    "total_athlete_page": (preprocessing.total_athlete_page, {"fromm": int, "too": int, "country": str, "sport": str, "page": int, "page_size": int, "sort": str, "ascending": _bool}),
+    "total_athlete_count": (preprocessing.total_athlete_count, {"fromm": int, "too": int, "country": str, "sport": str}),
+    "top_medal": (preprocessing.top_medal, {}),
+    "data_sport_top": (preprocessing.data_sport_top, {"sport": str, "too": int}),
+    "sex_data": (preprocessing.sex_data, {}),
+    "sex_data_sport": (preprocessing.sex_data_sport, {"sport": str}),
+    "athlete_measurements": (preprocessing.athlete_measurements, {"sport": str, "region": str}),
+    "data_games_count": (preprocessing.data_games_count, {}),
+    "region_options": (helper.region_options, {}),
+    "sport_options": (helper.sport_options, {}),
+    "year_scale": (helper.year_scale, {}),
+}
+
+ARROW_TYPE = "application/vnd.apache.arrow.stream"
+
+# Hasil yang sudah diserialisasi, dibagikan ke semua request. Kuncinya memuat sidik jari dataset.
+RESULT_CACHE = cache.LRUCache(
+    max_entries=int(os.environ.get("OLYMPICS_API_CACHE_ENTRIES", 512)),
+    max_bytes=int(os.environ.get("OLYMPICS_API_CACHE_MB", 256)) * 2 ** 20,
+    ttl=float(os.environ.get("OLYMPICS_API_CACHE_TTL", 3600)),
+    sizeof=lambda entry: len(entry[1]),
+)
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def parse_params(name, query):
+    """
+    Mengubah parameter query menjadi argumen fungsi endpoint.
+
+    Args:
+    name (str): Nama endpoint.
+    query (dict): Parameter query mentah.
+
+    Returns:
+    dict: Argumen keyword yang sudah dikonversi, diurutkan berdasarkan nama.
+
+    Raises:
+    BadRequest: Parameter tidak dikenal, tidak valid, atau parameter wajib tidak ada.
+    """
+    function, converters = ENDPOINTS[name]
+    unknown = set(query) - set(converters) - {"format"}
+    if unknown:
+        raise BadRequest(f"parameter tidak dikenal: {', '.join(sorted(unknown))}")
+
+    params = {}
+    for key, value in query.items():
+        if key == "format":
+            continue
+        try:
+            params[key] = converters[key](value)
+        except ValueError as error:
+            raise BadRequest(f"parameter {key} tidak valid: {error}") from None
+
+    missing = [
+        parameter.name for parameter in inspect.signature(function).parameters.values()
+        if parameter.default is inspect.Parameter.empty and parameter.name not in params
+    ]
+    if missing:
+        raise BadRequest(f"parameter wajib tidak ada: {', '.join(missing)}")
+    return dict(sorted(params.items()))
+
+
+def to_frame(result):
+    """
+    Menyeragamkan hasil fungsi menjadi DataFrame dan jumlah total baris.
+
+    Args:
+    result (object): DataFrame, tuple (total, DataFrame) dari fungsi halaman, list, atau angka.
+
+    Returns:
+    tuple: DataFrame dan total baris (None bila hasilnya bukan halaman).
+    """
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[1], pd.DataFrame):
+        return result[1], int(result[0])
+    if isinstance(result, pd.DataFrame):
+        return result, None
+    if isinstance(result, list):
+        return pd.DataFrame({"value": result}), None
+    return pd.DataFrame({"value": [result]}), None
+
+
+def serialize(frame, total, fmt):
+    """
+    Menserialisasi DataFrame sebagai JSON atau Arrow IPC stream.
+
+    Args:
+    frame (DataFrame): Data hasil.
+    total (int): Total baris untuk hasil halaman, atau None.
+    fmt (str): "json" atau "arrow".
+
+    Returns:
+    bytes: Isi respons.
+    """
+    if fmt == "arrow":
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if total is not None:
+            table = table.replace_schema_metadata({**(table.schema.metadata or {}), b"total": str(total).encode()})
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=64 * 1024):
+                writer.write_batch(batch)
+        return sink.getvalue()
+
+    body = json.loads(frame.to_json(orient="split", index=False))
+    if total is not None:
+        body["total"] = total
+    return json.dumps(body).encode()
+
+
+def etag(name, params, fmt, digest):
+    """
+    Membuat ETag dari endpoint, parameter, format, dan sidik jari dataset. ETag bisa dihitung
+    tanpa menjalankan query, jadi request bersyarat yang cocok langsung dijawab 304.
+    """
+    key = json.dumps([name, params, fmt, digest], sort_keys=True, default=str)
+    return '"%s"' % hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+def query(name, params, fmt):
+    """
+    Menjalankan endpoint lewat cache hasil bersama.
+
+    Args:
+    name (str): Nama endpoint.
+    params (dict): Argumen yang sudah dikonversi.
+    fmt (str): "json" atau "arrow".
+
+    Returns:
+    tuple: ETag dan isi respons.
+    """
+    digest = preprocessing.fingerprint()
+    tag = etag(name, params, fmt, digest)
+
+    def compute():
+        frame, total = to_frame(ENDPOINTS[name][0](**params))
+        return tag, serialize(frame, total, fmt)
+
+    return RESULT_CACHE.get_or_create((name, tuple(params.items()), fmt, digest), compute)
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    Handler HTTP: GET /<endpoint>?param=...&format=json|arrow. GET / menampilkan daftar endpoint.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Header dan isi dikirim dalam dua tulisan; tanpa ini Nagle + delayed ACK menambah ~40 ms per respons keep-alive.
+    disable_nagle_algorithm = True
+
+    def _send(self, status, body=b"", content_type="application/json", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _error(self, status, message):
+        self._send(status, json.dumps({"error": message}).encode())
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        name = url.path.strip("/")
+        if not name:
+            listing = {
+                endpoint: list(converters)
+                for endpoint, (_, converters) in ENDPOINTS.items()
+            }
+            self._send(200, json.dumps(listing).encode())
+            return
+        if name not in ENDPOINTS:
+            self._error(404, f"endpoint tidak dikenal: {name}")
+            return
+
+        query_params = dict(parse_qsl(url.query, keep_blank_values=True))
+        accept = self.headers.get("Accept", "")
+        fmt = query_params.get("format") or ("arrow" if ARROW_TYPE in accept else "json")
+        if fmt not in ("json", "arrow"):
+            self._error(400, f"format tidak dikenal: {fmt}")
+            return
+
+        try:
+            params = parse_params(name, query_params)
+        except BadRequest as error:
+            self._error(400, str(error))
+            return
+
+        tag = etag(name, params, fmt, preprocessing.fingerprint())
+        if tag in [value.strip() for value in self.headers.get("If-None-Match", "").split(",")]:
+            self._send(304, headers={"ETag": tag})
+            return
+
+        try:
+            tag, body = query(name, params, fmt)
+        except (KeyError, ValueError) as error:
+            self._error(400, str(error))
+            return
+        except Exception as error:  # noqa: BLE001  (kesalahan query dikembalikan sebagai 500, server tetap hidup)
+            self._error(500, f"{type(error).__name__}: {error}")
+            return
+
+        content_type = ARROW_TYPE if fmt == "arrow" else "application/json"
+        self._send(200, body, content_type, {"ETag": tag, "Cache-Control": "no-cache"})
+
+    do_HEAD = do_GET
+
+    def log_message(self, format, *args):
+        if os.environ.get("OLYMPICS_API_LOG", "0") == "1":
+            super().log_message(format, *args)
+
+
+def serve(host="127.0.0.1", port=8000):
+    """
+    Menjalankan server HTTP multi-thread sampai dihentikan.
+
+    Args:
+    host (str): Alamat yang didengarkan.
+    port (int): Port yang didengarkan.
+    """
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    print(f"Olympics API di http://{host}:{server.server_address[1]}/", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(argv=None):
+    """
+    Entry point command line untuk API.
+
+    Args:
+    argv (list): Argumen command line. Defaultnya sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="API HTTP untuk data dashboard Olimpiade.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--warm", action="store_true", help="Muat dataset sebelum menerima request.")
+    args = parser.parse_args(argv)
+
+    if args.warm:
+        preprocessing.clear_data()
+    serve(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
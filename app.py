@@ -1,11 +1,11 @@
-import pandas as pd
-import numpy as np
 import streamlit as st
-import matplotlib.pyplot as plt
-import seaborn as sns
 import preprocessing
 import helper
-import plotly.express as px
+import profiling
+import prewarm
+
+# Instrumentasi opsional (OLYMPICS_PROFILE=1): mencatat setiap panggilan preprocessing/helper per rerun
+profiling.instrument(preprocessing, helper)
 
 # Mengatur konfigurasi halaman Streamlit
 st.set_page_config(layout="wide")
@@ -16,6 +16,45 @@ st.sidebar.title("OLYMPICS")
 
 # Memilih opsi untuk menampilkan halaman
 page = st.sidebar.radio("Options", ["medals", "overall analysis", "Athlete"])
+profiling.start_trace(page)
+
+@st.cache_resource(show_spinner=False)
+def load_prerendered():
+    # Sekali per proses; figure yang belum dirender tidak ditunggu di sini (lihat helper.load_prerendered)
+    return helper.load_prerendered()
+
+# Memuat figure pra-render dari FIGURES_DIR
+load_prerendered()
+
+# Pemanasan cache opsional (OLYMPICS_PREWARM=1): sekali per proses, di thread latar
+if prewarm.ENABLED:
+    prewarm.start()
+
+def paged_table(key, query, table=st.dataframe):
+    """
+    Menampilkan satu halaman tabel dari query yang dipaginasi di server, beserta navigasi halaman.
+
+    Args:
+    key (str): Kunci unik widget untuk tabel ini.
+    query (callable): Fungsi `query(page, page_size)` yang mengembalikan (total baris, DataFrame halaman).
+    table (callable): Fungsi Streamlit untuk menampilkan DataFrame halaman.
+    """
+    page_size = preprocessing.PAGE_SIZE
+    page = st.session_state.get(f"{key}_page", 1)
+    total, rows = query(page, page_size)
+    pages = max(1, -(-total // page_size))
+    if page > pages:
+        # Filter berubah dan hasilnya lebih sedikit: kembali ke halaman terakhir yang ada.
+        page = pages
+        st.session_state[f"{key}_page"] = page
+        total, rows = query(page, page_size)
+    table(rows)
+    col1, col2 = st.columns([1, 5])
+    with col1:
+        st.number_input("Page", min_value=1, max_value=pages, step=1, key=f"{key}_page")
+    with col2:
+        st.write("")
+        st.caption(f"Page {page} of {pages} ({total} rows)")
 
 def page_medals():
     # Menampilkan halaman analisis medali
@@ -26,6 +65,7 @@ def page_medals():
     col1, col2 = st.columns(2)
     with col1:
         region_input = st.selectbox("Select the region", options=helper.region_options())
+        prewarm.record("region", region_input)
     with col2:
         season_input = st.selectbox("Select the Season", options=["All Season", "Summer", "Winter"])
 
@@ -93,7 +133,8 @@ def overall_analysis():
         athlete_sort = st.selectbox(label="Sort By:", options=["Region", "Total Athlete"])
     with col2:
         ascending_athlete = st.selectbox(label="Ascending:", options=[True, False])
-    st.table(preprocessing.athlete_per_country_data(sort=athlete_sort, ascending_pram=ascending_athlete))
+    paged_table("athlete_country", lambda page, page_size: preprocessing.athlete_per_country_page(
+        sort=athlete_sort, ascending_pram=ascending_athlete, page=page, page_size=page_size), table=st.table)
     st.markdown("---")
 
     # Menampilkan partisipan per game
@@ -102,7 +143,8 @@ def overall_analysis():
 
     # Menampilkan data olahraga per tahun
     st.title("Sport by Year:")
-    st.table(preprocessing.sport_data_count()[0])
+    paged_table("sport_year", lambda page, page_size: preprocessing.sport_data_count_page(page=page, page_size=page_size),
+                table=st.table)
     st.title("Plotting:")
     st.plotly_chart(helper.plot_sport())
     st.markdown("---")
@@ -116,8 +158,10 @@ def Athlate_page():
     col1, col2 = st.columns(2)
     with col1:
         country = st.selectbox("Country:", options=helper.region_options())
+        prewarm.record("region", country)
     with col2:
         sport = st.selectbox("Sport:", options=helper.sport_options())
+        prewarm.record("sport", sport)
 
     # Memilih rentang tahun
     fromm, too = st.slider("Year:", min_value=helper.year_scale()[0], max_value=helper.year_scale()[1], value=(1988, 2015))
@@ -128,12 +172,18 @@ def Athlate_page():
         st.write("")
         st.subheader("Total Number of Athletes:")
     with col2:
-        st.title(helper.total_vil(fromm, too, country, sport)[0])
+        st.title(preprocessing.total_athlete_count(fromm, too, country, sport))
 
     col1, col2, col3 = st.columns([1, 6, 1])  # Mengatur kolom dengan perbandingan lebar 1:6:1
 
     with col2:
-        st.dataframe(helper.total_vil(fromm , too , country , sport)[1])
+        col_sort, col_order = st.columns(2)
+        with col_sort:
+            athlete_sort = st.selectbox("Sort By:", options=["Year", "Name", "region", "Sport", "Event", "Age", "Medal"], key="athlete_sort")
+        with col_order:
+            athlete_ascending = st.selectbox("Ascending:", options=[True, False], key="athlete_ascending")
+        paged_table("athlete_rows", lambda page, page_size: preprocessing.total_athlete_page(
+            fromm, too, country, sport, page=page, page_size=page_size, sort=athlete_sort, ascending=athlete_ascending))
 
     # Menampilkan plot data atlet
     st.title("Plot")
@@ -152,6 +202,7 @@ def Athlate_page():
     # Menampilkan top 30 atlet berdasarkan olahraga
     st.title("Top 30 Athletes by Each Sport")
     sport = st.selectbox("Sport :", options=helper.sport_options())
+    prewarm.record("sport", sport)
     too = st.slider("Year:", min_value=helper.year_scale()[0], max_value=helper.year_scale()[1])
     st.table(preprocessing.data_sport_top(sport, too))
     st.plotly_chart(helper.top30_medal_vil(sport, too))
@@ -186,9 +237,34 @@ def Athlate_page():
 
     
 
-if page == "medals" : 
-    page_medals()
-elif page == "overall analysis" : 
-    overall_analysis()
-elif page == "Athlete":
-    Athlate_page()
+# Rerun ini dihitung sebagai trafik aktif: pemanasan latar menunggu sampai selesai
+with prewarm.live_request():
+    if page == "medals" :
+        page_medals()
+    elif page == "overall analysis" :
+        overall_analysis()
+    elif page == "Athlete":
+        Athlate_page()
+
+# Menampilkan statistik cache figure bersama
+figure_cache = helper.FIGURE_CACHE.stats()
+st.sidebar.caption(
+    f"Figure cache: {figure_cache['hit_ratio']:.0%} hit "
+    f"({figure_cache['hits']}/{figure_cache['hits'] + figure_cache['misses']}), "
+    f"{figure_cache['entries']} figures, {figure_cache['bytes'] / 2 ** 20:.1f} MB"
+)
+
+# Menampilkan kemajuan pemanasan cache
+if prewarm.ENABLED:
+    warm = prewarm.status()
+    st.sidebar.caption(
+        f"Prewarm: {warm['done']}/{warm['jobs']} jobs"
+        + (f", {warm['failed']} failed" if warm["failed"] else "")
+        + (f" in {warm['seconds']:.1f}s" if warm["seconds"] is not None else "")
+    )
+
+# Menampilkan rincian waktu rerun ini bila profiling diaktifkan
+trace = profiling.end_trace()
+if profiling.ENABLED and trace is not None:
+    with st.sidebar.expander(f"Profiling: {trace['seconds'] * 1000:.0f} ms, {len(trace['calls'])} calls"):
+        st.dataframe(profiling.summary(trace), hide_index=True)
@@ -0,0 +1,775 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Argumen pengganti untuk fungsi yang menerima DataFrame: diisi `preprocessing.clear_data()` saat dijalankan.
+FRAME = "<clear_data>"
+
+# Panggilan yang diukur: nama -> (modul, fungsi, argumen).
+CALLS = {
+    "preprocessing.dataset": ("preprocessing", "dataset", ()),
+    "preprocessing.clear_data": ("preprocessing", "clear_data", ()),
+    "preprocessing.fingerprint": ("preprocessing", "fingerprint", ()),
+    "preprocessing.cache_stats": ("preprocessing", "cache_stats", ()),
+    "preprocessing.medal_data": ("preprocessing", "medal_data", (FRAME,)),
+    "preprocessing.subset_and_display_medal": ("preprocessing", "subset_and_display_medal", ("All", "All Season", 1988, 2015)),
+    "preprocessing.medal_time_series": ("preprocessing", "medal_time_series", ("USA", 1988, 2015)),
+    "preprocessing.plot_data": ("preprocessing", "plot_data", ()),
+    "preprocessing.games_dimension": ("preprocessing", "games_dimension", ()),
+    "preprocessing.country_game": ("preprocessing", "country_game", ()),
+    "preprocessing.participant_data": ("preprocessing", "participant_data", ()),
+    "preprocessing.city_data": ("preprocessing", "city_data", ()),
+    "preprocessing.season_data": ("preprocessing", "season_data", ()),
+    "preprocessing.sport_data_count": ("preprocessing", "sport_data_count", ()),
+    "preprocessing.sport_data_count_page": ("preprocessing", "sport_data_count_page", ()),
+    "preprocessing.athlete_per_country_data": ("preprocessing", "athlete_per_country_data", ()),
+    "preprocessing.athlete_per_country_page": ("preprocessing", "athlete_per_country_page", ()),
+    "preprocessing.total_athlete": ("preprocessing", "total_athlete", (1988, 2015, "All", "All")),
+    "preprocessing.total_athlete_page": ("preprocessing", "total_athlete_page", (1988, 2015, "All", "All", 1, 50, "Name")),
+    "preprocessing.total_athlete_count": ("preprocessing", "total_athlete_count", (1988, 2015, "All", "All")),
+    "preprocessing.top_medal": ("preprocessing", "top_medal", ()),
+    "preprocessing.data_sport_top": ("preprocessing", "data_sport_top", ("Athletics", 2016)),
+    "preprocessing.sex_data": ("preprocessing", "sex_data", ()),
+    "preprocessing.sex_data_sport": ("preprocessing", "sex_data_sport", ("Athletics",)),
+    "preprocessing.data_height_vs_weight": ("preprocessing", "data_height_vs_weight", ("Athletics", "All")),
+    "preprocessing.athlete_measurements": ("preprocessing", "athlete_measurements", ("Athletics", "All")),
+    "preprocessing.data_games_count": ("preprocessing", "data_games_count", ()),
+    "preprocessing.catalog": ("preprocessing", "catalog", ()),
+    "helper.region_options": ("helper", "region_options", ()),
+    "helper.sport_options": ("helper", "sport_options", ()),
+    "helper.sport_options_nall": ("helper", "sport_options_nall", ()),
+    "helper.year_scale": ("helper", "year_scale", ()),
+    "helper.plot_medal": ("helper", "plot_medal", ("USA", 1988, 2015)),
+    "helper.num_analysis": ("helper", "num_analysis", ()),
+    "helper.plot_participant": ("helper", "plot_participant", ()),
+    "helper.plot_city": ("helper", "plot_city", ()),
+    "helper.plot_season": ("helper", "plot_season", ()),
+    "helper.plot_sport": ("helper", "plot_sport", ()),
+    "helper.total_vil": ("helper", "total_vil", (1988, 2015, "All", "All")),
+    "helper.sport_vil": ("helper", "sport_vil", (1988, 2015, "USA", "All")),
+    "helper.top_medal_vil": ("helper", "top_medal_vil", ()),
+    "helper.top30_medal_vil": ("helper", "top30_medal_vil", ("Athletics", 2016)),
+    "helper.sex_vil": ("helper", "sex_vil", ()),
+    "helper.sex_vil_sport": ("helper", "sex_vil_sport", ("Athletics",)),
+    "helper.plot_height_weight": ("helper", "plot_height_weight", ("Athletics", "All")),
+    "helper.vil_games_participant": ("helper", "vil_games_participant", ()),
+}
+
+# Fungsi publik yang sengaja tidak diukur: langkah build, I/O figure, dekorator, dan utilitas generik.
+NOT_BENCHMARKED = {
+    "preprocessing.build_columnar", "preprocessing.precompute", "preprocessing.publish_shared",
+    "preprocessing.publish_catalog", "preprocessing.paginate", "preprocessing.query_backend",
+    "helper.cached_figure", "helper.read_prerendered", "helper.write_prerendered",
+    "helper.build_figures", "helper.load_prerendered",
+}
+
+# Baseline tersimpan untuk `run`, diukur pada `generate.py 270k` setelah `build.py all` (cache kolumnar,
+# kolom bersama, katalog, agregat, dan figure). `run` menjalankan build yang sama sebelum mengukur,
+# jadi hasilnya tidak bergantung pada artefak yang kebetulan sudah ada di direktori data.
+BASELINE_PATH = "benchmark_baseline.json"
+
+
+def _peak_rss_mb():
+    """
+    Mengambil puncak resident memory proses ini.
+
+    Returns:
+    float: Puncak RSS dalam MB.
+    """
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS melaporkan byte.
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def _arguments(args):
+    """
+    Mengganti argumen pengganti `FRAME` dengan dataset bersih.
+    """
+    if FRAME not in args:
+        return args
+    import preprocessing
+
+    return tuple(preprocessing.clear_data() if arg == FRAME else arg for arg in args)
+
+
+def _function(name):
+    """
+    Mengambil fungsi yang diukur. Fungsi figure diambil tanpa cache figure dan file
+    pra-render, agar yang diukur adalah biaya rendernya.
+    """
+    import importlib
+
+    module_name, function_name, _ = CALLS[name]
+    function = getattr(importlib.import_module(module_name), function_name)
+    return getattr(function, "__wrapped__", function)
+
+
+def uncovered():
+    """
+    Mencari fungsi publik preprocessing dan helper yang tidak ada di `CALLS` maupun `NOT_BENCHMARKED`.
+
+    Returns:
+    list: Nama fungsi dalam format "modul.fungsi".
+    """
+    import inspect
+
+    import preprocessing
+    import helper
+
+    missing = []
+    for module in (preprocessing, helper):
+        for function_name, function in inspect.getmembers(module, inspect.isfunction):
+            name = f"{module.__name__}.{function_name}"
+            if function.__module__ == module.__name__ and not function_name.startswith("_") \
+                    and name not in CALLS and name not in NOT_BENCHMARKED:
+                missing.append(name)
+    return missing
+
+
+def _reset():
+    """
+    Mengosongkan agregat dan cache figure, tetapi mempertahankan dataset yang sudah dimuat.
+    """
+    import preprocessing
+    import helper
+
+    preprocessing._AGGREGATES.clear()
+    preprocessing.RESULT_CACHE.clear()
+    helper.FIGURE_CACHE.clear()
+
+
+def build_artifacts():
+    """
+    Membangun semua artefak data (`build.py all`) di subprocess, agar `run` mengukur tata letak
+    artefak yang sama dengan baseline dan proses pengukurannya mulai bersih.
+    """
+    subprocess.run([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "build.py"), "all"],
+                   check=True, stdout=subprocess.DEVNULL)
+
+
+def run(names, repeat):
+    """
+    Mengukur setiap panggilan dalam satu proses: panggilan pertama setelah agregat dikosongkan,
+    median panggilan berikutnya, dan puncak alokasi memori (tracemalloc) panggilan pertama.
+
+    Args:
+    names (list): Nama panggilan di `CALLS`.
+    repeat (int): Jumlah panggilan hangat per fungsi.
+
+    Returns:
+    dict: Metadata dataset ("meta") dan hasil per nama panggilan ("results").
+    """
+    import platform
+    import tracemalloc
+
+    import pandas as pd
+
+    import preprocessing
+
+    start = time.perf_counter()
+    rows = len(preprocessing.clear_data())
+    load_seconds = time.perf_counter() - start
+
+    results = {}
+    for name in names:
+        function = _function(name)
+        args = _arguments(CALLS[name][2])
+
+        _reset()
+        start = time.perf_counter()
+        function(*args)
+        first = time.perf_counter() - start
+
+        _reset()
+        tracemalloc.start()
+        function(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        warm = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function(*args)
+            warm.append(time.perf_counter() - start)
+        warm.sort()
+
+        results[name] = {"first_s": first, "warm_s": warm[len(warm) // 2], "peak_mb": peak / 2 ** 20}
+
+    return {
+        "meta": {
+            "rows": rows,
+            "load_s": load_seconds,
+            "data_dir": preprocessing.DATA_DIR,
+            "columnar": preprocessing.USE_COLUMNAR,
+            "source": preprocessing.cache_stats()["source"],
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, tolerance):
+    """
+    Membandingkan hasil `run` dengan baseline.
+
+    Sebuah metrik dianggap regresi bila lebih besar dari baseline * (1 + tolerance) dan selisih
+    absolutnya melewati ambang derau (10 ms untuk waktu, 1 MB untuk memori).
+
+    Args:
+    current (dict): Hasil `run`.
+    baseline (dict): Hasil `run` yang tersimpan.
+    tolerance (float): Kenaikan relatif yang masih diterima.
+
+    Returns:
+    list: Tuple (nama, metrik, baseline, sekarang) untuk setiap regresi.
+    """
+    noise = {"first_s": 0.01, "warm_s": 0.01, "peak_mb": 1.0}
+    regressions = []
+    print(f"{'call':45} {'first':>14} {'warm':>14} {'peak MB':>14}")
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:45} (tidak ada di baseline)")
+            continue
+        cells = []
+        for metric, threshold in noise.items():
+            ratio = result[metric] / before[metric] if before[metric] else float("inf")
+            regressed = result[metric] > before[metric] * (1 + tolerance) and result[metric] - before[metric] > threshold
+            if regressed:
+                regressions.append((name, metric, before[metric], result[metric]))
+            cells.append(f"{ratio:12.2f}x{'!' if regressed else ' '}")
+        print(f"{name:45} {' '.join(cells)}")
+    if baseline["meta"]["rows"] != current["meta"]["rows"]:
+        print(f"Peringatan: baseline diukur pada {baseline['meta']['rows']} baris, sekarang {current['meta']['rows']}.")
+    if baseline["meta"].get("source") != current["meta"].get("source"):
+        print(f"Peringatan: baseline dimuat dari {baseline['meta'].get('source')}, sekarang {current['meta'].get('source')}.")
+    return regressions
+
+
+def _cold_worker(name):
+    """
+    Mengukur satu panggilan di proses baru, termasuk impor modul dan pemuatan data.
+
+    Args:
+    name (str): Nama panggilan di `CALLS`.
+    """
+    import importlib
+
+    # Impor pandas sebelum pengukuran dimulai, agar biaya impornya tidak ikut diukur.
+    importlib.import_module("pandas")
+
+    module_name, function_name, args = CALLS[name]
+    args = _arguments(args)
+    rss_before = _peak_rss_mb()
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    getattr(module, function_name)(*args)
+    elapsed = time.perf_counter() - start
+
+    print(json.dumps({"seconds": elapsed, "peak_rss_mb": _peak_rss_mb(), "delta_rss_mb": _peak_rss_mb() - rss_before}))
+
+
+# Modul berat yang seharusnya tidak ikut terimpor saat startup.
+HEAVY_MODULES = ["plotly.express", "seaborn", "matplotlib"]
+
+
+def _startup_worker():
+    """
+    Mengukur waktu impor modul dashboard di proses baru, dan apakah data ikut dimuat.
+    """
+    start = time.perf_counter()
+    import preprocessing
+    import helper  # noqa: F401
+    elapsed = time.perf_counter() - start
+
+    print(json.dumps({
+        "seconds": elapsed,
+        "data_loaded": preprocessing._CACHE["frame"] is not None,
+        "heavy_modules": [name for name in HEAVY_MODULES if name in sys.modules],
+    }))
+
+
+def startup(repeat):
+    """
+    Menjalankan pengukuran startup beberapa kali, masing-masing di subprocess baru.
+
+    Args:
+    repeat (int): Jumlah pengulangan.
+
+    Returns:
+    list: Hasil pengukuran per pengulangan.
+    """
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, __file__, "_startup"], capture_output=True, text=True, check=True,
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return runs
+
+
+def cold(names, columnar):
+    """
+    Menjalankan setiap panggilan di subprocess terpisah agar pengukurannya benar-benar dingin.
+
+    Args:
+    names (list): Nama panggilan di `CALLS`.
+    columnar (bool): Pakai cache kolumnar atau paksa pemuatan dari CSV.
+
+    Returns:
+    dict: Hasil pengukuran per nama panggilan.
+    """
+    env = dict(os.environ, OLYMPICS_COLUMNAR="1" if columnar else "0")
+    results = {}
+    for name in names:
+        output = subprocess.run(
+            [sys.executable, __file__, "_cold", name],
+            env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        results[name] = json.loads(output.strip().splitlines()[-1])
+    return results
+
+
+def _memory_mb(pid):
+    """
+    Mengambil RSS dan PSS sebuah proses dari /proc (khusus Linux). PSS membagi halaman bersama
+    dengan jumlah proses yang memetakannya, jadi jumlah PSS semua pekerja adalah memori totalnya.
+
+    Returns:
+    dict: "rss_mb" dan "pss_mb", atau None bila /proc tidak tersedia.
+    """
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line and not line.startswith(" "))
+    except OSError:
+        return None
+    return {key: int(fields[field].split()[0]) / 1024 for key, field in (("rss_mb", "Rss"), ("pss_mb", "Pss"))}
+
+
+def _attach_worker():
+    """
+    Memuat dataset bersih dan membaca setiap kolomnya, lalu menunggu sampai stdin ditutup agar
+    semua pekerja hidup bersamaan saat memorinya diukur.
+    """
+    import numpy as np
+
+    import preprocessing
+
+    start = time.perf_counter()
+    data = preprocessing.clear_data()
+    for column in data.columns:
+        values = data[column].array.codes if data[column].dtype == "category" else data[column].to_numpy()
+        np.add.reduce(values, dtype=np.float64)
+    elapsed = time.perf_counter() - start
+
+    print(json.dumps({"seconds": elapsed, "source": preprocessing.cache_stats()["source"]}), flush=True)
+    sys.stdin.read()
+
+
+def workers(counts, shared):
+    """
+    Menjalankan sejumlah proses pekerja bersamaan dan mengukur waktu muat serta memorinya.
+
+    Args:
+    counts (list): Jumlah pekerja yang dicoba, misalnya [1, 2, 4].
+    shared (bool): Pakai kolom bersama dari `publish_shared` atau paksa pemuatan per proses.
+
+    Returns:
+    list: Satu dict per jumlah pekerja dengan sumber data, waktu muat median, serta RSS dan PSS total.
+    """
+    env = dict(os.environ, OLYMPICS_SHARED="1" if shared else "0")
+    results = []
+    for count in counts:
+        processes = [
+            subprocess.Popen([sys.executable, __file__, "_attach"], env=env, stdin=subprocess.PIPE,
+                             stdout=subprocess.PIPE, text=True)
+            for _ in range(count)
+        ]
+        try:
+            reports = [json.loads(process.stdout.readline()) for process in processes]
+            memory = [_memory_mb(process.pid) for process in processes]
+        finally:
+            for process in processes:
+                process.stdin.close()
+                process.wait()
+
+        seconds = sorted(report["seconds"] for report in reports)
+        results.append({
+            "workers": count,
+            "source": reports[0]["source"],
+            "load_s": seconds[len(seconds) // 2],
+            "rss_mb": sum(m["rss_mb"] for m in memory) if all(memory) else None,
+            "pss_mb": sum(m["pss_mb"] for m in memory) if all(memory) else None,
+        })
+    return results
+
+
+# Panggilan fase agregat `stress`: fungsi yang masing-masing membangun satu atau beberapa agregat mahal.
+STRESS_CALLS = [
+    "preprocessing.subset_and_display_medal", "preprocessing.medal_time_series", "preprocessing.top_medal",
+    "preprocessing.data_sport_top", "preprocessing.athlete_per_country_data", "preprocessing.total_athlete_count",
+    "preprocessing.sex_data_sport", "preprocessing.participant_data", "helper.sport_vil",
+]
+
+
+def _concurrently(count, calls):
+    """
+    Menjalankan `calls` secara bergiliran dari `count` thread yang dimulai bersamaan.
+
+    Returns:
+    tuple: Detik sampai semua thread selesai dan daftar exception yang terjadi.
+    """
+    import threading
+
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def worker(index):
+        function, args = calls[index % len(calls)]
+        barrier.wait()
+        try:
+            function(*args)
+        except Exception as error:  # noqa: BLE001  (dilaporkan setelah semua thread selesai)
+            errors.append(error)
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, errors
+
+
+def stress(threads):
+    """
+    Mengirim panggilan dingin serentak dari banyak thread, seperti semua sesi Streamlit setelah
+    server dimulai ulang, lalu menghitung berapa kali dataset dimuat dan setiap agregat dibangun.
+
+    Fase pertama memanggil `clear_data()` dari semua thread pada proses yang belum memuat apa pun.
+    Fase kedua mengosongkan agregat dan cache figure, lalu memanggil `STRESS_CALLS` bergiliran.
+
+    Args:
+    threads (int): Jumlah thread per fase.
+
+    Returns:
+    dict: Per fase: detik, jumlah exception, jumlah pemuatan atau pembangunan terbanyak per kunci,
+        dan jumlah panggilan yang menunggu hasil thread lain.
+    """
+    import importlib
+
+    import cache
+    import preprocessing
+    import helper
+
+    cache.TRACK_FLIGHTS = True
+    flights = preprocessing._FLIGHTS
+    results = {}
+
+    seconds, errors = _concurrently(threads, [(preprocessing.clear_data, ())])
+    stats = flights.stats()
+    results["load"] = {
+        "seconds": seconds, "errors": len(errors), "loads": preprocessing.cache_stats()["misses"],
+        "most_runs": max(stats["runs"].values(), default=0), "joins": sum(stats["joins"].values()),
+    }
+    for error in errors:
+        print(f"{type(error).__name__}: {error}")
+
+    _reset()
+    flights.reset_stats()
+    helper.FIGURE_CACHE._flights.reset_stats()
+    calls = []
+    for name in STRESS_CALLS:
+        module_name, function_name, args = CALLS[name]
+        calls.append((getattr(importlib.import_module(module_name), function_name), _arguments(args)))
+    loads = preprocessing.cache_stats()["misses"]
+    seconds, errors = _concurrently(threads, calls)
+    stats = flights.stats()
+    for key, runs in helper.FIGURE_CACHE._flights.stats()["runs"].items():
+        stats["runs"][("figure", key)] = runs
+    results["aggregates"] = {
+        "seconds": seconds, "errors": len(errors), "loads": preprocessing.cache_stats()["misses"] - loads,
+        "most_runs": max(stats["runs"].values(), default=0), "joins": sum(stats["joins"].values()),
+    }
+    for error in errors:
+        print(f"{type(error).__name__}: {error}")
+    return results
+
+
+def stress_failures(results):
+    """
+    Memeriksa invarian hasil `stress`: fase pertama memuat dataset tepat sekali, tidak ada kunci
+    yang dimuat atau dibangun lebih dari sekali, dan tidak ada exception.
+
+    Args:
+    results (dict): Hasil `stress`.
+
+    Returns:
+    list: Pesan untuk setiap invarian yang dilanggar. Kosong bila semuanya terpenuhi.
+    """
+    failures = []
+    if results["load"]["loads"] != 1:
+        failures.append(f"load: dataset dimuat {results['load']['loads']} kali, seharusnya 1")
+    for phase, result in results.items():
+        if result["most_runs"] > 1:
+            failures.append(f"{phase}: satu kunci dijalankan {result['most_runs']} kali, seharusnya paling banyak 1")
+        if result["errors"]:
+            failures.append(f"{phase}: {result['errors']} exception")
+    return failures
+
+
+# Kasus uji kesetaraan backend: (method, argumen). Mencakup filter kosong, nilai tidak dikenal,
+# rentang terbalik, dan musim yang tidak ada.
+BACKEND_CASES = [
+    ("subset_and_display_medal", ("All", "All Season", None, None)),
+    ("subset_and_display_medal", ("All", "Summer", 1988, 2015)),
+    ("subset_and_display_medal", ("USA", "Winter", 1960, 2016)),
+    ("subset_and_display_medal", ("All", "Spring", 1960, 2016)),
+    ("subset_and_display_medal", ("All", "All Season", 2016, 1988)),
+    ("total_athlete", (1988, 2015, "All", "All")),
+    ("total_athlete", (1960, 2016, "USA", "All")),
+    ("total_athlete", (1896, 2016, "All", "Swimming")),
+    ("total_athlete", (1896, 2016, "Germany", "Athletics")),
+    ("total_athlete", (1896, 2016, "Atlantis", "All")),
+    ("total_athlete", (None, 1960, "All", "All")),
+    ("total_athlete", (1988, None, "USA", "All")),
+    ("total_athlete", (None, None, "All", "Swimming")),
+    ("sex_data_sport", ("Swimming",)),
+    ("sex_data_sport", ("Quidditch",)),
+    ("data_height_vs_weight", ("Athletics", "USA")),
+    ("data_height_vs_weight", ("Gymnastics", "All")),
+    ("data_height_vs_weight", ("All", "China")),
+]
+
+
+def backends(names, repeat):
+    """
+    Membandingkan hasil setiap backend SQL dengan backend pandas dan mengukur waktunya.
+
+    Args:
+    names (list): Nama backend, misalnya ["sqlite", "duckdb"].
+    repeat (int): Jumlah panggilan hangat per kasus.
+
+    Returns:
+    list: Tuple (backend, method, argumen, pesan) untuk setiap hasil yang berbeda.
+    """
+    import pandas as pd
+
+    import preprocessing
+
+    reference = preprocessing.query_backend("pandas")
+    mismatches = []
+    print(f"{'backend':8} {'call':60} {'pandas ms':>10} {'backend ms':>10}")
+    for name in names:
+        start = time.perf_counter()
+        backend = preprocessing.query_backend(name)
+        print(f"{name:8} {'(load)':60} {'':>10} {(time.perf_counter() - start) * 1000:10.1f}")
+        for method, args in BACKEND_CASES:
+            seconds = []
+            for candidate in (reference, backend):
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    result = getattr(candidate, method)(*args)
+                    timings.append(time.perf_counter() - start)
+                seconds.append(sorted(timings)[len(timings) // 2])
+                if candidate is reference:
+                    expected = result
+            try:
+                pd.testing.assert_frame_equal(result, expected, check_index_type="equiv")
+            except AssertionError as error:
+                mismatches.append((name, method, args, str(error)))
+            call = f"{method}{args}"
+            print(f"{name:8} {call:60} {seconds[0] * 1000:10.1f} {seconds[1] * 1000:10.1f}")
+    return mismatches
+
+
+# Tahun akhir untuk pemeriksaan top-k per cabang olahraga di `top_parity`.
+TOP_YEARS = [1960, 2016]
+
+
+def _reference_top(sport, too, k):
+    """
+    Top-k atlet dengan cara lama: groupby (Name, atlet, Sport) lalu `sort_values` stabil berdasarkan
+    total. Atlet dengan nama sama dipisahkan oleh ID, seperti kunci atlet di `preprocessing`.
+    """
+    import pandas as pd
+
+    import preprocessing
+
+    data = preprocessing.clear_data(["ID", "Name", "Sport", "Year", "Medal"])
+    if sport is not None:
+        data = data[(data["Sport"] == sport) & (data["Year"] <= too)]
+    medals = pd.get_dummies(data[["ID", "Name", "Sport", "Medal"]], prefix="medal", columns=["Medal"])
+    medals["Total Medal"] = medals["medal_Gold"].astype(int) + medals["medal_Silver"] + medals["medal_Bronze"]
+    grouped = medals.groupby(["Name", "ID", "Sport"], observed=True)[["medal_Gold", "medal_Silver", "medal_Bronze", "Total Medal"]].sum()
+    ranked = grouped.sort_values(by="Total Medal", ascending=False, kind="stable").reset_index()
+    return ranked, ranked.head(k)
+
+
+def top_parity():
+    """
+    Membandingkan `top_medal` dan `data_sport_top` dengan `_reference_top`, untuk semua atlet dan
+    setiap cabang olahraga pada TOP_YEARS. Kasus dengan total yang seri di batas ke-k dihitung
+    terpisah, karena di situlah pemilihan top-k paling mudah berbeda.
+
+    Returns:
+    tuple: Daftar ketidaksamaan (kasus, pesan) dan jumlah kasus dengan batas seri.
+    """
+    import preprocessing
+    import helper
+
+    cases = [("top_medal", (), None, None, 20)]
+    for sport in helper.sport_options_nall():
+        for too in TOP_YEARS:
+            cases.append(("data_sport_top", (sport, too), sport, too, 30))
+
+    mismatches, tied = [], 0
+    for function_name, args, sport, too, k in cases:
+        ranked, expected = _reference_top(sport, too, k)
+        totals = ranked["Total Medal"].to_numpy()
+        if len(totals) > k and totals[k - 1] == totals[k]:
+            tied += 1
+        result = getattr(preprocessing, function_name)(*args)
+        for column in ["Name", "Sport", "medal_Gold", "medal_Silver", "medal_Bronze", "Total Medal"]:
+            if result[column].astype(str).tolist() != expected[column].astype(str).tolist():
+                mismatches.append((f"{function_name}{args}", f"kolom {column} berbeda"))
+                break
+    return mismatches, tied
+
+
+def main(argv=None):
+    """
+    Entry point command line untuk benchmark.
+
+    Args:
+    argv (list): Argumen command line. Defaultnya sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark fungsi dashboard Olimpiade.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    cold_parser = commands.add_parser("cold", help="Waktu muat dingin dan puncak memori per fungsi, CSV vs kolumnar.")
+    cold_parser.add_argument("names", nargs="*", default=list(CALLS))
+
+    worker = commands.add_parser("_cold")
+    worker.add_argument("name")
+
+    run_parser = commands.add_parser("run", help="Waktu dan memori setiap fungsi publik, dibandingkan dengan baseline.")
+    run_parser.add_argument("names", nargs="*", default=list(CALLS))
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--output", help="Tulis hasil sebagai JSON ke path ini.")
+    run_parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON untuk perbandingan.")
+    run_parser.add_argument("--tolerance", type=float, default=0.5)
+    run_parser.add_argument("--no-build", action="store_true",
+                            help="Ukur artefak yang sudah ada tanpa menjalankan `build.py all` lebih dulu.")
+
+    startup_parser = commands.add_parser("startup", help="Waktu impor preprocessing dan helper di proses baru.")
+    startup_parser.add_argument("--repeat", type=int, default=5)
+
+    commands.add_parser("_startup")
+
+    workers_parser = commands.add_parser("workers", help="Waktu muat dan memori total beberapa proses pekerja, bersama vs terpisah.")
+    workers_parser.add_argument("counts", nargs="*", type=int, default=[1, 2, 4, 8])
+
+    commands.add_parser("_attach")
+
+    stress_parser = commands.add_parser("stress", help="Panggilan dingin serentak: dataset dan setiap agregat harus dimuat sekali; exit 1 bila tidak.")
+    stress_parser.add_argument("--threads", type=int, default=50)
+
+    backends_parser = commands.add_parser("backends", help="Kesetaraan hasil dan waktu backend SQL terhadap pandas.")
+    backends_parser.add_argument("names", nargs="*", default=["sqlite"])
+    backends_parser.add_argument("--repeat", type=int, default=3)
+
+    commands.add_parser("compare", help="Kesetaraan top_medal dan data_sport_top dengan groupby lama, termasuk batas seri.")
+
+    args = parser.parse_args(argv)
+    if args.command == "_cold":
+        _cold_worker(args.name)
+        return
+    if args.command == "_startup":
+        _startup_worker()
+        return
+    if args.command == "_attach":
+        _attach_worker()
+        return
+    if args.command == "run":
+        missing = uncovered()
+        if missing:
+            print(f"Fungsi publik tanpa benchmark: {', '.join(missing)}")
+        if not args.no_build:
+            build_artifacts()
+        current = run(args.names, args.repeat)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(current, f, indent=2)
+        if not os.path.exists(args.baseline):
+            for name, result in current["results"].items():
+                print(f"{name:45} {result['first_s']:8.4f}s {result['warm_s']:8.4f}s {result['peak_mb']:8.1f} MB")
+            return
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.tolerance)
+        if regressions:
+            for name, metric, before, after in regressions:
+                print(f"REGRESI {name} {metric}: {before:.4f} -> {after:.4f}")
+            sys.exit(1)
+        return
+    if args.command == "startup":
+        runs = startup(args.repeat)
+        seconds = sorted(run["seconds"] for run in runs)
+        print(f"import preprocessing, helper: median {seconds[len(seconds) // 2]:.3f}s, min {seconds[0]:.3f}s")
+        print(f"data loaded at import: {any(run['data_loaded'] for run in runs)}")
+        print(f"heavy modules at import: {', '.join(runs[0]['heavy_modules']) or 'none'}")
+        return
+    if args.command == "workers":
+        print(f"{'mode':9} {'workers':>7} {'source':>9} {'load s':>8} {'RSS MB':>9} {'PSS MB':>9}")
+        for shared in (False, True):
+            for result in workers(args.counts, shared):
+                rss, pss = result["rss_mb"], result["pss_mb"]
+                print(f"{'shared' if shared else 'private':9} {result['workers']:7} {result['source']:>9} {result['load_s']:8.3f} "
+                      f"{rss if rss is None else f'{rss:9.1f}'} {pss if pss is None else f'{pss:9.1f}'}")
+        return
+    if args.command == "stress":
+        results = stress(args.threads)
+        for phase, result in results.items():
+            print(f"{phase:10} {args.threads} threads in {result['seconds']:.2f}s: {result['loads']} dataset loads, "
+                  f"most runs per key {result['most_runs']}, {result['joins']} coalesced calls, {result['errors']} errors")
+        failures = stress_failures(results)
+        for failure in failures:
+            print(f"GAGAL {failure}")
+        if failures:
+            sys.exit(1)
+        return
+    if args.command == "compare":
+        mismatches, tied = top_parity()
+        for case, message in mismatches:
+            print(f"BERBEDA {case}: {message}")
+        print(f"{len(mismatches)} berbeda, {tied} kasus dengan total seri di batas ke-k")
+        if mismatches or not tied:
+            sys.exit(1)
+        return
+    if args.command == "backends":
+        mismatches = backends(args.names, args.repeat)
+        for name, method, call_args, message in mismatches:
+            print(f"BERBEDA {name} {method}{call_args}:\n{message}")
+        if mismatches:
+            sys.exit(1)
+        return
+
+    before = cold(args.names, columnar=False)
+    after = cold(args.names, columnar=True)
+    print(f"{'call':45} {'csv s':>8} {'col s':>8} {'csv MB':>8} {'col MB':>8}")
+    for name in args.names:
+        print(f"{name:45} {before[name]['seconds']:8.3f} {after[name]['seconds']:8.3f} "
+              f"{before[name]['delta_rss_mb']:8.1f} {after[name]['delta_rss_mb']:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import argparse
+import time
+
+import preprocessing
+import helper
+
+
+def build_columnar(args):
+    """
+    Menulis cache kolumnar dari dataset bersih.
+
+    Args:
+    args (Namespace): Argumen command line (tidak dipakai).
+    """
+    start = time.perf_counter()
+    path = preprocessing.build_columnar()
+    print(f"columnar: {path} ({time.perf_counter() - start:.2f}s)")
+
+
+def build_shared(args):
+    """
+    Menerbitkan kolom dataset bersih untuk dipetakan ke memori oleh proses server.
+
+    Args:
+    args (Namespace): Argumen command line (tidak dipakai).
+    """
+    start = time.perf_counter()
+    path = preprocessing.publish_shared()
+    print(f"shared: {path} ({time.perf_counter() - start:.2f}s)")
+
+
+def build_catalog(args):
+    """
+    Menulis katalog dimensi (pilihan widget dan rentang tahun) untuk dataset saat ini.
+
+    Args:
+    args (Namespace): Argumen command line (tidak dipakai).
+    """
+    start = time.perf_counter()
+    path = preprocessing.publish_catalog()
+    print(f"catalog: {path} ({time.perf_counter() - start:.2f}s)")
+
+
+def build_figures(args):
+    """
+    Merender figure tanpa parameter ke file JSON Plotly.
+
+    Args:
+    args (Namespace): Argumen command line (tidak dipakai).
+    """
+    start = time.perf_counter()
+    paths = helper.build_figures()
+    print(f"figures: {len(paths)} files in {helper.FIGURES_DIR} ({time.perf_counter() - start:.2f}s)")
+
+
+def build_aggregates(args):
+    """
+    Membangun semua agregat dashboard secara paralel ke artefak berversi.
+
+    Args:
+    args (Namespace): Argumen command line (`workers`).
+    """
+    start = time.perf_counter()
+    manifest = preprocessing.precompute(workers=args.workers)
+    for name, job in sorted(manifest["jobs"].items(), key=lambda item: -item[1]["seconds"]):
+        print(f"  {name:22} {job['seconds']:7.2f}s {job['bytes'] / 2 ** 20:8.1f} MB")
+    print(f"aggregates: {len(manifest['jobs'])} artifacts in {preprocessing.ARTIFACT_DIR} ({time.perf_counter() - start:.2f}s)")
+
+
+def build_all(args):
+    """
+    Menjalankan semua langkah build berurutan: cache kolumnar, kolom bersama, katalog, agregat, lalu figure.
+
+    Args:
+    args (Namespace): Argumen command line (`workers`).
+    """
+    build_columnar(args)
+    build_shared(args)
+    build_catalog(args)
+    build_aggregates(args)
+    build_figures(args)
+
+
+def main(argv=None):
+    """
+    Entry point command line untuk langkah build artefak data.
+
+    Args:
+    argv (list): Argumen command line. Defaultnya sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Build artefak data dashboard Olimpiade.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    columnar = commands.add_parser("columnar", help="Tulis cache kolumnar (Parquet) dari CSV.")
+    columnar.set_defaults(func=build_columnar)
+
+    shared = commands.add_parser("shared", help="Terbitkan kolom dataset bersih sebagai file NumPy untuk mmap bersama.")
+    shared.set_defaults(func=build_shared)
+
+    catalog = commands.add_parser("catalog", help="Tulis katalog dimensi untuk pilihan widget dan rentang tahun.")
+    catalog.set_defaults(func=build_catalog)
+
+    figures = commands.add_parser("figures", help="Render figure tanpa parameter ke JSON Plotly.")
+    figures.set_defaults(func=build_figures)
+
+    aggregates = commands.add_parser("aggregates", help="Bangun agregat dashboard secara paralel ke artefak berversi.")
+    aggregates.add_argument("--workers", type=int, help="Jumlah proses pekerja. Defaultnya jumlah CPU.")
+    aggregates.set_defaults(func=build_aggregates)
+
+    everything = commands.add_parser("all", help="Jalankan columnar, shared, catalog, aggregates, dan figures berurutan.")
+    everything.add_argument("--workers", type=int, help="Jumlah proses pekerja. Defaultnya jumlah CPU.")
+    everything.set_defaults(func=build_all)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
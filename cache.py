@@ -0,0 +1,219 @@
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+
+_MISSING = object()
+
+# Set True (misalnya dari `benchmark.py stress`) agar SingleFlight menghitung eksekusi dan penggabungan
+# per kunci. Mati secara default: hitungan per kunci tumbuh tanpa batas di server yang berjalan lama.
+TRACK_FLIGHTS = False
+
+
+class SingleFlight:
+    """
+    Menggabungkan panggilan serentak dengan kunci yang sama: satu thread menjalankan fungsinya,
+    thread lain menunggu future yang sama dan menerima hasil (atau exception) yang sama.
+
+    Lock hanya dipegang untuk mendaftar atau mencari future, tidak selama fungsi berjalan.
+    Setelah selesai, future dilepas, jadi panggilan berikutnya menjalankan fungsinya lagi;
+    pemanggil yang perlu hasil tersimpan memeriksa cache-nya sendiri di dalam fungsi.
+
+    Hitungan `runs` dan `joins` hanya dicatat bila TRACK_FLIGHTS aktif.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.runs = Counter()
+        self.joins = Counter()
+
+    def do(self, key, function):
+        """
+        Menjalankan `function`, atau menunggu hasil panggilan yang sedang berjalan dengan kunci yang sama.
+
+        Args:
+        key (hashable): Kunci panggilan.
+        function (callable): Fungsi tanpa argumen.
+
+        Returns:
+        object: Hasil `function`.
+        """
+        with self._lock:
+            future = self._flights.get(key)
+            leader = future is None
+            if leader:
+                future = self._flights[key] = Future()
+                if TRACK_FLIGHTS:
+                    self.runs[key] += 1
+            elif TRACK_FLIGHTS:
+                self.joins[key] += 1
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(function())
+        except BaseException as error:
+            future.set_exception(error)
+        finally:
+            with self._lock:
+                del self._flights[key]
+        return future.result()
+
+    def stats(self):
+        """
+        Mengambil jumlah eksekusi dan jumlah panggilan yang ikut menunggu per kunci, sejak
+        TRACK_FLIGHTS diaktifkan atau sejak `reset_stats` terakhir.
+
+        Returns:
+        dict: "runs" dan "joins", masing-masing dict kunci -> jumlah.
+        """
+        with self._lock:
+            return {"runs": dict(self.runs), "joins": dict(self.joins)}
+
+    def reset_stats(self):
+        with self._lock:
+            self.runs.clear()
+            self.joins.clear()
+
+
+class LRUCache:
+    """
+    Cache LRU dalam memori yang dibatasi jumlah entri, total ukuran, dan umur entri.
+
+    Aman dipakai bersama oleh banyak thread (misalnya semua sesi Streamlit dalam satu
+    proses server). Kunci hanya dipegang saat membaca atau mengubah isi cache, tidak
+    saat nilai baru sedang dibuat.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=256 * 2 ** 20, ttl=3600, sizeof=None):
+        """
+        Args:
+        max_entries (int): Jumlah entri maksimum.
+        max_bytes (int): Total ukuran maksimum semua entri, dalam byte.
+        ttl (float): Umur maksimum entri dalam detik. None berarti tanpa batas.
+        sizeof (callable): Fungsi yang mengembalikan ukuran nilai dalam byte. Defaultnya 0.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof or (lambda value: 0)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._flights = SingleFlight()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _expired(self, stored_at):
+        return self.ttl is not None and time.monotonic() - stored_at > self.ttl
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def get(self, key, default=None):
+        """
+        Mengambil nilai dan menandainya sebagai yang terakhir dipakai.
+
+        Args:
+        key (hashable): Kunci cache.
+        default (object): Nilai bila kunci tidak ada atau sudah kedaluwarsa.
+
+        Returns:
+        object: Nilai yang tersimpan, atau `default`.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[2]):
+                self._remove(key)
+                self._evictions += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        """
+        Menyimpan nilai, lalu membuang entri yang paling lama tidak dipakai bila melewati batas.
+
+        Nilai yang lebih besar dari `max_bytes` tidak disimpan.
+
+        Args:
+        key (hashable): Kunci cache.
+        value (object): Nilai yang disimpan.
+        """
+        size = self.sizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic())
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _peek(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return _MISSING if entry is None or self._expired(entry[2]) else entry[0]
+
+    def get_or_create(self, key, factory):
+        """
+        Mengambil nilai dari cache, atau membuatnya dengan `factory` dan menyimpannya.
+
+        Miss serentak untuk kunci yang sama digabung: `factory` hanya dijalankan sekali dan
+        thread lain menerima hasil yang sama.
+
+        Args:
+        key (hashable): Kunci cache.
+        factory (callable): Fungsi tanpa argumen yang membuat nilai.
+
+        Returns:
+        object: Nilai dari cache atau nilai yang baru dibuat.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        def create():
+            # Thread yang baru selesai menyimpan nilai sebelum penerbangan ini dimulai.
+            value = self._peek(key)
+            if value is _MISSING:
+                value = factory()
+                self.put(key, value)
+            return value
+
+        return self._flights.do(key, create)
+
+    def clear(self):
+        """
+        Mengosongkan cache tanpa mengatur ulang statistik.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """
+        Mengambil statistik cache.
+
+        Returns:
+        dict: Jumlah entri, total byte, hit, miss, eviction, dan rasio hit.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+            }
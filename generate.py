@@ -0,0 +1,270 @@
+import argparse
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+
+import preprocessing
+
+# Ukuran dataset standar untuk benchmark: kira-kira 1x, 10x, dan 100x dataset asli.
+SCALES = {"270k": 270_000, "2.7m": 2_700_000, "27m": 27_000_000}
+
+# Baris per chunk yang ditulis ke CSV, agar memori tetap terbatas pada skala besar.
+CHUNK_ROWS = 250_000
+
+# Edisi Olimpiade asli: (tahun, musim, kota).
+EDITIONS = [
+    (1896, "Summer", "Athina"), (1900, "Summer", "Paris"), (1904, "Summer", "St. Louis"),
+    (1906, "Summer", "Athina"), (1908, "Summer", "London"), (1912, "Summer", "Stockholm"),
+    (1920, "Summer", "Antwerpen"), (1924, "Summer", "Paris"), (1928, "Summer", "Amsterdam"),
+    (1932, "Summer", "Los Angeles"), (1936, "Summer", "Berlin"), (1948, "Summer", "London"),
+    (1952, "Summer", "Helsinki"), (1956, "Summer", "Melbourne"), (1960, "Summer", "Roma"),
+    (1964, "Summer", "Tokyo"), (1968, "Summer", "Mexico City"), (1972, "Summer", "Munich"),
+    (1976, "Summer", "Montreal"), (1980, "Summer", "Moskva"), (1984, "Summer", "Los Angeles"),
+    (1988, "Summer", "Seoul"), (1992, "Summer", "Barcelona"), (1996, "Summer", "Atlanta"),
+    (2000, "Summer", "Sydney"), (2004, "Summer", "Athina"), (2008, "Summer", "Beijing"),
+    (2012, "Summer", "London"), (2016, "Summer", "Rio de Janeiro"),
+    (1924, "Winter", "Chamonix"), (1928, "Winter", "Sankt Moritz"), (1932, "Winter", "Lake Placid"),
+    (1936, "Winter", "Garmisch-Partenkirchen"), (1948, "Winter", "Sankt Moritz"), (1952, "Winter", "Oslo"),
+    (1956, "Winter", "Cortina d'Ampezzo"), (1960, "Winter", "Squaw Valley"), (1964, "Winter", "Innsbruck"),
+    (1968, "Winter", "Grenoble"), (1972, "Winter", "Sapporo"), (1976, "Winter", "Innsbruck"),
+    (1980, "Winter", "Lake Placid"), (1984, "Winter", "Sarajevo"), (1988, "Winter", "Calgary"),
+    (1992, "Winter", "Albertville"), (1994, "Winter", "Lillehammer"), (1998, "Winter", "Nagano"),
+    (2002, "Winter", "Salt Lake City"), (2006, "Winter", "Torino"), (2010, "Winter", "Vancouver"),
+    (2014, "Winter", "Sochi"),
+]
+
+# Cabang olahraga per musim beserta nomor pertandingannya (tanpa awalan jenis kelamin).
+SPORTS = {
+    "Summer": {
+        "Athletics": ["100 metres", "400 metres", "Marathon", "High Jump", "Long Jump", "Shot Put", "Javelin Throw"],
+        "Swimming": ["100 metres Freestyle", "200 metres Butterfly", "400 metres Individual Medley", "4 x 100 metres Freestyle Relay"],
+        "Gymnastics": ["Individual All-Around", "Floor Exercise", "Team All-Around"],
+        "Rowing": ["Single Sculls", "Coxed Eights", "Double Sculls"],
+        "Cycling": ["Road Race, Individual", "Sprint", "Team Pursuit, 4,000 metres"],
+        "Fencing": ["Foil, Individual", "Sabre, Team", "Epee, Individual"],
+        "Wrestling": ["Lightweight, Freestyle", "Heavyweight, Greco-Roman"],
+        "Boxing": ["Lightweight", "Heavyweight", "Flyweight"],
+        "Shooting": ["Air Rifle, 10 metres", "Trap"],
+        "Canoeing": ["Kayak Singles, 500 metres", "Canadian Doubles, 1,000 metres"],
+        "Sailing": ["One Person Dinghy", "Two Person Keelboat"],
+        "Football": ["Football"],
+        "Hockey": ["Hockey"],
+        "Basketball": ["Basketball"],
+        "Weightlifting": ["Lightweight", "Heavyweight"],
+        "Equestrianism": ["Dressage, Individual", "Jumping, Team"],
+        "Judo": ["Lightweight", "Heavyweight"],
+        "Volleyball": ["Volleyball"],
+        "Handball": ["Handball"],
+        "Diving": ["Springboard", "Platform"],
+        "Water Polo": ["Water Polo"],
+        "Tennis": ["Singles", "Doubles"],
+        "Archery": ["Individual", "Team"],
+    },
+    "Winter": {
+        "Cross Country Skiing": ["10 kilometres", "4 x 10 kilometres Relay"],
+        "Alpine Skiing": ["Downhill", "Slalom", "Giant Slalom"],
+        "Speed Skating": ["500 metres", "1,500 metres", "10,000 metres"],
+        "Ice Hockey": ["Ice Hockey"],
+        "Biathlon": ["20 kilometres", "Sprint"],
+        "Bobsleigh": ["Two", "Four"],
+        "Figure Skating": ["Singles", "Pairs"],
+        "Ski Jumping": ["Normal Hill, Individual", "Large Hill, Team"],
+        "Luge": ["Singles"],
+        "Snowboarding": ["Halfpipe", "Parallel Giant Slalom"],
+    },
+}
+
+# Urutan kolom athlete_events.csv, sama seperti dataset asli.
+COLUMNS = ["ID", "Name", "Sex", "Age", "Height", "Weight", "Team", "NOC", "Games",
+           "Year", "Season", "City", "Sport", "Event", "Medal"]
+
+
+def _athletes(count, rng, nocs):
+    """
+    Membuat atribut tetap per atlet: jenis kelamin, negara, musim, cabang, karier, dan fisik.
+
+    Args:
+    count (int): Jumlah atlet.
+    rng (Generator): Generator bilangan acak.
+    nocs (int): Jumlah kode NOC.
+
+    Returns:
+    dict: Array atribut per atlet, termasuk "offsets" (baris pertama tiap atlet, dengan
+        total baris di akhir).
+    """
+    female = rng.random(count) < 0.27
+    winter = rng.random(count) < 0.18
+    # Sebaran negara miring seperti aslinya: sedikit negara mengirim banyak atlet.
+    noc_weights = 1 / np.arange(1, nocs + 1) ** 0.9
+    noc = rng.permutation(nocs)[rng.choice(nocs, size=count, p=noc_weights / noc_weights.sum())]
+
+    sport = np.where(
+        winter,
+        rng.integers(0, len(SPORTS["Winter"]), count),
+        rng.integers(0, len(SPORTS["Summer"]), count),
+    )
+    # Setiap atlet ikut beberapa edisi berurutan pada musimnya, rata-rata dua.
+    appearances = 1 + np.minimum(rng.poisson(1.0, count), 5)
+    # Edisi pertama condong ke tahun-tahun terakhir, seperti pertumbuhan jumlah peserta aslinya.
+    first = np.empty(count, dtype=np.int64)
+    for season, mask in (("Summer", ~winter), ("Winter", winter)):
+        years = np.array([year for year, edition_season, _ in EDITIONS if edition_season == season])
+        weights = (years - 1880.0) ** 2
+        first[mask] = rng.choice(len(years), size=mask.sum(), p=weights / weights.sum())
+        # Karier digeser ke belakang bila melewati edisi terakhir.
+        first[mask] = np.minimum(first[mask], len(years) - appearances[mask])
+
+    height = np.where(female, rng.normal(168, 8, count), rng.normal(179, 9, count)).round()
+    weight = (height / 100) ** 2 * rng.normal(22.5, 2.5, count)
+    # Tipe kecil agar tabel atlet untuk skala 27 juta baris tetap muat di memori.
+    return {
+        "female": female,
+        "winter": winter,
+        "noc": noc.astype(np.int16),
+        "sport": sport.astype(np.int8),
+        "first": first.astype(np.int8),
+        "age": rng.integers(16, 31, count, dtype=np.int8),
+        "height": height.astype(np.float32),
+        "weight": weight.round().astype(np.float32),
+        "offsets": np.concatenate([[0], np.cumsum(appearances)]),
+    }
+
+
+def _chunk(athletes, start, rows, seed, noc_table):
+    """
+    Membuat satu chunk baris athlete_events secara deterministik.
+
+    Args:
+    athletes (dict): Atribut per atlet dari `_athletes`.
+    start (int): Indeks baris pertama chunk, juga dipakai sebagai seed chunk.
+    rows (int): Jumlah baris chunk.
+    seed (int): Seed dataset.
+    noc_table (DataFrame): Tabel NOC asli dengan kolom NOC dan region.
+
+    Returns:
+    DataFrame: Baris athlete_events dengan kolom `COLUMNS`.
+    """
+    rng = np.random.default_rng([seed, start])
+    # Baris diurutkan per atlet seperti dataset asli; baris ke-j seorang atlet ada di edisi ke-j kariernya.
+    row = np.arange(start, start + rows)
+    athlete = np.searchsorted(athletes["offsets"], row, side="right") - 1
+    step = row - athletes["offsets"][athlete]
+    female = athletes["female"][athlete]
+    winter = athletes["winter"][athlete]
+    season = np.where(winter, "Winter", "Summer")
+
+    year = np.empty(rows, dtype=np.int64)
+    first_year = np.empty(rows, dtype=np.int64)
+    city = np.empty(rows, dtype=object)
+    sport = np.empty(rows, dtype=object)
+    for season_name, sports in SPORTS.items():
+        mask = season == season_name
+        editions = [edition for edition in EDITIONS if edition[1] == season_name]
+        years = np.array([edition[0] for edition in editions])
+        first = athletes["first"][athlete[mask]]
+        index = first + step[mask]
+        year[mask] = years[index]
+        first_year[mask] = years[first]
+        city[mask] = np.array([edition[2] for edition in editions], dtype=object)[index]
+        sport[mask] = np.array(list(sports), dtype=object)[athletes["sport"][athlete[mask]]]
+
+    event_pick = rng.random(rows)
+    event = np.empty(rows, dtype=object)
+    for season_name, sports in SPORTS.items():
+        for name, events in sports.items():
+            mask = (sport == name) & (season == season_name)
+            chosen = np.array(events, dtype=object)[(event_pick[mask] * len(events)).astype(int)]
+            prefix = np.where(female[mask], f"{name} Women's ", f"{name} Men's ")
+            event[mask] = prefix + chosen
+
+    age = (athletes["age"][athlete] + year - first_year).astype(float)
+    height = athletes["height"][athlete].astype(float)
+    weight = athletes["weight"][athlete].astype(float)
+    # Data fisik sering kosong, terutama pada edisi lama.
+    missing = rng.random(rows) < np.clip((2000 - year) / 120, 0.05, 0.9)
+    height[missing] = np.nan
+    weight[missing | (rng.random(rows) < 0.02)] = np.nan
+    age[rng.random(rows) < 0.03] = np.nan
+
+    medal = np.array([None, "Gold", "Silver", "Bronze"], dtype=object)[
+        rng.choice(4, size=rows, p=[0.853, 0.049, 0.049, 0.049])
+    ]
+    noc = noc_table["NOC"].to_numpy()[athletes["noc"][athlete]]
+    team = noc_table["region"].fillna(noc_table["NOC"]).to_numpy()[athletes["noc"][athlete]]
+
+    return pd.DataFrame({
+        "ID": athlete + 1,
+        "Name": pd.Series(athlete + 1).map("Athlete {}".format),
+        "Sex": np.where(female, "F", "M"),
+        "Age": age,
+        "Height": height,
+        "Weight": weight,
+        "Team": team,
+        "NOC": noc,
+        "Games": pd.Series(year).astype(str) + " " + season,
+        "Year": year,
+        "Season": season,
+        "City": city,
+        "Sport": sport,
+        "Event": event,
+        "Medal": medal,
+    }, columns=COLUMNS)
+
+
+def generate(rows, out_dir, seed=0):
+    """
+    Menulis athlete_events.csv sintetis dan noc_regions.csv asli ke `out_dir`.
+
+    Hasilnya deterministik untuk kombinasi (rows, seed) yang sama, dan memakai kode NOC
+    asli dari noc_regions.csv, sehingga bisa dibaca oleh `preprocessing.dataset()`.
+
+    Args:
+    rows (int): Jumlah baris.
+    out_dir (str): Direktori tujuan. Pakai sebagai OLYMPICS_DATA_DIR.
+    seed (int): Seed generator.
+
+    Returns:
+    str: Path athlete_events.csv yang ditulis.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    noc_path = os.path.join(out_dir, "noc_regions.csv")
+    if os.path.abspath(noc_path) != os.path.abspath(preprocessing.NOC_PATH):
+        shutil.copyfile(preprocessing.NOC_PATH, noc_path)
+    noc_table = pd.read_csv(preprocessing.NOC_PATH)
+
+    # Rata-rata hampir dua baris per atlet; 5% atlet cadangan menjamin jumlah baris cukup.
+    athletes = _athletes(rows // 2 + rows // 20 + 1000, np.random.default_rng(seed), len(noc_table))
+    path = os.path.join(out_dir, "athlete_events.csv")
+    with open(path + ".tmp", "w", newline="") as f:
+        for start in range(0, rows, CHUNK_ROWS):
+            chunk = _chunk(athletes, start, min(CHUNK_ROWS, rows - start), seed, noc_table)
+            chunk.to_csv(f, header=start == 0, index=False)
+    os.replace(path + ".tmp", path)
+    return path
+
+
+def main(argv=None):
+    """
+    Entry point command line untuk generator dataset sintetis.
+
+    Args:
+    argv (list): Argumen command line. Defaultnya sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Generator athlete_events.csv sintetis untuk benchmark.")
+    parser.add_argument("scale", help=f"Jumlah baris, atau salah satu dari: {', '.join(SCALES)}.")
+    parser.add_argument("--out", help="Direktori tujuan. Defaultnya data/synthetic/<scale>.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rows = SCALES[args.scale.lower()] if args.scale.lower() in SCALES else int(args.scale)
+    out_dir = args.out or os.path.join("data", "synthetic", args.scale.lower())
+    start = time.perf_counter()
+    path = generate(rows, out_dir, seed=args.seed)
+    print(f"{path}: {rows} rows ({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,55 +1,204 @@
 import preprocessing  # Import modul preprocessing untuk memproses data Olimpiade
-import plotly.express as px  # Import Plotly Express untuk membuat plot interaktif
-import seaborn as sns  # Import Seaborn untuk membuat plot statistik
 import numpy as np  # Import NumPy untuk manipulasi data numerik
 import plotly.graph_objects as go  # Import Plotly Graph Objects untuk membuat plot kustom
+import plotly.io as pio  # Import Plotly IO untuk serialisasi figure
+# plotly.express diimpor di dalam fungsi yang memakainya: impornya mahal dan tidak dibutuhkan saat startup.
+import functools  # Import functools untuk dekorator cache
+import inspect  # Import inspect untuk menormalkan argumen kunci cache
+import os  # Import os untuk membaca konfigurasi cache dari environment
+import json  # Import json untuk membaca dan menulis figure pra-render
+import base64  # Import base64 untuk membaca array bertipe di JSON Plotly
+import cache  # Import modul cache untuk cache LRU bersama
+
+# Cache figure bersama untuk semua sesi dalam satu proses server.
+# Ukuran entri dihitung dari panjang JSON figure, sama seperti yang dikirim ke browser.
+FIGURE_CACHE = cache.LRUCache(
+    max_entries=int(os.environ.get("OLYMPICS_FIGURE_CACHE_ENTRIES", 128)),
+    max_bytes=int(os.environ.get("OLYMPICS_FIGURE_CACHE_MB", 256)) * 2 ** 20,
+    ttl=float(os.environ.get("OLYMPICS_FIGURE_CACHE_TTL", 3600)),
+    sizeof=lambda fig: len(pio.to_json(fig, validate=False)),
+)
+
+# Figure tanpa parameter yang dirender saat build ke FIGURES_DIR, dicap dengan sidik jari dataset.
+FIGURES_DIR = os.path.join(preprocessing.DATA_DIR, "figures")
+PRERENDERED = ["plot_participant", "plot_city", "plot_season", "plot_sport", "vil_games_participant", "top_medal_vil", "sex_vil"]
+
+def _prerendered_path(name):
+    return os.path.join(FIGURES_DIR, f"{name}.json")
+
+def _typed_arrays(value):
+    """
+    Mengubah array bertipe JSON Plotly ({"dtype", "bdata"}) kembali menjadi array numpy,
+    sehingga figure yang dimuat sama dengan figure yang dirender langsung.
+    """
+    if isinstance(value, dict):
+        if "bdata" in value and "dtype" in value:
+            array = np.frombuffer(base64.b64decode(value["bdata"]), dtype=value["dtype"])
+            if "shape" in value:
+                shape = value["shape"]
+                array = array.reshape([int(n) for n in shape.split(",")] if isinstance(shape, str) else shape)
+            return array
+        return {key: _typed_arrays(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_typed_arrays(item) for item in value]
+    return value
+
+def read_prerendered(name, digest):
+    """
+    Membaca figure pra-render bila ada dan dibuat dari dataset dengan sidik jari `digest`.
+
+    Args:
+        name (str): Nama fungsi figure.
+        digest (str): Sidik jari dataset saat ini.
+
+    Returns:
+        plotly.graph_objects.Figure: Figure pra-render, atau None bila tidak ada atau basi.
+    """
+    try:
+        with open(_prerendered_path(name)) as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if payload.get("fingerprint") != digest:
+        return None
+    return go.Figure(_typed_arrays(payload["figure"]))
+
+def write_prerendered(name, digest, fig):
+    """
+    Menulis figure pra-render sebagai JSON Plotly, dicap dengan sidik jari dataset.
+
+    Args:
+        name (str): Nama fungsi figure.
+        digest (str): Sidik jari dataset yang dipakai untuk merender figure.
+        fig (plotly.graph_objects.Figure): Figure yang ditulis.
+    """
+    os.makedirs(FIGURES_DIR, exist_ok=True)
+    path = _prerendered_path(name)
+    with open(path + ".tmp", "w") as f:
+        f.write('{"fingerprint": %s, "figure": %s}' % (json.dumps(digest), pio.to_json(fig, validate=False)))
+    os.replace(path + ".tmp", path)
+
+def cached_figure(function):
+    """
+    Dekorator yang menyimpan figure di `FIGURE_CACHE` berdasarkan nama fungsi, argumen, dan sidik jari dataset.
+
+    Figure yang dikembalikan dibagikan antar sesi, jadi jangan diubah di tempat.
+    `st.plotly_chart` hanya membaca figure (lewat `to_dict`), jadi aman dipakai langsung.
+
+    Args:
+        function (callable): Fungsi yang mengembalikan plotly Figure.
+
+    Returns:
+        callable: Fungsi yang sama dengan cache.
+    """
+    signature = inspect.signature(function)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        digest = preprocessing.fingerprint()
+        key = (function.__name__, tuple(bound.arguments.items()), digest)
+        if function.__name__ in PRERENDERED:
+            return FIGURE_CACHE.get_or_create(key, lambda: _load_or_render(function, digest))
+        return FIGURE_CACHE.get_or_create(key, lambda: function(*args, **kwargs))
+
+    return wrapper
+
+def _load_or_render(function, digest):
+    """
+    Memuat figure pra-render, atau merendernya dan menulis ulang filenya bila basi.
+
+    Args:
+        function (callable): Fungsi figure tanpa parameter.
+        digest (str): Sidik jari dataset saat ini.
+
+    Returns:
+        plotly.graph_objects.Figure: Figure untuk dataset saat ini.
+    """
+    fig = read_prerendered(function.__name__, digest)
+    if fig is None:
+        fig = function()
+        try:
+            write_prerendered(function.__name__, digest, fig)
+        except OSError:
+            pass  # Direktori data read-only: figure tetap dipakai dari cache memori.
+    return fig
+
+def build_figures():
+    """
+    Merender semua figure tanpa parameter ke FIGURES_DIR untuk dataset saat ini.
+
+    Returns:
+        list: Path file yang ditulis.
+    """
+    digest = preprocessing.fingerprint()
+    paths = []
+    for name in PRERENDERED:
+        # Panggil fungsi aslinya agar figure benar-benar dirender ulang, bukan dibaca dari file lama.
+        write_prerendered(name, digest, globals()[name].__wrapped__())
+        paths.append(_prerendered_path(name))
+    return paths
+
+def load_prerendered():
+    """
+    Memuat figure pra-render yang filenya sesuai dengan dataset saat ini ke FIGURE_CACHE, tanpa merender.
+    Dipanggil sekali per proses saat aplikasi mulai.
+
+    Figure yang filenya tidak ada atau basi dilewati; figure itu dirender oleh `build.py figures`,
+    oleh pemanasan (lihat prewarm.py), atau saat pertama kali ditampilkan.
+
+    Returns:
+        list: Nama figure yang tidak dimuat.
+    """
+    digest = preprocessing.fingerprint()
+    missing = []
+    for name in PRERENDERED:
+        fig = read_prerendered(name, digest)
+        if fig is None:
+            missing.append(name)
+        else:
+            # Kunci yang sama dengan `cached_figure` untuk fungsi tanpa parameter.
+            FIGURE_CACHE.put((name, (), digest), fig)
+    return missing
 
 def region_options():
     """
-    Mendapatkan daftar pilihan wilayah dari data yang sudah diproses.
+    Mendapatkan daftar pilihan wilayah dari katalog dimensi dataset.
     
     Returns:
         list: Daftar pilihan wilayah.
     """
-    data = preprocessing.clear_data()  # Mendapatkan data yang sudah diproses
-    region_list = data["region"].unique().tolist()  # Mendapatkan daftar unik wilayah
-    region_list.append("All")  # Menambahkan opsi "All" untuk semua wilayah
-    return region_list
+    return preprocessing.catalog()["regions"] + ["All"]  # Menambahkan opsi "All" untuk semua wilayah
 
 def sport_options():
     """
-    Mendapatkan daftar pilihan olahraga dari data yang sudah diproses.
+    Mendapatkan daftar pilihan olahraga dari katalog dimensi dataset.
     
     Returns:
         list: Daftar pilihan olahraga.
     """
-    data = preprocessing.clear_data()  # Mendapatkan data yang sudah diproses
-    sport_list = data["Sport"].unique().tolist()  # Mendapatkan daftar unik olahraga
-    sport_list.append("All")  # Menambahkan opsi "All" untuk semua olahraga
-    return sport_list
+    return preprocessing.catalog()["sports"] + ["All"]  # Menambahkan opsi "All" untuk semua olahraga
 
 def sport_options_nall():
     """
-    Mendapatkan daftar pilihan olahraga dari data yang sudah diproses.
+    Mendapatkan daftar pilihan olahraga dari katalog dimensi dataset.
     
     Returns:
         list: Daftar pilihan olahraga.tanpa All options
     """
-    data = preprocessing.clear_data()  # Mendapatkan data yang sudah diproses
-    sport_list = data["Sport"].unique().tolist()  # Mendapatkan daftar unik olahraga
-    return sport_list
+    return list(preprocessing.catalog()["sports"])  # Salinan, agar katalog bersama tidak ikut berubah
 
 def year_scale():
     """
-    Menetapkan skala tahun dari data yang sudah diproses.
+    Menetapkan skala tahun dari katalog dimensi dataset.
     
     Returns:
         list: Daftar dengan tahun minimum dan maksimum.
     """
-    data = preprocessing.clear_data()  # Mendapatkan data yang sudah diproses
-    list_min_max_year = [min(data["Year"]), max(data["Year"])]  # Mendapatkan tahun minimum dan maksimum
-    return list_min_max_year
+    return list(preprocessing.catalog()["years"])
 
+@cached_figure
 def plot_medal(country, fromm, to):
     """
     Menampilkan plot medali untuk wilayah, rentang tahun tertentu.
@@ -62,9 +211,7 @@ def plot_medal(country, fromm, to):
     Returns:
         go.Figure: Plot medali menggunakan Plotly Graph Objects.
     """
-    data = preprocessing.plot_data()  # Mendapatkan data medali yang sudah diproses
-    data_subset = data[data["region"] == country]  # Mendapatkan subset data berdasarkan wilayah
-    data_subset_year = data_subset[np.logical_and(data_subset["Year"] <= to, data_subset["Year"] >= fromm)]  # Mendapatkan subset data berdasarkan rentang tahun
+    data_subset_year = preprocessing.medal_time_series(country, fromm, to)  # Mendapatkan data medali wilayah dalam rentang tahun
     data_subset_year.columns = ["Year", "region", "gold", "silver", "bronze", "total"]  # Menyusun ulang nama kolom
     
     # Membuat plot menggunakan Plotly Graph Objects
@@ -89,9 +236,9 @@ def num_analysis():
         list: Daftar yang berisi jumlah olahraga unik, jumlah atlet unik, jumlah acara unik, jumlah wilayah unik,
               jumlah tim unik, dan jumlah permainan unik.
     """
-    data = preprocessing.clear_data()  # Mengambil data yang sudah diproses
+    data = preprocessing.clear_data(["Sport", "Event", "NOC", "Team", "Games"])  # Mengambil data yang sudah diproses
     num_sport = data["Sport"].nunique()  # Jumlah olahraga unik
-    num_athlete = data["Name"].nunique()  # Jumlah atlet unik
+    num_athlete = preprocessing.total_athlete_count(None, None, "All", "All")  # Jumlah atlet unik (kunci ID)
     num_event = data["Event"].nunique()  # Jumlah acara unik
     num_region = data["NOC"].nunique()  # Jumlah wilayah unik (National Olympic Committee)
     num_team = data["Team"].nunique()  # Jumlah tim unik
@@ -99,6 +246,7 @@ def num_analysis():
     return [num_sport, num_athlete, num_event, num_region, num_team, num_games]
 
 
+@cached_figure
 def plot_participant():
     """
     Membuat plot interaktif menggunakan Plotly Express yang menampilkan jumlah peserta per tahun dalam Olimpiade.
@@ -107,10 +255,12 @@ def plot_participant():
         plotly.graph_objects.Figure: Plot interaktif jumlah peserta per tahun.
     """
     data = preprocessing.participant_data()  # Mengambil data jumlah peserta per tahun
+    import plotly.express as px
     fig = px.line(data, x="Year", y="number country", width=1400, height=800)  # Membuat plot menggunakan Plotly Express
     return fig
 
 
+@cached_figure
 def plot_city():
     """
     Membuat plot batang menggunakan Plotly Express yang menampilkan jumlah kota tuan rumah Olimpiade.
@@ -119,9 +269,11 @@ def plot_city():
         plotly.graph_objects.Figure: Plot batang jumlah kota tuan rumah.
     """
     data = preprocessing.city_data()  # Mengambil data jumlah kota tuan rumah
+    import plotly.express as px
     fig = px.bar(data, x='city', y='num', title='City count', width=1400, height=800)  # Membuat plot menggunakan Plotly Express
     return fig
 
+@cached_figure
 def plot_season():
     """
     Membuat plot bar yang menampilkan jumlah acara Olimpiade yang diadakan setiap musim.
@@ -131,11 +283,13 @@ def plot_season():
     """
     data = preprocessing.season_data()
 
+    import plotly.express as px
     fig = px.bar(data, x='season', y='num', title='Season count', width=1400, height=800)
 
     return fig
 
 
+@cached_figure
 def plot_sport():
     """
     Membuat plot interaktif menggunakan Plotly Express yang menampilkan jumlah olahraga dalam Olimpiade per tahun.
@@ -144,6 +298,7 @@ def plot_sport():
         plotly.graph_objects.Figure: Plot interaktif jumlah olahraga per tahun.
     """
     data = preprocessing.sport_data_count()[0]  # Mengambil data jumlah olahraga per tahun
+    import plotly.express as px
     fig = px.line(data, x='Year', y='Sport', title='Sport count', width=1400, height=800)  # Membuat plot menggunakan Plotly Express
     return fig
 
@@ -162,10 +317,11 @@ def total_vil(fromm, too, country, sport):
         list: Daftar yang berisi total jumlah atlet dan data atlet yang berpartisipasi.
     """
     data = preprocessing.total_athlete(fromm, too, country, sport)  # Mendapatkan data atlet berpartisipasi
-    total = data["Name"].nunique()  # Menghitung total jumlah atlet unik
+    total = preprocessing.total_athlete_count(fromm, too, country, sport)  # Menghitung total jumlah atlet unik
     return [total, data]  # Mengembalikan total dan data atlet
 
 
+@cached_figure
 def sport_vil(fromm, too, country, sport):
     """
     Menghasilkan plot bar interaktif yang menampilkan jumlah atlet yang berpartisipasi dalam suatu olahraga tertentu
@@ -181,13 +337,15 @@ def sport_vil(fromm, too, country, sport):
         plotly.graph_objects.Figure: Plot bar interaktif jumlah atlet per olahraga.
     """
     data = preprocessing.total_athlete(fromm, too, country, sport)  # Mendapatkan data atlet berpartisipasi
-    sportt = data["Sport"].value_counts().to_frame()  # Menghitung jumlah atlet per olahraga
+    sportt = data["Sport"].value_counts().loc[lambda counts: counts > 0].to_frame()  # Menghitung jumlah atlet per olahraga (tanpa kategori kosong)
     sport_final = sportt.reset_index()  # Mengatur ulang indeks
     sport_final.columns = ['sport', 'num']  # Menyusun ulang nama kolom
+    import plotly.express as px
     fig = px.bar(sport_final, x='sport', y='num', title='Sport count', width=1400, height=800)  # Membuat plot menggunakan Plotly Express
     return fig
 
 
+@cached_figure
 def top_medal_vil():
     """
     Menghasilkan plot bar bertumpuk yang menampilkan jumlah total medali yang diterima oleh atlet-atlet teratas
@@ -205,6 +363,7 @@ def top_medal_vil():
     # Mengatur layout untuk plot bar bertumpuk
     fig.update_layout(barmode='stack', title='"The Number of Medals Received by Athletes"', xaxis=dict(title='Atlet name'), yaxis=dict(title='Total Medals'), width=1400, height=800)
     return fig
+@cached_figure
 def top30_medal_vil(sport, too):
     """
     Menghasilkan plot bar bertumpuk yang menampilkan jumlah total medali yang diterima oleh 30 atlet teratas dalam suatu olahraga
@@ -229,6 +388,7 @@ def top30_medal_vil(sport, too):
     return fig
 
 
+@cached_figure
 def sex_vil():
     """
     Menghasilkan plot garis yang menampilkan komposisi gender peserta Olimpiade dari waktu ke waktu.
@@ -250,6 +410,7 @@ def sex_vil():
     return fig
 
 
+@cached_figure
 def sex_vil_sport(sport):
     """
     Menghasilkan plot bar grup yang menampilkan komposisi gender peserta Olimpiade dalam suatu olahraga tertentu dari waktu ke waktu.
@@ -270,36 +431,61 @@ def sex_vil_sport(sport):
     fig.update_layout(barmode='group', title=sport, xaxis=dict(title='Year'), yaxis=dict(title='Number of Participants'), width=1400, height=800)
     # Menampilkan plot
     return fig
-def plot_height_weight(sport, region):
+# Jumlah titik maksimum yang dikirim sebagai scatter; di atasnya dipakai peta kepadatan.
+SCATTER_POINT_BUDGET = int(os.environ.get("OLYMPICS_SCATTER_POINTS", 5000))
+DENSITY_BINS = 60
+
+@cached_figure
+def plot_height_weight(sport, region, max_points=SCATTER_POINT_BUDGET):
     """
-    Menghasilkan scatter plot yang menampilkan hubungan antara tinggi dan berat badan peserta Olimpiade dalam suatu olahraga dan wilayah tertentu.
-    
+    Menghasilkan plot yang menampilkan hubungan antara tinggi dan berat badan peserta Olimpiade dalam suatu olahraga dan wilayah tertentu.
+
+    Setiap atlet hanya digambar sekali. Bila jumlah atlet tidak melebihi `max_points`,
+    digunakan scatter WebGL; di atasnya, tinggi dan berat dikelompokkan ke grid 2D per
+    jenis kelamin dan digambar sebagai kontur, sehingga ukuran figure tetap terbatas.
+
     Args:
         sport (str): Olahraga yang akan dianalisis.
         region (str): Wilayah yang akan dianalisis.
-    
+        max_points (int): Jumlah titik maksimum untuk mode scatter.
+
     Returns:
-        plotly.graph_objects.Figure: Scatter plot hubungan tinggi dan berat badan peserta Olimpiade.
+        plotly.graph_objects.Figure: Plot hubungan tinggi dan berat badan peserta Olimpiade.
     """
-    data = preprocessing.data_height_vs_weight(sport=sport, region=region)  # Mendapatkan data tinggi dan berat badan
+    data = preprocessing.athlete_measurements(sport=sport, region=region)  # Mendapatkan tinggi dan berat badan per atlet
     fig = go.Figure()  # Membuat objek plot baru
-    # Menambahkan scatter plot untuk peserta laki-laki
-    fig.add_trace(go.Scatter(
-        x=data[data['Sex'] == 'M']['Height'],
-        y=data[data['Sex'] == 'M']['Weight'],
-        mode='markers',
-        name='Male',
-        marker=dict(color='blue', symbol='circle', size=10)
-    ))
-    # Menambahkan scatter plot untuk peserta perempuan
-    fig.add_trace(go.Scatter(
-        x=data[data['Sex'] == 'F']['Height'],
-        y=data[data['Sex'] == 'F']['Weight'],
-        mode='markers',
-        name='Female',
-        marker=dict(color='red', symbol='circle', size=10)
-    ))
-    # Mengatur layout untuk scatter plot
+    sexes = [('M', 'Male', 'blue'), ('F', 'Female', 'red')]
+
+    if len(data) <= max_points:
+        # Menambahkan scatter plot WebGL untuk peserta laki-laki dan perempuan
+        for sex, name, color in sexes:
+            subset = data[data['Sex'] == sex]
+            fig.add_trace(go.Scattergl(
+                x=subset['Height'],
+                y=subset['Weight'],
+                mode='markers',
+                name=name,
+                marker=dict(color=color, symbol='circle', size=10)
+            ))
+    else:
+        # Grid yang sama untuk kedua jenis kelamin agar konturnya bisa dibandingkan
+        x_edges = np.linspace(data['Height'].min(), data['Height'].max(), DENSITY_BINS + 1)
+        y_edges = np.linspace(data['Weight'].min(), data['Weight'].max(), DENSITY_BINS + 1)
+        for sex, name, color in sexes:
+            subset = data[data['Sex'] == sex]
+            counts, _, _ = np.histogram2d(subset['Height'], subset['Weight'], bins=[x_edges, y_edges])
+            fig.add_trace(go.Contour(
+                x=(x_edges[:-1] + x_edges[1:]) / 2,
+                y=(y_edges[:-1] + y_edges[1:]) / 2,
+                z=counts.T,  # histogram2d mengembalikan [x, y]; Plotly mengharapkan [y, x]
+                name=name,
+                showlegend=True,
+                showscale=False,
+                contours=dict(coloring='lines'),
+                line=dict(color=color, width=2),
+                hovertemplate='Height=%{x:.0f}<br>Weight=%{y:.0f}<br>Athletes=%{z:.0f}<extra>' + name + '</extra>'
+            ))
+    # Mengatur layout untuk plot
     fig.update_layout(
         title='Height and Weight of Participants',
         xaxis=dict(title='Height'),
@@ -310,11 +496,13 @@ def plot_height_weight(sport, region):
     # Mengembalikan objek plot
     return fig
 
+@cached_figure
 def vil_games_participant():
 
     data = preprocessing.data_games_count()
 
 
+    import plotly.express as px
     fig = px.line(data, x='Games', y='Participant Count', title='Participant / Athlete Count', 
                 width=1400, height=800, markers=True)
 
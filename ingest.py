@@ -0,0 +1,649 @@
+import argparse
+import os
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+
+import cache
+import preprocessing
+
+# Tipe kolom saat membaca per potongan. Kolom teks dibaca sebagai string biasa, bukan
+# kategori, agar hash baris yang sama selalu identik di potongan mana pun.
+CHUNK_DTYPES = {
+    column: (str if isinstance(dtype, pd.CategoricalDtype) or dtype == "category" else dtype)
+    for column, dtype in preprocessing.ATHLETE_DTYPES.items()
+}
+
+# Kunci deduplikasi medali, sama seperti `preprocessing.medal_data`: atlet (ID) dan acaranya.
+MEDAL_KEY = ["ID", "Year", "Sport", "Event", "NOC", "Season"]
+
+MEDAL_COLUMNS = ["gold", "silver", "bronze", "rows"]
+
+# State agregat yang disimpan, dicap dengan (mtime, ukuran) file sumber. Himpunan hash untuk
+# deduplikasi (16 byte per baris unik) disimpan terpisah di DEDUP_PATH: hanya `append` yang
+# membutuhkannya, sedangkan proses server cukup membaca agregat kecil di STATE_PATH.
+STATE_PATH = os.path.join(preprocessing.DATA_DIR, "aggregates.pkl")
+DEDUP_PATH = os.path.join(preprocessing.DATA_DIR, "aggregates_dedup.pkl")
+STATE_VERSION = 3
+
+# Kunci state yang disimpan di DEDUP_PATH, bukan di STATE_PATH.
+DEDUP_KEYS = ["rows", "medal_keys"]
+
+# State yang sudah dimuat di proses ini: {"mtime": mtime_ns file state, "payload": isi file}.
+_LOADED = {"mtime": None, "payload": None}
+
+# Pembacaan file state serentak digabung per mtime, jadi file hanya dibaca sekali.
+_FLIGHTS = cache.SingleFlight()
+
+
+class HashSet:
+    """
+    Himpunan hash uint64 yang ringkas (8 byte per anggota).
+
+    Anggota disimpan sebagai beberapa array terurut yang digabung seperti LSM tree,
+    jadi penambahan dan pencarian sama-sama O(log n) per elemen.
+    """
+
+    def __init__(self, values=None):
+        self.runs = [] if values is None or len(values) == 0 else [np.sort(np.asarray(values, dtype=np.uint64))]
+
+    def __len__(self):
+        return sum(len(run) for run in self.runs)
+
+    def values(self):
+        """
+        Mengambil semua anggota sebagai satu array terurut.
+
+        Returns:
+        ndarray: Anggota himpunan.
+        """
+        if not self.runs:
+            return np.empty(0, dtype=np.uint64)
+        return np.sort(np.concatenate(self.runs))
+
+    def contains(self, hashes):
+        """
+        Memeriksa keanggotaan setiap hash.
+
+        Args:
+        hashes (ndarray): Hash uint64 yang diperiksa.
+
+        Returns:
+        ndarray: Mask boolean, True bila hash sudah ada di himpunan.
+        """
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            position = np.minimum(np.searchsorted(run, hashes), len(run) - 1)
+            found |= run[position] == hashes
+        return found
+
+    def add_new(self, hashes):
+        """
+        Menambahkan hash dan menandai mana yang baru pertama kali terlihat.
+
+        Args:
+        hashes (ndarray): Hash uint64 sesuai urutan baris.
+
+        Returns:
+        ndarray: Mask boolean, True untuk kemunculan pertama setiap hash yang belum ada di himpunan.
+        """
+        _, first_index = np.unique(hashes, return_index=True)
+        new = np.zeros(len(hashes), dtype=bool)
+        new[first_index] = True
+        new &= ~self.contains(hashes)
+
+        if new.any():
+            self.runs.append(np.sort(hashes[new]))
+            while len(self.runs) > 1 and len(self.runs[-2]) <= 2 * len(self.runs[-1]):
+                last = self.runs.pop()
+                self.runs[-1] = np.sort(np.concatenate([self.runs[-1], last]))
+        return new
+
+
+def _row_hashes(frame):
+    """
+    Menghitung hash 64-bit per baris dari semua kolom.
+
+    Args:
+    frame (DataFrame): Potongan data.
+
+    Returns:
+    ndarray: Hash uint64 per baris.
+    """
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+def new_state():
+    """
+    Membuat state agregat kosong.
+
+    Returns:
+    dict: State yang diisi oleh `fold`.
+    """
+    return {
+        "rows": HashSet(),
+        "medal_keys": HashSet(),
+        "medals": pd.DataFrame(columns=MEDAL_COLUMNS, index=pd.MultiIndex.from_tuples([], names=["region", "Year", "Season"]), dtype=np.int64),
+        "year_regions": {},
+        "year_sports": {},
+        "year_cities": {},
+        "year_seasons": {},
+        "sex": pd.DataFrame(columns=["Male", "Female"], index=pd.Index([], name="Year"), dtype=np.int64),
+        "games": pd.Series(dtype=np.int64, index=pd.Index([], name="Games")),
+        "row_count": 0,
+    }
+
+
+def _add_counts(total, part):
+    """
+    Menjumlahkan dua tabel hitungan dengan indeks yang bisa berbeda.
+
+    Args:
+    total (DataFrame): Hitungan sejauh ini.
+    part (DataFrame): Hitungan dari potongan baru.
+
+    Returns:
+    DataFrame: Jumlah keduanya, bertipe int64 dan terurut berdasarkan indeks.
+    """
+    return total.add(part, fill_value=0).astype(np.int64).sort_index()
+
+
+def _remember(seen, chunk, column):
+    """
+    Mencatat pasangan (tahun, nilai) baru beserta urutan kemunculan pertamanya.
+
+    Args:
+    seen (dict): Pasangan (tahun, nilai) -> nomor urut kemunculan pertama.
+    chunk (DataFrame): Potongan data yang sudah dideduplikasi.
+    column (str): Kolom nilai.
+    """
+    pairs = chunk.loc[chunk[column].notna(), ["Year", column]].drop_duplicates()
+    for pair in zip(pairs["Year"].tolist(), pairs[column].tolist()):
+        seen.setdefault(pair, len(seen))
+
+
+def fold(state, chunk, regions):
+    """
+    Menggabungkan satu potongan baris mentah ke dalam state agregat.
+
+    Args:
+    state (dict): State dari `new_state`.
+    chunk (DataFrame): Potongan athlete_events dengan tipe `CHUNK_DTYPES`.
+    regions (Series): Pemetaan NOC -> wilayah.
+
+    Returns:
+    DataFrame: Baris baru (bukan duplikat) dari potongan ini, tanpa kolom wilayah.
+    """
+    chunk = chunk.assign(region=chunk["NOC"].map(regions))
+    chunk = chunk[state["rows"].add_new(_row_hashes(chunk))]
+    state["row_count"] += len(chunk)
+
+    medal_rows = chunk[state["medal_keys"].add_new(_row_hashes(chunk[MEDAL_KEY]))]
+    medal_rows = medal_rows[medal_rows["region"].notna()]
+    medals = pd.DataFrame({
+        "region": medal_rows["region"],
+        "Year": medal_rows["Year"],
+        "Season": medal_rows["Season"],
+        "gold": medal_rows["Medal"] == "Gold",
+        "silver": medal_rows["Medal"] == "Silver",
+        "bronze": medal_rows["Medal"] == "Bronze",
+        "rows": 1,
+    }).groupby(["region", "Year", "Season"])[MEDAL_COLUMNS].sum()
+    state["medals"] = _add_counts(state["medals"], medals)
+
+    _remember(state["year_regions"], chunk, "region")
+    _remember(state["year_sports"], chunk, "Sport")
+    _remember(state["year_cities"], chunk, "City")
+    _remember(state["year_seasons"], chunk, "Season")
+
+    sex = pd.DataFrame({
+        "Year": chunk["Year"],
+        "Male": chunk["Sex"] == "M",
+        "Female": chunk["Sex"] == "F",
+    }).groupby("Year")[["Male", "Female"]].sum()
+    state["sex"] = _add_counts(state["sex"], sex)
+
+    games = chunk.groupby("Games")["Name"].count()
+    state["games"] = state["games"].add(games, fill_value=0).astype(np.int64).sort_index()
+
+    return chunk.drop(columns="region")
+
+
+def _chunk_rows(path, memory_mb):
+    """
+    Memperkirakan jumlah baris per potongan agar satu potongan muat dalam anggaran memori.
+
+    Args:
+    path (str): Path CSV athlete_events.
+    memory_mb (float): Anggaran memori untuk satu potongan, dalam MB.
+
+    Returns:
+    int: Jumlah baris per potongan.
+    """
+    sample = pd.read_csv(path, dtype=CHUNK_DTYPES, nrows=1000)
+    bytes_per_row = max(1, sample.memory_usage(deep=True).sum() // max(1, len(sample)))
+    # Potongan hidup bersama salinan sementara dari filter dan groupby, jadi beri ruang 4x.
+    return max(1000, int(memory_mb * 2 ** 20 // (4 * bytes_per_row)))
+
+
+def _regions(noc_path=None):
+    """
+    Memuat pemetaan NOC -> wilayah.
+
+    Args:
+    noc_path (str): Path CSV noc_regions. Defaultnya `preprocessing.NOC_PATH`.
+
+    Returns:
+    Series: Wilayah dengan indeks NOC.
+    """
+    return pd.read_csv(noc_path or preprocessing.NOC_PATH).drop_duplicates(subset="NOC").set_index("NOC")["region"]
+
+
+def stream(path=None, noc_path=None, memory_mb=64, state=None):
+    """
+    Membaca athlete_events per potongan dan melipatnya ke dalam agregat dashboard.
+
+    Memori puncak untuk data mentah dibatasi oleh `memory_mb`. Yang tumbuh bersama
+    ukuran input hanya himpunan hash deduplikasi (16 byte per baris unik) dan tabel
+    agregat, yang ukurannya bergantung pada jumlah wilayah dan tahun.
+
+    Args:
+    path (str): Path CSV athlete_events. Defaultnya `preprocessing.ATHLETE_PATH`.
+    noc_path (str): Path CSV noc_regions. Defaultnya `preprocessing.NOC_PATH`.
+    memory_mb (float): Anggaran memori per potongan, dalam MB.
+    state (dict): State yang akan dilanjutkan. Defaultnya state kosong.
+
+    Returns:
+    dict: State agregat.
+    """
+    path = path or preprocessing.ATHLETE_PATH
+    state = new_state() if state is None else state
+
+    regions = _regions(noc_path)
+    for chunk in pd.read_csv(path, dtype=CHUNK_DTYPES, chunksize=_chunk_rows(path, memory_mb)):
+        fold(state, chunk, regions)
+
+    return state
+
+
+def medal_totals(state):
+    """
+    Menghitung tabel medali seluruh wilayah dari state agregat.
+
+    Args:
+    state (dict): State agregat.
+
+    Returns:
+    DataFrame: Tabel medali seperti `preprocessing.subset_and_display_medal(region="All")` untuk semua tahun dan musim.
+    """
+    medals = state["medals"].groupby(level="region")[["gold", "silver", "bronze"]].sum()
+    medals.columns = ["medal_Gold", "medal_Silver", "medal_Bronze"]
+    medals.index.name = "region"
+    return preprocessing._rank_medals(medals)
+
+
+def participant_data(state):
+    """
+    Menghitung jumlah negara peserta per tahun dari state agregat.
+
+    Args:
+    state (dict): State agregat.
+
+    Returns:
+    DataFrame: Sama seperti `preprocessing.participant_data()`.
+    """
+    pairs = pd.DataFrame(sorted(state["year_regions"]), columns=["Year", "region"])
+    participant = pairs.groupby("Year")["region"].count().reset_index()
+    participant.columns = ["Year", "number country"]
+    return participant
+
+
+def _ordered_pairs(seen):
+    """
+    Mengurutkan pasangan (tahun, nilai) berdasarkan tahun, lalu urutan kemunculan pertama.
+
+    Args:
+    seen (dict): Pasangan (tahun, nilai) -> nomor urut kemunculan pertama.
+
+    Returns:
+    list: Pasangan (tahun, nilai) terurut.
+    """
+    return [pair for pair, _ in sorted(seen.items(), key=lambda item: (item[0][0], item[1]))]
+
+
+def _count_years(seen):
+    """
+    Menghitung di berapa tahun setiap nilai muncul, sesuai urutan kemunculan pertamanya.
+
+    Args:
+    seen (dict): Pasangan (tahun, nilai) -> nomor urut kemunculan pertama.
+
+    Returns:
+    dict: Nilai -> jumlah tahun.
+    """
+    counts = {}
+    for _, value in _ordered_pairs(seen):
+        counts[value] = counts.get(value, 0) + 1
+    return counts
+
+
+def sport_data_count(state):
+    """
+    Menghitung jumlah dan daftar cabang olahraga per tahun dari state agregat.
+
+    Args:
+    state (dict): State agregat.
+
+    Returns:
+    tuple: Sama seperti `preprocessing.sport_data_count()`.
+    """
+    pairs = pd.DataFrame(_ordered_pairs(state["year_sports"]), columns=["Year", "Sport"])
+    sport_data = pairs.groupby("Year")["Sport"].count().reset_index()
+    sport_data_value = pairs.groupby("Year")["Sport"].unique().reset_index()
+    return sport_data, sport_data_value
+
+
+def city_data(state):
+    """
+    Menghitung berapa kali setiap kota menjadi tuan rumah dari state agregat.
+
+    Args:
+    state (dict): State agregat.
+
+    Returns:
+    DataFrame: Sama seperti `preprocessing.city_data()`.
+    """
+    counts = _count_years(state["year_cities"])
+    return pd.DataFrame({"city" : list(counts.keys()) , "num" : list(counts.values())})
+
+
+def season_data(state):
+    """
+    Menghitung di berapa tahun setiap musim diadakan dari state agregat.
+
+    Args:
+    state (dict): State agregat.
+
+    Returns:
+    DataFrame: Sama seperti `preprocessing.season_data()`.
+    """
+    counts = _count_years(state["year_seasons"])
+    return pd.DataFrame({"season" : list(counts.keys()) , "num" : list(counts.values())})
+
+
+def games_count(state):
+    """
+    Menghitung jumlah peserta per edisi Olimpiade dari state agregat.
+
+    Args:
+    state (dict): State agregat.
+
+    Returns:
+    DataFrame: Sama seperti `preprocessing.data_games_count()`.
+    """
+    games_count_df = state["games"].to_frame().reset_index()
+    games_count_df.columns = ["Games", "Participant Count"]
+    return games_count_df
+
+
+def sex_data(state):
+    """
+    Menghitung komposisi jenis kelamin per tahun dari state agregat.
+
+    Args:
+    state (dict): State agregat.
+
+    Returns:
+    DataFrame: Sama seperti `preprocessing.sex_data()`.
+    """
+    sex_compotation = state["sex"].reset_index()
+    sex_compotation["Total"] = sex_compotation["Male"] + sex_compotation["Female"]
+    return sex_compotation
+
+
+def _write(path, payload):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def save(state):
+    """
+    Menyimpan state agregat, dicap dengan (mtime, ukuran) file sumber saat ini. Agregat ditulis ke
+    STATE_PATH dan himpunan hash deduplikasi ke DEDUP_PATH.
+
+    Args:
+    state (dict): State agregat yang sesuai dengan file sumber saat ini.
+    """
+    signature = preprocessing._source_signature()
+    # Himpunan hash disimpan sebagai array biasa agar file state tidak bergantung pada kelas `HashSet`.
+    dedup = {key: state[key].values() for key in DEDUP_KEYS}
+    aggregates = {key: value for key, value in state.items() if key not in DEDUP_KEYS}
+    _write(DEDUP_PATH, {"version": STATE_VERSION, "signature": signature, "state": dedup})
+    _write(STATE_PATH, {"version": STATE_VERSION, "signature": signature, "state": aggregates})
+
+
+def _current(payload):
+    return payload["version"] == STATE_VERSION and payload["signature"] == preprocessing._source_signature()
+
+
+def _read(mtime):
+    """
+    Membaca file agregat dan menyimpannya di `_LOADED`. "mtime" ditulis terakhir.
+
+    Returns:
+    dict: Isi file agregat.
+    """
+    if mtime == _LOADED["mtime"]:
+        return _LOADED["payload"]
+    with open(STATE_PATH, "rb") as f:
+        payload = pickle.load(f)
+    _LOADED["payload"] = payload
+    _LOADED["mtime"] = mtime
+    return payload
+
+
+def load():
+    """
+    Memuat agregat yang tersimpan bila masih sesuai dengan file sumber, tanpa himpunan hash
+    deduplikasi (lihat `load_for_append`).
+
+    File agregat hanya dibaca ulang bila mtime-nya berubah, oleh satu thread.
+
+    Returns:
+    dict: State agregat tanpa "rows" dan "medal_keys", atau None bila tidak ada atau sudah basi.
+    """
+    if not os.path.exists(STATE_PATH):
+        return None
+
+    mtime = os.stat(STATE_PATH).st_mtime_ns
+    payload = _LOADED["payload"] if mtime == _LOADED["mtime"] else _FLIGHTS.do(mtime, lambda: _read(mtime))
+    if not _current(payload):
+        return None
+    return payload["state"]
+
+
+def load_for_append():
+    """
+    Memuat state lengkap untuk `append`: agregat dan himpunan hash deduplikasi. Kedua file dibaca
+    langsung (tidak dari `_LOADED`), karena `fold` mengubah state di tempat.
+
+    Returns:
+    dict: State agregat lengkap, atau None bila salah satu file tidak ada atau sudah basi.
+    """
+    payloads = []
+    for path in (STATE_PATH, DEDUP_PATH):
+        try:
+            with open(path, "rb") as f:
+                payload = pickle.load(f)
+        except OSError:
+            return None
+        if not _current(payload):
+            return None
+        payloads.append(payload)
+    aggregates, dedup = (payload["state"] for payload in payloads)
+    return dict(aggregates, **{key: HashSet(dedup[key]) for key in DEDUP_KEYS})
+
+
+def build(memory_mb=64):
+    """
+    Membangun ulang state agregat dari seluruh file sumber dan menyimpannya.
+
+    Args:
+    memory_mb (float): Anggaran memori per potongan, dalam MB.
+
+    Returns:
+    dict: State agregat.
+    """
+    state = stream(memory_mb=memory_mb)
+    save(state)
+    return state
+
+
+def append(delta_path, memory_mb=64):
+    """
+    Menambahkan baris athlete_events baru tanpa menghitung ulang seluruh agregat.
+
+    Baris delta dideduplikasi terhadap baris yang sudah ada, ditambahkan ke akhir
+    file sumber, dan dilipat ke state agregat yang tersimpan. Biayanya sebanding
+    dengan ukuran delta ditambah memuat state (16 byte per baris unik).
+    Bila state belum ada atau basi, state dibangun ulang dulu dari file sumber.
+
+    Args:
+    delta_path (str): Path CSV berisi baris baru dengan kolom yang sama seperti athlete_events.
+    memory_mb (float): Anggaran memori per potongan, dalam MB.
+
+    Returns:
+    int: Jumlah baris baru yang ditambahkan.
+    """
+    state = load_for_append()
+    if state is None:
+        state = stream(memory_mb=memory_mb)
+
+    regions = _regions()
+    columns = pd.read_csv(preprocessing.ATHLETE_PATH, nrows=0).columns.tolist()
+    needs_newline = False
+    with open(preprocessing.ATHLETE_PATH, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) not in (b"\n", b"\r")
+
+    added = 0
+    with open(preprocessing.ATHLETE_PATH, "a", newline="") as out:
+        if needs_newline:
+            out.write("\n")
+        for chunk in pd.read_csv(delta_path, dtype=CHUNK_DTYPES, chunksize=_chunk_rows(delta_path, memory_mb)):
+            new_rows = fold(state, chunk[columns], regions)
+            new_rows.to_csv(out, header=False, index=False, na_rep="NA")
+            added += len(new_rows)
+
+    save(state)
+    return added
+
+
+def verify(memory_mb=64):
+    """
+    Membandingkan state agregat yang tersimpan dengan hasil build ulang penuh dan dengan `preprocessing`.
+
+    Args:
+    memory_mb (float): Anggaran memori per potongan, dalam MB.
+
+    Returns:
+    list: Nama agregat yang berbeda. Kosong bila semuanya identik.
+    """
+    stored = load()
+    if stored is None:
+        return ["state"]
+
+    rebuilt = stream(memory_mb=memory_mb)
+    # Matikan pembacaan state di preprocessing agar pembandingnya dihitung dari dataset.
+    use_store, preprocessing.USE_STORE = preprocessing.USE_STORE, False
+    try:
+        reference = {
+            "medal_totals": preprocessing.medal_data(preprocessing.clear_data(preprocessing._MEDAL_COLUMNS)),
+            "participant_data": preprocessing.participant_data(),
+            "sport_data_count": preprocessing.sport_data_count()[0],
+            "sex_data": preprocessing.sex_data(),
+            "city_data": preprocessing.city_data(),
+            "season_data": preprocessing.season_data(),
+            "games_count": preprocessing.data_games_count(),
+        }
+    finally:
+        preprocessing.USE_STORE = use_store
+
+    different = []
+    for name, expected in reference.items():
+        function = globals()[name]
+        result = function(stored)
+        result = result[0] if isinstance(result, tuple) else result
+        full = function(rebuilt)
+        full = full[0] if isinstance(full, tuple) else full
+        if not (_same(result, full) and _same(result, expected)):
+            different.append(name)
+    return different
+
+
+def _same(left, right):
+    """
+    Membandingkan dua frame agregat berdasarkan nilainya, tanpa memperhatikan tipe kolom.
+
+    Args:
+    left (DataFrame): Frame pertama.
+    right (DataFrame): Frame kedua.
+
+    Returns:
+    bool: True bila kolom dan nilainya sama.
+    """
+    left = left.reset_index(drop=True).astype(object)
+    right = right.reset_index(drop=True).astype(object)
+    return list(left.columns) == list(right.columns) and left.values.tolist() == right.values.tolist()
+
+
+def main(argv=None):
+    """
+    Entry point command line untuk ingest per potongan.
+
+    Args:
+    argv (list): Argumen command line. Defaultnya sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Ingest athlete_events per potongan dengan memori terbatas.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    stream_parser = commands.add_parser("stream", help="Baca CSV per potongan dan cetak ringkasan agregat.")
+    stream_parser.add_argument("path", nargs="?", default=None)
+    stream_parser.add_argument("--memory-mb", type=float, default=64)
+
+    build_parser = commands.add_parser("build", help="Bangun ulang dan simpan state agregat dari file sumber.")
+    build_parser.add_argument("--memory-mb", type=float, default=64)
+
+    append_parser = commands.add_parser("append", help="Tambahkan file delta ke file sumber dan perbarui state agregat.")
+    append_parser.add_argument("delta")
+    append_parser.add_argument("--memory-mb", type=float, default=64)
+
+    verify_parser = commands.add_parser("verify", help="Bandingkan state agregat dengan build ulang penuh.")
+    verify_parser.add_argument("--memory-mb", type=float, default=64)
+
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    if args.command == "stream":
+        state = stream(args.path, memory_mb=args.memory_mb)
+        print(f"rows: {state['row_count']} ({time.perf_counter() - start:.2f}s)")
+        print(medal_totals(state).head(10).to_string(index=False))
+    elif args.command == "build":
+        state = build(memory_mb=args.memory_mb)
+        print(f"rows: {state['row_count']} -> {STATE_PATH} ({time.perf_counter() - start:.2f}s)")
+    elif args.command == "append":
+        added = append(args.delta, memory_mb=args.memory_mb)
+        print(f"appended rows: {added} ({time.perf_counter() - start:.2f}s)")
+    elif args.command == "verify":
+        different = verify(memory_mb=args.memory_mb)
+        print("identical" if not different else "different: " + ", ".join(different))
+        raise SystemExit(1 if different else 0)
+
+
+if __name__ == "__main__":
+    main()
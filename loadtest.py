@@ -0,0 +1,142 @@
+import argparse
+import http.client
+import os
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlencode, urlsplit
+
+# Campuran request default: (endpoint, parameter). Mirip pola pemakaian dashboard.
+MIX = [
+    ("subset_and_display_medal", {"region": "All", "season": "All Season", "from_year": 1988, "to_year": 2015}),
+    ("medal_time_series", {"region": "USA", "from_year": 1960, "to_year": 2016}),
+    ("total_athlete_page", {"fromm": 1988, "too": 2015, "country": "All", "sport": "All", "page": 1, "sort": "Name"}),
+    ("total_athlete_count", {"fromm": 1988, "too": 2015, "country": "USA", "sport": "All"}),
+    ("data_sport_top", {"sport": "Athletics", "too": 2016}),
+    ("sex_data_sport", {"sport": "Swimming"}),
+    ("participant_data", {}),
+    ("top_medal", {}),
+    ("region_options", {}),
+]
+
+
+def _percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else float("nan")
+
+
+def _worker(base, requests, fmt, revalidate, latencies, statuses, lock):
+    """
+    Mengirim request berurutan lewat satu koneksi keep-alive.
+    """
+    url = urlsplit(base)
+    connection = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=60)
+    etags = {}
+    for index in requests:
+        endpoint, params = MIX[index % len(MIX)]
+        path = f"/{endpoint}?{urlencode({**params, 'format': fmt})}"
+        headers = {"If-None-Match": etags[path]} if revalidate and path in etags else {}
+        start = time.perf_counter()
+        connection.request("GET", path, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        elapsed = time.perf_counter() - start
+        if response.getheader("ETag"):
+            etags[path] = response.getheader("ETag")
+        with lock:
+            latencies.append(elapsed)
+            statuses[response.status] = statuses.get(response.status, 0) + 1
+    connection.close()
+
+
+def run(base, total, concurrency, fmt="json", revalidate=False):
+    """
+    Menjalankan load test terhadap server API yang sudah berjalan.
+
+    Args:
+    base (str): URL dasar server, misalnya http://127.0.0.1:8000.
+    total (int): Jumlah request.
+    concurrency (int): Jumlah klien paralel.
+    fmt (str): "json" atau "arrow".
+    revalidate (bool): Kirim If-None-Match dengan ETag sebelumnya (menguji jalur 304).
+
+    Returns:
+    dict: Throughput, persentil latensi, dan jumlah respons per status.
+    """
+    latencies, statuses, lock = [], {}, threading.Lock()
+    threads = [
+        threading.Thread(target=_worker, args=(base, range(worker, total, concurrency), fmt, revalidate, latencies, statuses, lock))
+        for worker in range(concurrency)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p95_ms": _percentile(latencies, 0.95) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "status": statuses,
+    }
+
+
+def _wait_ready(base, timeout=120):
+    url = urlsplit(base)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection(url.hostname, url.port or 80, timeout=5)
+            connection.request("GET", "/")
+            connection.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server {base} tidak siap dalam {timeout} detik")
+
+
+def main(argv=None):
+    """
+    Entry point command line untuk load test.
+
+    Args:
+    argv (list): Argumen command line. Defaultnya sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Load test untuk api.py.")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--format", choices=["json", "arrow"], default="json")
+    parser.add_argument("--revalidate", action="store_true", help="Kirim If-None-Match dengan ETag sebelumnya.")
+    parser.add_argument("--spawn", action="store_true", help="Jalankan api.py lokal di port --url selama tes.")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.spawn:
+        port = urlsplit(args.url).port or 8000
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "api.py"), "--port", str(port), "--warm"],
+        )
+    try:
+        _wait_ready(args.url)
+        # Satu putaran pemanasan agar yang diukur adalah jalur cache, bukan pemuatan pertama.
+        run(args.url, len(MIX), 1, args.format)
+        result = run(args.url, args.requests, args.concurrency, args.format, args.revalidate)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(f"{result['requests']} requests in {result['seconds']:.2f}s ({result['rps']:.0f} req/s), "
+          f"p50 {result['p50_ms']:.1f} ms, p95 {result['p95_ms']:.1f} ms, p99 {result['p99_ms']:.1f} ms, "
+          f"status {result['status']}")
+
+
+if __name__ == "__main__":
+    main()
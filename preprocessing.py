@@ -1,88 +1,1036 @@
+import hashlib
+import json
+import os
+import pickle
+import time
+
 import pandas as pd
 import numpy as np
-import helper
-import seaborn as sns
+
+import cache
+
+# Set OLYMPICS_DATA_DIR untuk memakai dataset lain, misalnya hasil `generate.py`.
+DATA_DIR = os.environ.get("OLYMPICS_DATA_DIR", "data")
+ATHLETE_PATH = os.path.join(DATA_DIR, "athlete_events.csv")
+NOC_PATH = os.path.join(DATA_DIR, "noc_regions.csv")
+COLUMNAR_PATH = os.path.join(DATA_DIR, "athlete_events.parquet")
+
+# Kolom dataset bersih yang diterbitkan `publish_shared` sebagai file NumPy, satu direktori per
+# sidik jari. Proses server memetakannya ke memori read-only, jadi halaman memorinya dibagi antarproses.
+SHARED_DIR = os.path.join(DATA_DIR, "shared")
+
+# Artefak agregat hasil `precompute`. Naikkan ARTIFACT_VERSION bila bentuk agregat berubah;
+# artefak versi lama ada di direktori lain dan tidak akan dibaca.
+ARTIFACT_VERSION = 3
+ARTIFACT_DIR = os.path.join(DATA_DIR, "artifacts", f"v{ARTIFACT_VERSION}")
+
+# Katalog dimensi hasil `publish_catalog`: kosakata pilihan widget dan rentang tahun, per sidik jari.
+# Naikkan CATALOG_VERSION bila isi katalog berubah.
+CATALOG_VERSION = 2
+CATALOG_PATH = os.path.join(DATA_DIR, "catalog.json")
+
+# Skema eksplisit untuk athlete_events.csv. Kategori tanpa daftar eksplisit
+# diurutkan secara leksikografis oleh pandas, jadi kodenya stabil.
+ATHLETE_DTYPES = {
+    "ID": "int32",
+    "Name": "category",
+    "Sex": pd.CategoricalDtype(["F", "M"]),
+    "Age": "float32",
+    "Height": "float32",
+    "Weight": "float32",
+    "Team": "category",
+    "NOC": "category",
+    "Games": "category",
+    "Year": "int16",
+    "Season": pd.CategoricalDtype(["Summer", "Winter"]),
+    "City": "category",
+    "Sport": "category",
+    "Event": "category",
+    "Medal": pd.CategoricalDtype(["Gold", "Silver", "Bronze"]),
+}
+
+# Naikkan bila skema dataset bersih berubah agar cache kolumnar lama dianggap basi.
+SCHEMA_VERSION = 3
+
+# Set OLYMPICS_COLUMNAR=0 untuk memaksa pemuatan dari CSV.
+USE_COLUMNAR = os.environ.get("OLYMPICS_COLUMNAR", "1") != "0"
+
+# Set OLYMPICS_SHARED=0 untuk mengabaikan kolom bersama dari `publish_shared`.
+USE_SHARED = os.environ.get("OLYMPICS_SHARED", "1") != "0"
+
+# Set OLYMPICS_STORE=0 untuk mengabaikan state agregat tersimpan dari `ingest`.
+USE_STORE = os.environ.get("OLYMPICS_STORE", "1") != "0"
+
+# Set OLYMPICS_BACKEND=sqlite atau duckdb untuk menjalankan fungsi filter-dan-agregasi di mesin
+# SQL tertanam (lihat `sqlbackend`). Defaultnya "pandas": kubus dan posting list di memori.
+BACKEND = os.environ.get("OLYMPICS_BACKEND", "pandas")
+
+# Jumlah baris per halaman untuk tabel yang dipaginasi.
+PAGE_SIZE = 50
+
+# Hasil per parameter (misalnya top 30 per cabang olahraga dan tahun), dibagikan ke semua sesi.
+# Dibatasi karena parameternya datang dari pengguna; kuncinya memuat sidik jari dataset.
+RESULT_CACHE = cache.LRUCache(max_entries=int(os.environ.get("OLYMPICS_RESULT_CACHE_ENTRIES", 256)), ttl=None)
+
+# Cache dataset bersih per proses server. Diinvalidasi bila mtime, ukuran,
+# atau hash isi file sumber berubah. "frame" bisa hanya berisi sebagian kolom
+# bila sumbernya adalah cache kolumnar. "source" adalah "shared", "columnar", atau "csv".
+_CACHE = {"signature": None, "fingerprint": None, "frame": None, "schema": None, "source": None, "first_seen": None,
+          "hits": 0, "misses": 0}
+
+# Penggabung panggilan serentak untuk validasi file sumber, pemuatan dataset, dan pembangunan
+# agregat. Saat server baru mulai, semua sesi memanggil `clear_data()` bersamaan; hanya satu
+# thread yang memuat, sisanya menunggu hasil yang sama.
+_FLIGHTS = cache.SingleFlight()
 
 def dataset():
     """
-    Memuat dan menggabungkan dataset atlet dan wilayah.
+    Memuat dataset atlet dengan skema kompak dan menambahkan kolom wilayah.
+
+    Kolom teks disimpan sebagai kategori dengan kamus kode yang terurut (stabil
+    untuk kosakata yang sama), tahun sebagai int16, dan data fisik sebagai float32.
+    Wilayah diturunkan dari pemetaan kode NOC ke kode wilayah, bukan dari `merge`.
 
     Returns:
     DataFrame: Dataset yang digabungkan.
     """
-    athlete_url = "data/athlete_events.csv" 
-    noc_url = "data/noc_regions.csv"
+    athlete = pd.read_csv(ATHLETE_PATH, dtype=ATHLETE_DTYPES)
+    regions = pd.read_csv(NOC_PATH).drop_duplicates(subset="NOC")
+
+    region_dtype = pd.CategoricalDtype(sorted(regions["region"].dropna().unique()))
+    region_of_noc = regions.set_index("NOC")["region"].reindex(athlete["NOC"].cat.categories)
+    noc_to_region = pd.Categorical(region_of_noc, dtype=region_dtype).codes
+
+    noc_codes = athlete["NOC"].cat.codes.to_numpy()
+    region_codes = np.where(noc_codes >= 0, noc_to_region[noc_codes], -1)
+    athlete["region"] = pd.Categorical.from_codes(region_codes, dtype=region_dtype)
+
+    return athlete
+
+# Kolom kategori yang urutan kemunculan pertamanya di file sumber dicatat oleh `_clean` untuk katalog.
+_FIRST_SEEN_COLUMNS = ["region", "Sport", "NOC", "Games"]
+
+def _clean(df):
+    """
+    Menghapus baris duplikat dari dataset gabungan dan mengurutkannya berdasarkan tahun.
+
+    Pengurutan stabil, jadi urutan baris di dalam satu tahun tetap sama seperti di file
+    sumber. Indeks hasilnya adalah posisi baris, sehingga rentang tahun bisa diambil
+    sebagai irisan posisi (lihat `_year_rows`).
+
+    Urutan kemunculan pertama setiap nilai di file sumber (urutan pilihan selectbox) hilang
+    setelah pengurutan, jadi dicatat di sini dan disimpan bersama cache kolumnar dan kolom bersama.
+
+    Args:
+    df (DataFrame): Dataset hasil `dataset()`.
+
+    Returns:
+    tuple: Dataset yang sudah dibersihkan, dan dict kolom -> kode kategori sesuai urutan
+        kemunculan pertama di file sumber (-1 untuk nilai kosong).
+    """
+    deduped = df.drop_duplicates()
+    first_seen = {column: pd.unique(deduped[column].cat.codes.to_numpy()).tolist() for column in _FIRST_SEEN_COLUMNS}
+    return deduped.sort_values("Year", kind="stable", ignore_index=True), first_seen
 
-    athlete = pd.read_csv(athlete_url)
-    regions = pd.read_csv(noc_url)
+def _source_signature():
+    """
+    Mengambil (mtime, ukuran) dari setiap file sumber tanpa membaca isinya.
 
-    dataset = athlete.merge(regions , how="left" , on="NOC")
+    Returns:
+    tuple: Tuple berisi pasangan (mtime_ns, size) untuk setiap file sumber.
+    """
+    signature = []
+    for path in (ATHLETE_PATH, NOC_PATH):
+        stat = os.stat(path)
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
 
-    return dataset
+def _content_hash():
+    """
+    Menghitung hash SHA-256 dari isi semua file sumber.
 
-def clear_data():
+    Returns:
+    str: Hash heksadesimal dari isi file sumber.
+    """
+    digest = hashlib.sha256()
+    for path in (ATHLETE_PATH, NOC_PATH):
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+def _columnar_schema(digest):
+    """
+    Memeriksa apakah cache kolumnar ada dan dibuat dari file sumber dengan hash `digest`.
+
+    Args:
+    digest (str): Hash isi file sumber saat ini.
+
+    Returns:
+    list: Daftar kolom cache kolumnar, atau None bila cache tidak ada, basi, atau pyarrow tidak tersedia.
+    """
+    if not USE_COLUMNAR or not os.path.exists(COLUMNAR_PATH):
+        return None
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+
+    schema = pq.read_schema(COLUMNAR_PATH)
+    metadata = schema.metadata or {}
+    if metadata.get(b"olympics_fingerprint", b"").decode() != digest:
+        return None
+    if metadata.get(b"olympics_schema", b"").decode() != str(SCHEMA_VERSION):
+        return None
+    return [name for name in schema.names if not name.startswith("__index_level_")]
+
+def _shared_path(digest):
+    return os.path.join(SHARED_DIR, digest)
+
+def _shared_schema(digest):
+    """
+    Memeriksa apakah kolom bersama untuk sidik jari `digest` sudah diterbitkan.
+
+    Args:
+    digest (str): Hash isi file sumber saat ini.
+
+    Returns:
+    list: Daftar kolom yang diterbitkan, atau None bila tidak ada, skemanya basi, atau dimatikan.
+    """
+    if not USE_SHARED:
+        return None
+    try:
+        with open(os.path.join(_shared_path(digest), "manifest.json")) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("fingerprint") != digest or manifest.get("schema") != SCHEMA_VERSION:
+        return None
+    return manifest["columns"]
+
+def _attach_shared():
+    """
+    Memetakan kolom bersama ke memori tanpa menyalinnya.
+
+    Kolom angka dan kode kategori dibuka dengan `mmap_mode="r"` dan dipakai langsung sebagai
+    buffer DataFrame, jadi semua proses yang memetakan file yang sama berbagi page cache yang
+    sama. Hanya kamus kategori (kecil) yang dimuat ke memori proses.
+
+    Returns:
+    DataFrame: Dataset bersih read-only.
+    """
+    path = _shared_path(_CACHE["fingerprint"])
+    with open(os.path.join(path, "dtypes.pkl"), "rb") as f:
+        dtypes = pickle.load(f)
+
+    columns = {}
+    for column in _CACHE["schema"]:
+        # View ndarray biasa (tanpa salinan) agar subkelas memmap tidak ikut ke hasil turunan.
+        values = np.load(os.path.join(path, f"{column}.npy"), mmap_mode="r").view(np.ndarray)
+        if column in dtypes:
+            values = pd.Categorical.from_codes(values, dtype=dtypes[column], validate=False)
+        columns[column] = values
+    return pd.DataFrame(columns, copy=False)
+
+def _refresh():
+    """
+    Memastikan cache sesuai dengan file sumber saat ini.
+
+    File sumber hanya di-hash bila mtime atau ukurannya berubah, dan cache
+    hanya dikosongkan bila hash isinya juga berubah. Hash dihitung oleh satu thread
+    per perubahan; thread lain menunggu hasilnya.
+    """
+    signature = _source_signature()
+    if signature != _CACHE["signature"]:
+        _FLIGHTS.do(("refresh", signature), lambda: _revalidate(signature))
+
+def _revalidate(signature):
+    """
+    Meng-hash file sumber dan mengosongkan cache bila isinya berubah. "signature" ditulis
+    terakhir, jadi thread yang melihat signature baru juga melihat sidik jari yang baru.
+    """
+    if signature == _CACHE["signature"]:
+        return
+
+    digest = _content_hash()
+    if digest == _CACHE["fingerprint"]:
+        _CACHE["signature"] = signature
+        return
+
+    source = "shared"
+    schema = _shared_schema(digest)
+    if schema is None:
+        schema = _columnar_schema(digest)
+        source = "columnar" if schema is not None else "csv"
+    _CACHE["frame"] = None
+    _CACHE["first_seen"] = None
+    _CACHE["schema"] = schema
+    _CACHE["source"] = source
+    _CACHE["fingerprint"] = digest
+    _CACHE["signature"] = signature
+
+def _load_missing(columns):
+    """
+    Memuat kolom yang belum ada di cache, dari cache kolumnar bila valid atau dari CSV.
+
+    Args:
+    columns (list): Kolom yang dibutuhkan, atau None untuk semua kolom.
+    """
+    import pyarrow.parquet as pq
+
+    frame = _CACHE["frame"]
+    schema = _CACHE["schema"]
+    wanted = schema if columns is None else columns
+    missing = [c for c in wanted if frame is None or c not in frame.columns]
+    part = pq.read_table(COLUMNAR_PATH, columns=missing).to_pandas()
+
+    if frame is not None:
+        part = pd.concat([frame, part], axis=1)
+    _CACHE["frame"] = part[[c for c in schema if c in part.columns]]
+
+def fingerprint():
+    """
+    Mengambil sidik jari (hash isi) dari file sumber dataset saat ini.
+
+    Returns:
+    str: Hash heksadesimal dari isi file sumber.
+    """
+    _refresh()
+    return _CACHE["fingerprint"]
+
+def cache_stats():
+    """
+    Mengambil statistik cache dataset bersih.
+
+    Returns:
+    dict: Jumlah hit, miss, sumber data, dan sidik jari dataset yang sedang di-cache.
+    """
+    return {"hits": _CACHE["hits"], "misses": _CACHE["misses"], "source": _CACHE["source"], "fingerprint": _CACHE["fingerprint"]}
+
+# Kunci `DataFrame.attrs` berisi sidik jari dataset asal frame dari `clear_data`.
+_SOURCE_ATTR = "olympics_fingerprint"
+
+def clear_data(columns=None):
     """
     Membersihkan dataset dengan menghapus duplikat dan kolom yang tidak perlu.
 
+    Dataset hanya dimuat sekali per proses dan dibagikan ke semua pemanggil.
+    Hasilnya adalah salinan dangkal dari frame bersama, jadi perlakukan sebagai read-only.
+
+    Args:
+    columns (list): Kolom minimum yang dibutuhkan pemanggil. Defaultnya semua kolom.
+        Frame yang dikembalikan bisa berisi kolom tambahan yang sudah termuat.
+
     Returns:
     DataFrame: Dataset yang sudah dibersihkan.
     """
-    df = dataset()
-    df_no_dup = df.drop_duplicates()
-    df = df_no_dup.drop("notes" , axis=1)
+    _refresh()
+    frame = _CACHE["frame"]
+    if _complete(frame, columns):
+        _CACHE["hits"] += 1
+    else:
+        # Pemuatan serentak digabung per sidik jari; thread yang menunggu memakai frame hasil
+        # pemuatan itu, atau memuat lagi bila frame tersebut belum berisi kolom yang dibutuhkannya.
+        while not _complete(frame, columns):
+            frame = _FLIGHTS.do(("clear_data", _CACHE["fingerprint"]), lambda: _load(columns))
+    data = frame.copy(deep=False)
+    # Penanda asal frame; ikut terbawa saat frame disaring atau di-assign (lihat `_clean_rows`).
+    data.attrs[_SOURCE_ATTR] = _CACHE["fingerprint"]
+    return data
+
+def _complete(frame, columns):
+    """
+    Memeriksa apakah frame cache sudah berisi semua kolom yang dibutuhkan.
+    """
+    if frame is None:
+        return False
+    if _CACHE["source"] != "columnar":
+        return True
+    wanted = _CACHE["schema"] if columns is None else columns
+    return all(c in frame.columns for c in wanted)
+
+def _load(columns):
+    """
+    Memuat dataset (atau kolom yang belum termuat) ke cache. Dijalankan oleh satu thread per sidik jari.
 
-    return df
+    Returns:
+    DataFrame: Frame cache setelah pemuatan.
+    """
+    if _complete(_CACHE["frame"], columns):
+        return _CACHE["frame"]
+
+    _CACHE["misses"] += 1
+    if _CACHE["source"] == "shared":
+        _CACHE["frame"] = _attach_shared()
+    elif _CACHE["source"] == "columnar":
+        _load_missing(columns)
+    else:
+        frame, first_seen = _clean(dataset())
+        _CACHE["schema"] = list(frame.columns)
+        _CACHE["first_seen"] = first_seen
+        _CACHE["frame"] = frame
+    return _CACHE["frame"]
 
-def medal_data(dataframe):
+def build_columnar():
     """
-    Menghitung jumlah total medali yang dimenangkan oleh setiap wilayah.
+    Menulis dataset bersih dari CSV ke cache kolumnar (Parquet), dicap dengan sidik jari file sumber.
+
+    Returns:
+    str: Path file cache kolumnar yang ditulis.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    digest = _content_hash()
+    frame, first_seen = _clean(dataset())
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[b"olympics_fingerprint"] = digest.encode()
+    metadata[b"olympics_schema"] = str(SCHEMA_VERSION).encode()
+    metadata[b"olympics_first_seen"] = json.dumps(first_seen).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    tmp_path = COLUMNAR_PATH + ".tmp"
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, COLUMNAR_PATH)
+
+    # Paksa validasi ulang agar proses ini ikut memakai cache yang baru.
+    _CACHE["signature"] = None
+    _CACHE["fingerprint"] = None
+    return COLUMNAR_PATH
+
+def publish_shared():
+    """
+    Menerbitkan dataset bersih sebagai satu file NumPy per kolom di SHARED_DIR agar proses
+    server lain bisa memetakannya ke memori (lihat `_attach_shared`) tanpa membaca CSV.
+
+    Kolom kategori disimpan sebagai kodenya, dengan kamus kategori di `dtypes.pkl`. Direktori
+    ditulis dengan nama sementara lalu di-rename, dan terbitan sidik jari lama dihapus; proses
+    yang masih memetakannya tetap bisa membaca sampai pemetaannya ditutup.
+
+    Returns:
+    str: Path direktori kolom bersama.
+    """
+    import shutil
+
+    digest = fingerprint()
+    target = _shared_path(digest)
+    if _shared_schema(digest) is None:
+        data = clear_data()
+        tmp_path = f"{target}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+
+        dtypes = {}
+        for column in data.columns:
+            values = data[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                dtypes[column] = values.dtype
+                values = values.cat.codes
+            np.save(os.path.join(tmp_path, f"{column}.npy"), values.to_numpy())
+        with open(os.path.join(tmp_path, "dtypes.pkl"), "wb") as f:
+            pickle.dump(dtypes, f, protocol=pickle.HIGHEST_PROTOCOL)
+        with open(os.path.join(tmp_path, "manifest.json"), "w") as f:
+            json.dump({"fingerprint": digest, "schema": SCHEMA_VERSION, "columns": list(data.columns),
+                       "first_seen": _first_seen()}, f)
+
+        shutil.rmtree(target, ignore_errors=True)
+        os.rename(tmp_path, target)
+
+    for name in os.listdir(SHARED_DIR):
+        if name != os.path.basename(target) and ".tmp-" not in name:
+            shutil.rmtree(os.path.join(SHARED_DIR, name), ignore_errors=True)
+
+    # Paksa validasi ulang agar proses ini ikut memakai kolom bersama.
+    _CACHE["signature"] = None
+    _CACHE["fingerprint"] = None
+    return target
+
+def _first_seen():
+    """
+    Mengambil urutan kemunculan pertama yang dicatat `_clean`, dari sumber dataset yang sedang
+    dipakai: manifest kolom bersama, metadata cache kolumnar, atau pemuatan CSV di proses ini.
+
+    Returns:
+    dict: Kolom -> kode kategori sesuai urutan kemunculan pertama di file sumber.
+    """
+    clear_data(["Year"])
+    source = _CACHE["source"]
+    if source == "shared":
+        with open(os.path.join(_shared_path(_CACHE["fingerprint"]), "manifest.json")) as f:
+            return json.load(f)["first_seen"]
+    if source == "columnar":
+        import pyarrow.parquet as pq
+
+        return json.loads(pq.read_schema(COLUMNAR_PATH).metadata[b"olympics_first_seen"])
+    return _CACHE["first_seen"]
+
+def _build_catalog():
+    """
+    Membangun katalog dimensi dari dataset bersih, tanpa membaca file sumber lagi.
+
+    Kosakata mengikuti urutan kemunculan pertama di file sumber (lihat `_clean`), bukan urutan
+    tahun dataset bersih, jadi urutan pilihan selectbox dan nilai default-nya tidak berubah.
+
+    Returns:
+    dict: "regions", "sports", "nocs", dan "games" berisi nilai unik sesuai urutan kemunculan
+        di file sumber, serta "years" berisi tahun minimum dan maksimum.
+    """
+    data = clear_data(["Year"] + _FIRST_SEEN_COLUMNS)
+    first_seen = _first_seen()
+    vocabulary = {
+        column: pd.Categorical.from_codes(first_seen[column], dtype=data[column].dtype).tolist()
+        for column in _FIRST_SEEN_COLUMNS
+    }
+    # Dataset bersih terurut tahun, jadi tahun minimum dan maksimum ada di baris pertama dan terakhir.
+    years = data["Year"].to_numpy()
+    return {
+        "regions": vocabulary["region"],
+        "sports": vocabulary["Sport"],
+        "nocs": vocabulary["NOC"],
+        "games": vocabulary["Games"],
+        "years": [int(years[0]), int(years[-1])],
+    }
+
+def _load_catalog():
+    """
+    Membaca katalog dari CATALOG_PATH bila dibuat dari dataset saat ini, atau membangunnya dari
+    dataset bersih bila file tidak ada atau basi.
+    """
+    try:
+        with open(CATALOG_PATH) as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        stored = {}
+    if stored.get("fingerprint") == fingerprint() and stored.get("version") == CATALOG_VERSION:
+        return stored["dimensions"]
+    return _build_catalog()
+
+def catalog():
+    """
+    Mengambil katalog dimensi dataset: kosakata wilayah, cabang olahraga, NOC, dan Games, serta
+    rentang tahun. Dibaca sekali per sidik jari dari CATALOG_PATH tanpa memuat data event.
+
+    Returns:
+    dict: Lihat `_build_catalog`. Dibagikan ke semua pemanggil, jadi jangan diubah.
+    """
+    return _aggregate("catalog", _load_catalog)
+
+def publish_catalog():
+    """
+    Menulis katalog dimensi dataset saat ini ke CATALOG_PATH.
+
+    Returns:
+    str: Path file katalog.
+    """
+    payload = {"version": CATALOG_VERSION, "fingerprint": fingerprint(), "dimensions": _build_catalog()}
+    tmp_path = f"{CATALOG_PATH}.tmp-{os.getpid()}"
+    with open(tmp_path, "w") as f:
+        json.dump(payload, f)
+    os.replace(tmp_path, CATALOG_PATH)
+    return CATALOG_PATH
+
+def _from_store(name):
+    """
+    Mengambil agregat dari state tersimpan `ingest` bila masih sesuai dengan file sumber.
+
+    State ini diperbarui secara inkremental oleh `python ingest.py append`, jadi
+    agregat halaman ringkasan tidak perlu dihitung ulang dari dataset.
 
     Args:
-    dataframe (DataFrame): DataFrame input yang berisi data acara atlet.
+    name (str): Nama fungsi agregat di modul `ingest`.
 
     Returns:
-    DataFrame: DataFrame dengan total jumlah medali untuk setiap wilayah.
+    object: Hasil agregat, atau None bila state tidak ada, basi, atau dimatikan.
     """
-    df = dataframe
-    dummies_data = pd.get_dummies(df , columns=["Medal"] , prefix="medal")
+    if not USE_STORE:
+        return None
+
+    import ingest
+
+    state = ingest.load()
+    if state is None:
+        return None
+    return getattr(ingest, name)(state)
+
+# Agregat turunan dataset bersih: nama -> (sidik jari, nilai).
+_AGGREGATES = {}
+
+def _aggregate(name, builder):
+    """
+    Mengambil agregat dari cache, atau membangunnya sekali per sidik jari dataset.
+
+    Args:
+    name (str): Nama agregat.
+    builder (callable): Fungsi tanpa argumen yang membangun agregat.
+
+    Returns:
+    object: Nilai agregat. Dibagikan ke semua pemanggil tanpa lock, jadi array NumPy di
+        dalamnya dibuat read-only (lihat `_freeze`).
+    """
+    digest = fingerprint()
+    cached = _AGGREGATES.get(name)
+    if cached is not None and cached[0] == digest:
+        return cached[1]
+
+    def build():
+        cached = _AGGREGATES.get(name)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
+        value = _read_artifact(name, digest) if name in _PRECOMPUTE else None
+        if value is None:
+            value = builder()
+        value = _freeze(value)
+        _AGGREGATES[name] = (digest, value)
+        return value
+
+    return _FLIGHTS.do((name, digest), build)
+
+def _freeze(value):
+    """
+    Menandai semua array NumPy di dalam agregat (termasuk di dalam dict, list, dan tuple) sebagai
+    read-only, agar penulisan tidak sengaja ke nilai bersama gagal alih-alih mengubah hasil sesi lain.
+    DataFrame dan Series sudah dilindungi Copy-on-Write, yang selalu aktif sejak pandas 3
+    (lihat requirements.txt).
+
+    Returns:
+    object: `value` yang sama.
+    """
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, dict):
+        for item in value.values():
+            _freeze(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _freeze(item)
+    return value
+
+def _artifact_path(name):
+    return os.path.join(ARTIFACT_DIR, f"{name}.pkl")
+
+def _read_artifact(name, digest):
+    """
+    Membaca artefak agregat bila ada dan dibuat dari dataset dengan sidik jari `digest`.
+
+    Returns:
+    object: Nilai agregat, atau None bila artefak tidak ada atau basi.
+    """
+    try:
+        with open(_artifact_path(name), "rb") as f:
+            payload = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    if payload.get("fingerprint") != digest:
+        return None
+    return payload["value"]
+
+def _precompute_job(name):
+    """
+    Membangun satu agregat dan menulis artefaknya. Dijalankan di proses pekerja.
+
+    Returns:
+    tuple: Nama agregat, detik, dan ukuran artefak dalam byte.
+    """
+    start = time.perf_counter()
+    digest = fingerprint()
+    value = _PRECOMPUTE[name]()
+    path = _artifact_path(name)
+    with open(path + ".tmp", "wb") as f:
+        pickle.dump({"fingerprint": digest, "value": value}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(path + ".tmp", path)
+    return name, time.perf_counter() - start, os.path.getsize(path)
+
+def precompute(workers=None):
+    """
+    Membangun semua agregat dashboard secara paralel dan menulisnya sebagai artefak di ARTIFACT_DIR.
+
+    Dataset bersih dimuat sekali di proses induk. Pada platform yang mendukung fork, pekerja
+    mewarisinya sebagai memori bersama read-only, bukan memuat ulang dari disk.
+
+    Args:
+    workers (int): Jumlah proses pekerja. Defaultnya jumlah CPU.
+
+    Returns:
+    dict: Manifest berisi versi, sidik jari, dan waktu serta ukuran per agregat.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    os.makedirs(ARTIFACT_DIR, exist_ok=True)
+    clear_data()
+    digest = fingerprint()
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    jobs = {}
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        for name, seconds, size in pool.map(_precompute_job, _PRECOMPUTE):
+            jobs[name] = {"seconds": seconds, "bytes": size}
+
+    manifest = {
+        "version": ARTIFACT_VERSION,
+        "fingerprint": digest,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "jobs": jobs,
+    }
+    with open(os.path.join(ARTIFACT_DIR, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def _build_year_index():
+    """
+    Membangun indeks tahun -> posisi baris pertama dari dataset yang terurut berdasarkan tahun.
+
+    Returns:
+    dict: Tahun unik ("years") dan posisi awalnya ("offsets", dengan panjang dataset di akhir).
+    """
+    years = clear_data(["Year"])["Year"].to_numpy()
+    values, offsets = np.unique(years, return_index=True)
+    return {"years": values, "offsets": np.append(offsets, len(years))}
+
+def _year_rows(from_year=None, to_year=None):
+    """
+    Mencari rentang posisi baris untuk rentang tahun dengan pencarian biner.
+
+    Args:
+    from_year (int): Tahun awal rentang (inklusif). None berarti dari awal dataset.
+    to_year (int): Tahun akhir rentang (inklusif). None berarti sampai akhir dataset.
+
+    Returns:
+    tuple: (start, stop) untuk dipakai dengan `iloc[start:stop]`.
+    """
+    index = _aggregate("year_index", _build_year_index)
+    years, offsets = index["years"], index["offsets"]
+
+    start = 0 if from_year is None else int(offsets[np.searchsorted(years, from_year, side="left")])
+    stop = int(offsets[-1]) if to_year is None else int(offsets[np.searchsorted(years, to_year, side="right")])
+    return start, max(start, stop)
+
+def _csr(keys, n_keys):
+    """
+    Mengelompokkan posisi baris berdasarkan kunci bilangan bulat dalam format CSR.
+
+    Args:
+    keys (ndarray): Kunci per baris, dalam rentang [0, n_keys).
+    n_keys (int): Banyaknya kunci yang mungkin.
+
+    Returns:
+    tuple: (rows, bounds); posisi baris untuk kunci k adalah rows[bounds[k]:bounds[k + 1]], terurut naik.
+    """
+    order = np.argsort(keys, kind="stable")
+    bounds = np.searchsorted(keys[order], np.arange(n_keys + 1))
+    return order.astype(np.int32), bounds
+
+def _build_postings():
+    """
+    Membangun posting list posisi baris untuk setiap wilayah, cabang olahraga, dan pasangan (wilayah, cabang olahraga).
+
+    Kode kategori digeser satu sehingga kunci 0 menampung baris dengan nilai kosong.
+
+    Returns:
+    dict: Kategori wilayah dan cabang olahraga beserta posting list CSR ("region", "sport", "pair").
+    """
+    data = clear_data(["region", "Sport"])
+    regions = data["region"].cat.categories
+    sports = data["Sport"].cat.categories
+
+    region_keys = data["region"].cat.codes.to_numpy().astype(np.int64) + 1
+    sport_keys = data["Sport"].cat.codes.to_numpy().astype(np.int64) + 1
+    pair_keys = region_keys * (len(sports) + 1) + sport_keys
+
+    return {
+        "regions": regions,
+        "sports": sports,
+        "region": _csr(region_keys, len(regions) + 1),
+        "sport": _csr(sport_keys, len(sports) + 1),
+        "pair": _csr(pair_keys, (len(regions) + 1) * (len(sports) + 1)),
+    }
+
+def _posting(region="All", sport="All"):
+    """
+    Mengambil posisi baris yang cocok dengan wilayah dan cabang olahraga. "All" berarti tanpa filter.
+
+    Args:
+    region (str): Wilayah yang ingin difilter.
+    sport (str): Cabang olahraga yang ingin difilter.
+
+    Returns:
+    ndarray: Posisi baris yang terurut naik, atau None bila keduanya "All".
+    """
+    if region == "All" and sport == "All":
+        return None
+
+    index = _aggregate("postings", _build_postings)
+    region_key = index["regions"].get_indexer([region])[0] + 1
+    sport_key = index["sports"].get_indexer([sport])[0] + 1
+    if (region != "All" and region_key == 0) or (sport != "All" and sport_key == 0):
+        return np.empty(0, dtype=np.int32)
+
+    if sport == "All":
+        rows, bounds = index["region"]
+        key = region_key
+    elif region == "All":
+        rows, bounds = index["sport"]
+        key = sport_key
+    else:
+        rows, bounds = index["pair"]
+        key = region_key * (len(index["sports"]) + 1) + sport_key
+    return rows[bounds[key]:bounds[key + 1]]
+
+# Kolom yang dibutuhkan untuk membangun kunci atlet dan acara.
+_KEY_COLUMNS = ["ID", "Name", "Year", "Season", "Sport", "Event", "NOC"]
+
+def _composite(codes, sizes):
+    """
+    Menggabungkan beberapa kolom kode bilangan bulat menjadi satu kunci int64 (mixed radix).
+
+    Args:
+    codes (list): Array kode per kolom, masing-masing dalam rentang [0, size).
+    sizes (list): Jumlah nilai yang mungkin per kolom.
+
+    Returns:
+    ndarray: Kunci int64 yang unik untuk setiap kombinasi kode.
+
+    Raises:
+    OverflowError: Bila kombinasi semua kolom tidak muat dalam 63 bit.
+    """
+    capacity = 1
+    for size in sizes:
+        capacity *= int(size)
+    if capacity >= 2 ** 63:
+        raise OverflowError(f"kunci gabungan membutuhkan {capacity.bit_length()} bit")
+
+    key = np.zeros(len(codes[0]), dtype=np.int64)
+    for column, size in zip(codes, sizes):
+        key = key * size + column
+    return key
+
+def _build_keys():
+    """
+    Membangun kunci bilangan bulat per baris dataset bersih.
+
+    Kunci atlet adalah peringkat padat dari kolom ID (int32), jadi dua atlet berbeda dengan
+    nama yang sama tetap terpisah. Kunci acara menggabungkan tahun, musim, cabang olahraga,
+    acara, dan NOC dalam satu int64. Nama hanya dicari untuk ditampilkan.
+
+    Returns:
+    dict: ID per kunci atlet ("ids"), kode Name per kunci atlet ("names"), kunci atlet ("athlete")
+        dan kunci acara ("event") per baris, penanda baris pertama setiap pasangan (atlet, acara)
+        ("medal_first") untuk deduplikasi medali, serta sidik jari ("fingerprint") dan jumlah baris
+        ("row_count") dataset yang menjadi dasar kunci tersebut.
+    """
+    data = clear_data(_KEY_COLUMNS)
+
+    ids, athlete = np.unique(data["ID"].to_numpy(), return_inverse=True)
+    athlete = athlete.astype(np.int32)
+    # Kode Name dari kemunculan pertama setiap atlet (penulisan terbalik: yang terakhir ditulis menang).
+    names = np.empty(len(ids), dtype=np.int32)
+    names[athlete[::-1]] = data["Name"].cat.codes.to_numpy()[::-1]
+
+    years, year_codes = np.unique(data["Year"].to_numpy(), return_inverse=True)
+    codes, sizes = [year_codes], [len(years)]
+    for column in ["Season", "Sport", "Event", "NOC"]:
+        # Kode -1 (kosong) digeser menjadi 0.
+        codes.append(data[column].cat.codes.to_numpy().astype(np.int64) + 1)
+        sizes.append(len(data[column].cat.categories) + 1)
+    event = _composite(codes, sizes)
+
+    medal_first = ~pd.DataFrame({"athlete": athlete, "event": event}).duplicated().to_numpy()
+    return {
+        "ids": ids, "names": names, "athlete": athlete, "event": event, "medal_first": medal_first,
+        "fingerprint": data.attrs[_SOURCE_ATTR], "row_count": len(data),
+    }
+
+# Kolom yang dibutuhkan untuk menghitung tabel medali. Deduplikasi memakai kunci dari `_build_keys`.
+_MEDAL_COLUMNS = ["Year", "Season", "Medal", "region"]
+
+# Kanal pada sumbu terakhir kubus medali.
+_GOLD, _SILVER, _BRONZE, _ROWS = range(4)
+
+def _build_medal_cube():
+    """
+    Membangun kubus medali padat wilayah x tahun x musim x {emas, perak, perunggu, baris}.
+
+    Baris dideduplikasi per pasangan (atlet, acara) seperti `medal_data`. Kanal "baris"
+    mencatat apakah suatu wilayah punya peserta pada sel tersebut, sehingga wilayah
+    tanpa medali tetap muncul di tabel seperti pada hasil groupby.
+
+    Returns:
+    dict: Sumbu kubus ("regions", "years", "seasons"), jumlah per sel ("counts"),
+        dan jumlah kumulatif sepanjang sumbu tahun ("cumulative", dengan satu irisan nol di depan).
+    """
+    data = clear_data(_MEDAL_COLUMNS)
+    data = data[_aggregate("keys", _build_keys)["medal_first"]]
+    data = data[data["region"].notna()]
+
+    regions = data["region"].cat.categories
+    seasons = data["Season"].cat.categories
+    years = np.unique(data["Year"].to_numpy())
+    shape = (len(regions), len(years), len(seasons), 4)
+
+    region_codes = data["region"].cat.codes.to_numpy().astype(np.int64)
+    year_codes = np.searchsorted(years, data["Year"].to_numpy())
+    season_codes = data["Season"].cat.codes.to_numpy()
+    medal_codes = data["Medal"].cat.codes.to_numpy()
+
+    cell = ((region_codes * shape[1] + year_codes) * shape[2] + season_codes) * shape[3]
+    size = int(np.prod(shape))
+    counts = np.bincount(cell + _ROWS, minlength=size)
+    has_medal = medal_codes >= 0
+    counts += np.bincount(cell[has_medal] + medal_codes[has_medal], minlength=size)
+    counts = counts.reshape(shape)
+
+    cumulative = np.zeros((shape[0], shape[1] + 1, shape[2], shape[3]), dtype=np.int64)
+    np.cumsum(counts, axis=1, out=cumulative[:, 1:])
+
+    return {"regions": regions, "years": years, "seasons": list(seasons), "counts": counts, "cumulative": cumulative}
+
+def _select_season(cells, seasons, season, axis):
+    """
+    Memilih satu musim dari sumbu musim, atau menjumlahkan semua musim untuk "All Season".
+
+    Args:
+    cells (ndarray): Irisan kubus medali.
+    seasons (list): Label sumbu musim.
+    season (str): Musim yang dipilih.
+    axis (int): Posisi sumbu musim di `cells`.
+
+    Returns:
+    ndarray: `cells` tanpa sumbu musim.
+    """
+    if season == "All Season":
+        return cells.sum(axis=axis)
+    if season not in seasons:
+        return np.zeros_like(cells.sum(axis=axis))
+    return cells.take(seasons.index(season), axis=axis)
+
+def _rank_medals(medals):
+    """
+    Menambahkan kolom total, mengurutkan, dan memberi nama kolom tabel medali.
 
-    medall_ttly = dummies_data.drop_duplicates(subset=["Name" ,"Year" , "Sport" , "Event" , "NOC" , "Season"])
-    medals = medall_ttly.groupby("region")[["medal_Gold"	,"medal_Silver" , "medal_Bronze"]].sum()
+    Args:
+    medals (DataFrame): Jumlah medal_Gold, medal_Silver, medal_Bronze dengan indeks wilayah.
+
+    Returns:
+    DataFrame: Tabel medali yang diurutkan berdasarkan total.
+    """
     medals["total"] = medals["medal_Silver"] + medals["medal_Bronze"] + medals["medal_Gold"]
     all_medals = medals.sort_values(by=["total"] , ascending=False).reset_index()
     all_medals.columns = ["Region" , "Gold" , "Silver" , "Bronze" , "Total"]
 
     return all_medals
 
-def subset_and_display_medal(region="Overall", season="All Season", from_year=helper.year_scale()[0], to_year=helper.year_scale()[1]):
+def _clean_rows(dataframe, keys):
+    """
+    Mengambil indeks `dataframe` sebagai posisi baris `clear_data()`, bila memang begitu.
+
+    Frame dianggap berasal dari `clear_data()` bila penanda asalnya sama dengan sidik jari dataset
+    yang menjadi dasar `keys`; pemeriksaan ini dilakukan sekali per frame, tanpa membandingkan isi
+    kolom. RangeIndex dari 0 yang lebih pendek dari dataset tidak dipakai, karena tidak bisa
+    dibedakan dari indeks hasil `reset_index()`; frame seperti itu dideduplikasi pada kolomnya.
+
+    Args:
+    dataframe (DataFrame): Frame yang akan dihitung.
+    keys (dict): Hasil `_build_keys`.
+
+    Returns:
+    ndarray: Posisi baris, atau None bila indeksnya bukan posisi baris (misalnya setelah
+        `reset_index()` atau frame yang dibangun di tempat lain).
+    """
+    if dataframe.attrs.get(_SOURCE_ATTR) != keys["fingerprint"]:
+        return None
+    index = dataframe.index
+    if not pd.api.types.is_integer_dtype(index.dtype):
+        return None
+    if isinstance(index, pd.RangeIndex) and index.start == 0 and len(index) != keys["row_count"]:
+        return None
+    rows = index.to_numpy()
+    if len(rows) and (rows.min() < 0 or rows.max() >= keys["row_count"]):
+        return None
+    return rows
+
+def medal_data(dataframe):
+    """
+    Menghitung jumlah total medali yang dimenangkan oleh setiap wilayah.
+
+    Setiap pasangan (atlet, acara) dihitung sekali. Untuk baris `clear_data()` (indeksnya posisi
+    baris), kuncinya bilangan bulat dari `_build_keys`; frame lain dideduplikasi langsung pada
+    kolom kuncinya.
+
+    Args:
+    dataframe (DataFrame): Data acara atlet dengan kolom Medal dan region, plus kolom kunci
+        (ID atau Name, Year, Season, Sport, Event, NOC) bila bukan baris `clear_data()`.
+
+    Returns:
+    DataFrame: DataFrame dengan total jumlah medali untuk setiap wilayah.
+    """
+    keys = _aggregate("keys", _build_keys)
+    rows = _clean_rows(dataframe, keys)
+    if rows is not None:
+        df = dataframe.assign(athlete_key=keys["athlete"][rows], event_key=keys["event"][rows])
+        subset = ["athlete_key", "event_key"]
+    else:
+        df = dataframe
+        subset = ["ID" if "ID" in df.columns else "Name", "Year", "Sport", "Event", "NOC", "Season"]
+    dummies_data = pd.get_dummies(df , columns=["Medal"] , prefix="medal")
+
+    medall_ttly = dummies_data.drop_duplicates(subset=subset)
+    medals = medall_ttly.groupby("region", observed=True)[["medal_Gold"	,"medal_Silver" , "medal_Bronze"]].sum()
+
+    return _rank_medals(medals)
+
+def subset_and_display_medal(region="Overall", season="All Season", from_year=None, to_year=None):
     """
     Menghasilkan subset dataset berdasarkan kriteria yang ditentukan dan menampilkan jumlah medali untuk setiap wilayah.
 
+    Dijalankan oleh backend query yang dipilih (lihat `query_backend`).
+
     Args:
     region (str): Wilayah untuk menyaring dataset. Defaultnya adalah "Overall".
     season (str): Musim untuk menyaring dataset. Defaultnya adalah "All Season".
-    from_year (int): Tahun awal rentang. Defaultnya adalah tahun minimum dalam dataset.
-    to_year (int): Tahun akhir rentang. Defaultnya adalah tahun maksimum dalam dataset.
+    from_year (int): Tahun awal rentang. None berarti tahun minimum dalam dataset.
+    to_year (int): Tahun akhir rentang. None berarti tahun maksimum dalam dataset.
 
     Returns:
     DataFrame: DataFrame yang menampilkan jumlah medali untuk setiap wilayah dalam filter yang ditentukan.
     """
-    dataset = clear_data()
-    dataset = dataset[np.logical_and(dataset["Year"] >= from_year, dataset["Year"] <= to_year)]
+    return query_backend().subset_and_display_medal(region, season, from_year, to_year)
 
-    if season == "All Season":
-        data = dataset.copy()
-    else:
-        data = dataset[dataset["Season"] == season]
+def medal_time_series(region, from_year, to_year, season="All Season"):
+    """
+    Menghitung jumlah medali per tahun untuk satu wilayah dalam rentang tahun tertentu.
 
-    newdata = medal_data(data)
+    Args:
+    region (str): Wilayah yang dianalisis.
+    from_year (int): Tahun awal rentang.
+    to_year (int): Tahun akhir rentang.
+    season (str): Musim yang dianalisis. Defaultnya adalah "All Season".
 
-    if region == "All":
-        display_medal = newdata.copy()
+    Returns:
+    DataFrame: Baris `plot_data()` untuk wilayah dan rentang tahun tersebut.
+    """
+    cube = _aggregate("medal_cube", _build_medal_cube)
+    years = cube["years"]
+    start = np.searchsorted(years, from_year, side="left")
+    stop = max(start, np.searchsorted(years, to_year, side="right"))
+
+    position = cube["regions"].get_indexer([region])[0]
+    if position < 0:
+        cells = np.zeros((0, 4), dtype=np.int64)
     else:
-        display_medal = newdata[newdata["Region"] == region]
-
-    return display_medal
+        cells = _select_season(cube["counts"][position, start:stop], cube["seasons"], season, axis=1)
+
+    present = cells[:, _ROWS] > 0
+    series = pd.DataFrame({
+        "Year": years[start:stop][present],
+        "region": pd.Categorical([region] * int(present.sum()), categories=cube["regions"]),
+        "medal_Gold": cells[present, _GOLD],
+        "medal_Silver": cells[present, _SILVER],
+        "medal_Bronze": cells[present, _BRONZE],
+    })
+    series["total"] = series["medal_Gold"] + series["medal_Silver"] + series["medal_Bronze"]
+    return series
 
 def plot_data():
     """
@@ -91,16 +1039,76 @@ def plot_data():
     Returns:
     DataFrame: DataFrame yang menampilkan total medali untuk setiap tahun dan wilayah.
     """
-    data = clear_data()
-    dummies = pd.get_dummies(data , columns=["Medal"] , prefix="medal")
+    cube = _aggregate("medal_cube", _build_medal_cube)
+    # Sumbu tahun di depan agar urutan hasil sama dengan groupby(["Year", "region"]).
+    cells = _select_season(cube["counts"], cube["seasons"], "All Season", axis=2).transpose(1, 0, 2)
+    year_index, region_index = np.nonzero(cells[:, :, _ROWS])
+    present = cells[year_index, region_index]
+
+    dataper_y = pd.DataFrame({
+        "Year": cube["years"][year_index],
+        "region": pd.Categorical.from_codes(region_index, dtype=pd.CategoricalDtype(cube["regions"])),
+        "medal_Gold": present[:, _GOLD],
+        "medal_Silver": present[:, _SILVER],
+        "medal_Bronze": present[:, _BRONZE],
+    })
+    dataper_y["total"] = dataper_y["medal_Gold"] + dataper_y["medal_Silver"] + dataper_y["medal_Bronze"]
+    return dataper_y
 
-    medall_year = dummies.drop_duplicates(subset=["Name" ,"Year" , "Sport" , "Event" , "NOC" , "Season"])
+# Kolom yang dibutuhkan untuk membangun tabel dimensi Olimpiade.
+_GAMES_COLUMNS = ["Year", "Season", "City", "Games", "region", "Sport", "Name"]
 
-    total = medall_year.groupby(["Year" , "region"])[["medal_Gold"	,"medal_Silver" , "medal_Bronze"]].sum()
-    dataper_y = total.reset_index()
+def _build_games_dimension():
+    """
+    Membangun tabel dimensi per edisi Olimpiade dalam satu groupby atas dataset.
 
-    dataper_y["total"] = dataper_y["medal_Gold"] + dataper_y["medal_Silver"] + dataper_y["medal_Bronze"]
-    return dataper_y
+    Groupby pertama meringkas dataset menjadi kombinasi unik (tahun, musim, kota,
+    edisi, wilayah, cabang olahraga) dengan urutan kemunculan pertama. Semua agregat
+    lain dihitung dari ringkasan kecil itu.
+
+    Returns:
+    dict: Tabel per edisi dan kota tuan rumah ("games"), jumlah negara per tahun
+        ("year_nations"), dan pasangan unik (tahun, cabang olahraga) ("year_sports").
+    """
+    data = clear_data(_GAMES_COLUMNS)
+    keys = ["Year", "Season", "City", "Games", "region", "Sport"]
+    combos = data.groupby(keys, observed=True, sort=False, dropna=False)["Name"].count().reset_index()
+
+    games = combos.groupby(["Year", "Season", "City", "Games"], observed=True, sort=False, dropna=False).agg(
+        athletes=("Name", "sum"),
+        nations=("region", "nunique"),
+        sports=("Sport", "nunique"),
+    ).reset_index()
+    games = games.sort_values("Year", kind="stable", ignore_index=True)
+
+    year_nations = combos.groupby("Year")["region"].nunique()
+    year_sports = combos[["Year", "Sport"]].dropna().drop_duplicates().sort_values("Year", kind="stable", ignore_index=True)
+
+    return {"games": games, "year_nations": year_nations, "year_sports": year_sports}
+
+def games_dimension():
+    """
+    Mengambil tabel dimensi per edisi Olimpiade.
+
+    Returns:
+    DataFrame: Satu baris per edisi dan kota tuan rumah, dengan kolom Year, Season, City, Games,
+        athletes (jumlah entri atlet), nations (jumlah wilayah), dan sports (jumlah cabang olahraga).
+    """
+    return _aggregate("games_dimension", _build_games_dimension)["games"]
+
+def _hosting_count(column):
+    """
+    Menghitung di berapa tahun setiap nilai `column` muncul sebagai tuan rumah, sesuai urutan kemunculan pertamanya.
+
+    Args:
+    column (str): "City" atau "Season".
+
+    Returns:
+    Series: Jumlah tahun per nilai.
+    """
+    games = games_dimension()
+    pairs = games[["Year", column]].dropna().drop_duplicates()
+    return pairs.groupby(column, observed=True, sort=False).size()
 
 
 def country_game():
@@ -110,9 +1118,9 @@ def country_game():
     Returns:
     DataFrame: DataFrame yang menampilkan jumlah permainan Olimpiade untuk setiap negara.
     """
-    data = clear_data()
+    data = clear_data(["NOC", "Games"])
 
-    games_num = data.groupby(["NOC"])["Games"].count().reset_index()
+    games_num = data.groupby(["NOC"], observed=True)["Games"].count().reset_index()
     games_num = games_num.sort_values(by="Games" , ascending=False , ignore_index=True)
     return games_num
 
@@ -123,9 +1131,13 @@ def participant_data():
     Returns:
     DataFrame: DataFrame yang menampilkan jumlah negara yang berpartisipasi setiap tahun.
     """
-    data = clear_data()
+    stored = _from_store("participant_data")
+    if stored is not None:
+        return stored
 
-    participant  = data.groupby(["Year"])["region"].nunique().to_frame().reset_index().sort_values(by="Year")
+    year_nations = _aggregate("games_dimension", _build_games_dimension)["year_nations"]
+
+    participant = year_nations.to_frame().reset_index()
     participant.columns = ["Year" , "number country"]
     return participant
 
@@ -136,25 +1148,12 @@ def city_data():
     Returns:
     DataFrame: DataFrame yang menampilkan jumlah permainan Olimpiade untuk setiap kota setiap tahun.
     """
-    data = clear_data()
-    
-    city = data.groupby("Year")["City"].unique()
-    uniq_city = city.to_frame().reset_index()
-
-    city_dict = {}
-    all_city = []
+    stored = _from_store("city_data")
+    if stored is not None:
+        return stored
 
-    for i , val in uniq_city.iterrows():
-        
-        for k in val["City"]:
-
-            all_city.append(k)
-            
-            if ( k in city_dict.keys()):
-                city_dict[k] = city_dict[k] + 1
-            else:
-                city_dict[k] = 1
-    city_pd = pd.DataFrame({"city" : [i for i in city_dict.keys()] , "num" : [city_dict[i] for i in city_dict.keys()]})
+    city = _hosting_count("City")
+    city_pd = pd.DataFrame({"city" : city.index.tolist() , "num" : city.to_numpy()})
 
     return city_pd
 
@@ -166,24 +1165,12 @@ def season_data():
     Returns:
     DataFrame: DataFrame yang menampilkan jumlah permainan Olimpiade untuk setiap musim setiap tahun.
     """
-    data = clear_data()
-
-    season = data.groupby("Year")["Season"].unique().to_frame().reset_index()
-    season_dict = {}
-    all_season = []
-
-    for i , val in season.iterrows():
-        
-        for k in val["Season"]:
-
-            all_season.append(k)
-            
-            if ( k in season_dict.keys()):
-                season_dict[k] = season_dict[k] + 1
-            else:
-                season_dict[k] = 1
+    stored = _from_store("season_data")
+    if stored is not None:
+        return stored
 
-    season_pd = pd.DataFrame({"season" : [i for i in season_dict.keys()] , "num" : [season_dict[i] for i in season_dict.keys()]})
+    season = _hosting_count("Season")
+    season_pd = pd.DataFrame({"season" : season.index.tolist() , "num" : season.to_numpy()})
 
     return season_pd
 
@@ -194,21 +1181,109 @@ def sport_data_count():
     Returns:
     tuple: Tuple berisi DataFrame yang menampilkan jumlah cabang olahraga yang berpartisipasi setiap tahun, dan DataFrame yang menampilkan daftar cabang olahraga yang berpartisipasi setiap tahun.
     """
-    data = clear_data()
-    sport_data = data.groupby(["Year"])['Sport'].nunique().to_frame().reset_index()
-    sport_data_value = data.groupby(["Year"])['Sport'].unique().to_frame().reset_index()
+    stored = _from_store("sport_data_count")
+    if stored is not None:
+        return stored
+
+    year_sports = _aggregate("games_dimension", _build_games_dimension)["year_sports"]
+    sport_data = year_sports.groupby("Year")["Sport"].count().to_frame().reset_index()
+    sport_data_value = year_sports.groupby("Year")["Sport"].unique().to_frame().reset_index()
 
     return sport_data, sport_data_value
 
+def _build_athlete_per_country():
+    data = clear_data(["region"]).assign(athlete=_aggregate("keys", _build_keys)["athlete"])
+    athlete_country = data.groupby("region", observed=True)["athlete"].nunique().to_frame().reset_index()
+    athlete_country.columns = ["Region" , "Total Athlete"]
+    return athlete_country
+
 def athlete_per_country_data(sort = "Region" , ascending_pram = True):
 
-    data = clear_data()
-    athlete_country = data.groupby("region")["Name"].nunique().to_frame().reset_index()
-    athlete_country.columns = ["Region" , "Total Athlete"]
+    athlete_country = _aggregate("athlete_per_country", _build_athlete_per_country)
     final = athlete_country.sort_values(ascending=ascending_pram , by=sort).reset_index().drop("index" , axis=1)
 
     return final
 
+def paginate(frame, page=1, page_size=PAGE_SIZE, sort=None, ascending=True, rows=None):
+    """
+    Mengambil satu halaman baris dari DataFrame, opsional setelah diurutkan.
+
+    Hanya kolom pengurut dan baris di halaman yang diminta yang disalin, bukan seluruh hasil filter.
+
+    Args:
+    frame (DataFrame): Data sumber.
+    page (int): Nomor halaman, dimulai dari 1.
+    page_size (int): Jumlah baris per halaman.
+    sort (str): Kolom pengurut. None berarti urutan asli.
+    ascending (bool): Urutan naik atau turun.
+    rows (ndarray): Posisi baris hasil filter di `frame`. None berarti semua baris.
+
+    Returns:
+    tuple: Jumlah total baris hasil filter dan DataFrame halaman tersebut. Indeksnya adalah
+        posisi baris dalam hasil yang sudah diurutkan.
+    """
+    if rows is None:
+        rows = np.arange(len(frame))
+    total = len(rows)
+
+    if sort is not None:
+        keys = frame[sort].take(rows).reset_index(drop=True)
+        order = keys.sort_values(ascending=ascending, kind="stable", na_position="last").index.to_numpy()
+        rows = rows[order]
+
+    offset = (max(page, 1) - 1) * page_size
+    window = frame.take(rows[offset:offset + page_size])
+    window.index = pd.RangeIndex(offset, offset + len(window))
+
+    return total, window
+
+def athlete_per_country_page(sort="Region", ascending_pram=True, page=1, page_size=PAGE_SIZE):
+    """
+    Mengambil satu halaman jumlah atlet unik per wilayah.
+
+    Args:
+    sort (str): Kolom pengurut ("Region" atau "Total Athlete").
+    ascending_pram (bool): Urutan naik atau turun.
+    page (int): Nomor halaman, dimulai dari 1.
+    page_size (int): Jumlah baris per halaman.
+
+    Returns:
+    tuple: Jumlah total wilayah dan DataFrame halaman tersebut.
+    """
+    athlete_country = _aggregate("athlete_per_country", _build_athlete_per_country)
+    return paginate(athlete_country, page, page_size, sort=sort, ascending=ascending_pram)
+
+def sport_data_count_page(page=1, page_size=PAGE_SIZE, sort=None, ascending=True):
+    """
+    Mengambil satu halaman jumlah cabang olahraga per tahun.
+
+    Args:
+    page (int): Nomor halaman, dimulai dari 1.
+    page_size (int): Jumlah baris per halaman.
+    sort (str): Kolom pengurut ("Year" atau "Sport"). None berarti urutan tahun.
+    ascending (bool): Urutan naik atau turun.
+
+    Returns:
+    tuple: Jumlah total tahun dan DataFrame halaman tersebut.
+    """
+    return paginate(sport_data_count()[0], page, page_size, sort=sort, ascending=ascending)
+
+def _athlete_rows(fromm, too, country, sport):
+    """
+    Mencari posisi baris atlet berdasarkan rentang tahun, negara, dan cabang olahraga.
+
+    Returns:
+    ndarray: Posisi baris terurut di `clear_data()`.
+    """
+    start, stop = _year_rows(fromm, too)
+    rows = _posting(country, sport)
+
+    if rows is None:
+        return np.arange(start, stop)
+
+    # Posting list terurut, jadi rentang tahun cukup dicari dengan pencarian biner.
+    return rows[np.searchsorted(rows, start):np.searchsorted(rows, stop)]
+
 def total_athlete(fromm, too, country, sport):
     """
     Memfilter data atlet berdasarkan rentang tahun, negara, dan cabang olahraga.
@@ -222,21 +1297,158 @@ def total_athlete(fromm, too, country, sport):
     Returns:
     DataFrame: DataFrame yang berisi atlet yang sesuai dengan kriteria filtrasi.
     """
-    data = clear_data()
+    return query_backend().total_athlete(fromm, too, country, sport)
 
-    subset_year = data[np.logical_and(data["Year"] >= fromm, data["Year"] <= too)]
+def total_athlete_page(fromm, too, country, sport, page=1, page_size=PAGE_SIZE, sort=None, ascending=True):
+    """
+    Mengambil satu halaman atlet berdasarkan rentang tahun, negara, dan cabang olahraga.
 
-    if country == "All":
-        after_country = subset_year.copy()
-    else:
-        after_country = subset_year[subset_year["region"] == country]
+    Args:
+    fromm (int): Tahun awal rentang.
+    too (int): Tahun akhir rentang.
+    country (str): Negara yang ingin difilter.
+    sport (str): Cabang olahraga yang ingin difilter.
+    page (int): Nomor halaman, dimulai dari 1.
+    page_size (int): Jumlah baris per halaman.
+    sort (str): Kolom pengurut. None berarti urutan tahun.
+    ascending (bool): Urutan naik atau turun.
 
-    if sport == "All":
-        after_sport = after_country.copy()
+    Returns:
+    tuple: Jumlah total baris hasil filter dan DataFrame halaman tersebut.
+    """
+    return paginate(clear_data(), page, page_size, sort=sort, ascending=ascending,
+                    rows=_athlete_rows(fromm, too, country, sport))
+
+def total_athlete_count(fromm, too, country, sport):
+    """
+    Menghitung jumlah atlet unik berdasarkan rentang tahun, negara, dan cabang olahraga.
+
+    Args:
+    fromm (int): Tahun awal rentang. None berarti tanpa batas bawah.
+    too (int): Tahun akhir rentang. None berarti tanpa batas atas.
+    country (str): Negara yang ingin difilter.
+    sport (str): Cabang olahraga yang ingin difilter.
+
+    Returns:
+    int: Jumlah atlet unik (berdasarkan ID, bukan nama).
+    """
+    keys = _aggregate("keys", _build_keys)
+    # Kunci atlet padat, jadi himpunan atlet cukup berupa bitmap tanpa pengurutan.
+    if country == "All" and sport == "All":
+        start, stop = _year_rows(fromm, too)
+        athletes = keys["athlete"][start:stop]
     else:
-        after_sport = after_country[after_country["Sport"] == sport]
+        athletes = keys["athlete"][_athlete_rows(fromm, too, country, sport)]
+    seen = np.zeros(len(keys["ids"]), dtype=bool)
+    seen[athletes] = True
+    return int(np.count_nonzero(seen))
+
+# Kolom yang dibutuhkan untuk membangun buku besar medali atlet.
+_LEDGER_COLUMNS = ["Name", "Sport", "Medal", "Year"]
+
+def _build_medal_ledger():
+    """
+    Membangun buku besar medali per (cabang olahraga, atlet, tahun) dengan total berjalan.
+
+    Baris diurutkan berdasarkan cabang olahraga, atlet, lalu tahun. Kolom total berjalan
+    berisi jumlah medali atlet di cabang olahraga itu sampai dengan tahun baris tersebut.
 
-    return after_sport
+    Returns:
+    dict: Kategori nama dan cabang olahraga, kode nama per kunci atlet ("name_of"), batas irisan
+        per cabang olahraga ("sport_bounds"), serta array "sport", "athlete" (kunci atlet), "year",
+        dan total berjalan "gold", "silver", "bronze".
+    """
+    data = clear_data(_LEDGER_COLUMNS)
+    keys = _aggregate("keys", _build_keys)
+    medal_codes = data["Medal"].cat.codes.to_numpy()
+    entries = pd.DataFrame({
+        "sport": data["Sport"].cat.codes.to_numpy(),
+        "athlete": keys["athlete"],
+        "year": data["Year"].to_numpy(),
+        "gold": medal_codes == 0,
+        "silver": medal_codes == 1,
+        "bronze": medal_codes == 2,
+    })
+    entries = entries[(entries["sport"] >= 0) & (keys["names"][keys["athlete"]] >= 0)]
+    ledger = entries.groupby(["sport", "athlete", "year"], sort=True)[["gold", "silver", "bronze"]].sum().reset_index()
+
+    sport = ledger["sport"].to_numpy()
+    athlete = ledger["athlete"].to_numpy()
+    counts = ledger[["gold", "silver", "bronze"]].to_numpy(dtype=np.int32)
+
+    # Total berjalan per (cabang olahraga, atlet): cumsum global dikurangi cumsum sebelum awal kelompok.
+    running = np.cumsum(counts, axis=0)
+    starts = np.ones(len(ledger), dtype=bool)
+    starts[1:] = (sport[1:] != sport[:-1]) | (athlete[1:] != athlete[:-1])
+    group_start = np.maximum.accumulate(np.where(starts, np.arange(len(ledger)), 0))
+    before = np.vstack([np.zeros((1, 3), dtype=running.dtype), running])[group_start]
+    running = running - before
+
+    sports = data["Sport"].cat.categories
+    return {
+        "names": data["Name"].cat.categories,
+        "name_of": keys["names"],
+        "sports": sports,
+        "sport_bounds": np.searchsorted(sport, np.arange(len(sports) + 1)),
+        "sport": sport,
+        "athlete": athlete,
+        "year": ledger["year"].to_numpy(),
+        "gold": running[:, 0],
+        "silver": running[:, 1],
+        "bronze": running[:, 2],
+    }
+
+def _ledger_top(ledger, start, stop, to_year, k):
+    """
+    Mengambil k atlet dengan medali terbanyak dari irisan buku besar, sampai dengan tahun tertentu.
+
+    Args:
+    ledger (dict): Buku besar dari `_build_medal_ledger`.
+    start (int): Awal irisan buku besar.
+    stop (int): Akhir irisan buku besar.
+    to_year (int): Tahun akhir (inklusif), atau None untuk semua tahun.
+    k (int): Jumlah atlet yang diambil.
+
+    Returns:
+    DataFrame: Kolom Name, Sport, medal_Gold, medal_Silver, medal_Bronze, dan Total Medal.
+    """
+    sport = ledger["sport"][start:stop]
+    athlete = ledger["athlete"][start:stop]
+    valid = np.ones(stop - start, dtype=bool) if to_year is None else ledger["year"][start:stop] <= to_year
+
+    # Baris terakhir yang valid untuk setiap (cabang olahraga, atlet) menyimpan totalnya.
+    same_group_next = np.zeros(stop - start, dtype=bool)
+    same_group_next[:-1] = (sport[1:] == sport[:-1]) & (athlete[1:] == athlete[:-1]) & valid[1:]
+    last = np.flatnonzero(valid & ~same_group_next) + start
+
+    gold, silver, bronze = ledger["gold"][last], ledger["silver"][last], ledger["bronze"][last]
+    total = gold + silver + bronze
+
+    # Ambil semua kandidat yang nilainya setidaknya sama dengan nilai ke-k, termasuk yang seri.
+    if len(total) > k:
+        threshold = total[np.argpartition(-total, k - 1)[:k]].min()
+        chosen = np.flatnonzero(total >= threshold)
+    else:
+        chosen = np.arange(len(total))
+    # Urutkan kandidat seperti hasil groupby(["Name", "Sport"]) sebelum diurutkan berdasarkan total;
+    # atlet berbeda dengan nama yang sama diurutkan berdasarkan kuncinya.
+    athlete = ledger["athlete"][last[chosen]]
+    name_codes = ledger["name_of"][athlete]
+    chosen = chosen[np.lexsort((ledger["sport"][last[chosen]], athlete, name_codes))]
+    # Urutkan berdasarkan total menurun; yang seri tetap dalam urutan groupby di atas, jadi atlet
+    # yang terpilih di batas ke-k sama dengan `sort_values` stabil pada hasil groupby.
+    chosen = chosen[np.lexsort((np.arange(len(chosen)), -total[chosen]))][:k]
+    rows = last[chosen]
+
+    top = pd.DataFrame({
+        "Name": pd.Categorical.from_codes(ledger["name_of"][ledger["athlete"][rows]], dtype=pd.CategoricalDtype(ledger["names"])),
+        "Sport": pd.Categorical.from_codes(ledger["sport"][rows], dtype=pd.CategoricalDtype(ledger["sports"])),
+        "medal_Gold": gold[chosen],
+        "medal_Silver": silver[chosen],
+        "medal_Bronze": bronze[chosen],
+        "Total Medal": total[chosen],
+    })
+    return top
 
 def top_medal():
     """
@@ -245,18 +1457,18 @@ def top_medal():
     Returns:
     DataFrame: DataFrame yang berisi 20 atlet teratas berdasarkan jumlah total medali yang dimenangkan.
     """
-    athlete = clear_data()
+    def build():
+        ledger = _aggregate("medal_ledger", _build_medal_ledger)
+        return _ledger_top(ledger, 0, len(ledger["sport"]), None, 20)
 
-    athlete = pd.get_dummies(athlete, prefix="medal", columns=["Medal"])
-    athlete["Total Medal"] = athlete["medal_Bronze"] + athlete["medal_Gold"] + athlete["medal_Silver"]
-    total_medal_athlete = athlete.groupby(["Name", "Sport"])[["medal_Gold", "medal_Silver", "medal_Bronze","Total Medal"]].sum().sort_values(ascending=False, by="Total Medal").reset_index()
-
-    return total_medal_athlete.head(20)
+    return _aggregate("top_medal", build).copy()
 
 def data_sport_top(sport, too):
     """
     Memfilter data atlet berdasarkan cabang olahraga dan tahun, kemudian menghitung 30 atlet teratas berdasarkan jumlah total medali yang dimenangkan.
 
+    Hasilnya di-cache per (sport, too) di RESULT_CACHE, jadi tabel dan grafiknya memakai hasil yang sama.
+
     Args:
     sport (str): Cabang olahraga yang ingin difilter.
     too (int): Tahun akhir rentang.
@@ -264,13 +1476,31 @@ def data_sport_top(sport, too):
     Returns:
     DataFrame: DataFrame yang berisi 30 atlet teratas berdasarkan jumlah total medali yang dimenangkan.
     """
-    data = clear_data()
-    medall_ttly = pd.get_dummies(data, prefix="medal", columns=["Medal"])
-    medall_ttly["Total Medal"] = medall_ttly["medal_Bronze"] + medall_ttly["medal_Gold"] + medall_ttly["medal_Silver"]
-    selecet_sport = medall_ttly[np.logical_and(medall_ttly["Sport"] == sport, medall_ttly["Year"] <= too)]
-    group_select = selecet_sport.groupby(["Name", "Sport"])[["medal_Gold", "medal_Silver", "medal_Bronze","Total Medal"]].sum().sort_values(ascending=False, by="Total Medal").reset_index()
+    def build():
+        ledger = _aggregate("medal_ledger", _build_medal_ledger)
+        position = ledger["sports"].get_indexer([sport])[0]
+        if position < 0:
+            return _ledger_top(ledger, 0, 0, too, 30)
+        bounds = ledger["sport_bounds"]
+        return _ledger_top(ledger, bounds[position], bounds[position + 1], too, 30)
 
-    return group_select.head(30)
+    return RESULT_CACHE.get_or_create(("data_sport_top", fingerprint(), sport, too), build).copy()
+
+def _build_sex_counts():
+    """
+    Menghitung jumlah peserta laki-laki dan perempuan per (cabang olahraga, tahun).
+
+    Returns:
+    DataFrame: Kolom Sport, Year, Male, dan Female, terurut berdasarkan cabang olahraga lalu tahun.
+    """
+    data = clear_data(["Year", "Sex", "Sport"])
+    counts = data.groupby(["Sport", "Year", "Sex"], observed=True).size().unstack("Sex", fill_value=0)
+    return pd.DataFrame({
+        "Sport": counts.index.get_level_values("Sport"),
+        "Year": counts.index.get_level_values("Year"),
+        "Male": counts["M"].to_numpy() if "M" in counts else 0,
+        "Female": counts["F"].to_numpy() if "F" in counts else 0,
+    })
 
 def sex_data():
     """
@@ -279,10 +1509,12 @@ def sex_data():
     Returns:
     DataFrame: DataFrame yang menampilkan jumlah peserta Olimpiade berdasarkan jenis kelamin setiap tahun.
     """
-    data = clear_data()
-    dummies_s = pd.get_dummies(data, columns=["Sex"], prefix="Type")
-    sex_compotation = dummies_s.groupby("Year")[["Type_M", "Type_F"]].sum().reset_index()
-    sex_compotation.columns = ["Year", "Male", "Female"]
+    stored = _from_store("sex_data")
+    if stored is not None:
+        return stored
+
+    counts = _aggregate("sex_counts", _build_sex_counts)
+    sex_compotation = counts.groupby("Year")[["Male", "Female"]].sum().reset_index()
     sex_compotation["Total"] = sex_compotation["Male"] + sex_compotation["Female"]
     return sex_compotation
 
@@ -296,13 +1528,7 @@ def sex_data_sport(sport):
     Returns:
     DataFrame: DataFrame yang menampilkan jumlah peserta Olimpiade berdasarkan jenis kelamin setiap tahun untuk cabang olahraga tertentu.
     """
-    data = clear_data()
-    data = data[data["Sport"] == sport]
-    dummies_s = pd.get_dummies(data, columns=["Sex"], prefix="Type")
-    sex_compotation = dummies_s.groupby("Year")[["Type_M", "Type_F"]].sum().reset_index()
-    sex_compotation.columns = ["Year", "Male", "Female"]
-    sex_compotation["Total"] = sex_compotation["Male"] + sex_compotation["Female"]
-    return sex_compotation
+    return query_backend().sex_data_sport(sport)
 
 def data_height_vs_weight(sport, region):
     """
@@ -315,16 +1541,26 @@ def data_height_vs_weight(sport, region):
     Returns:
     DataFrame: DataFrame yang berisi data atlet sesuai dengan kriteria filtrasi.
     """
-    data = clear_data()
+    return query_backend().data_height_vs_weight(sport, region)
 
-    if region == "All":
-        data = data.copy()
-    else:
-        data = data[data["region"] == region]
+def athlete_measurements(sport, region):
+    """
+    Mengambil tinggi dan berat badan unik per atlet untuk cabang olahraga dan wilayah tertentu.
+
+    Baris dengan tinggi atau berat kosong dibuang, dan atlet yang ikut beberapa edisi
+    hanya dihitung sekali.
+
+    Args:
+    sport (str): Cabang olahraga yang ingin difilter.
+    region (str): Wilayah yang ingin difilter.
 
-    sport_subset = data[data["Sport"] == sport]
+    Returns:
+    DataFrame: Kolom ID, Sex, Height, dan Weight, satu baris per atlet.
+    """
+    data = data_height_vs_weight(sport=sport, region=region)
+    measured = data[["ID", "Sex", "Height", "Weight"]].dropna(subset=["Height", "Weight"])
 
-    return sport_subset
+    return measured.drop_duplicates(subset="ID", ignore_index=True)
 
 def data_games_count():
     """
@@ -333,9 +1569,120 @@ def data_games_count():
     Returns:
     DataFrame: DataFrame yang menampilkan jumlah atlet yang berpartisipasi dalam setiap edisi Olimpiade.
     """
-    data = clear_data()
-    games_count = data.groupby("Games")["Name"].count()
+    stored = _from_store("games_count")
+    if stored is not None:
+        return stored
+
+    games_count = games_dimension().groupby("Games", observed=True)["athletes"].sum()
     games_count_df = games_count.to_frame().reset_index()
     games_count_df.columns = ["Games", "Participant Count"]
 
     return games_count_df
+
+class PandasBackend:
+    """
+    Backend query bawaan di atas dataset bersih di memori.
+
+    Setiap backend menyediakan method yang sama dengan fungsi publiknya: `subset_and_display_medal`,
+    `total_athlete`, `sex_data_sport`, dan `data_height_vs_weight`, dengan hasil yang identik.
+    """
+
+    name = "pandas"
+
+    def subset_and_display_medal(self, region, season, from_year, to_year):
+        """
+        Tabel medali per wilayah dari selisih dua irisan kumulatif kubus medali, jadi biayanya
+        sebanding dengan jumlah wilayah, bukan jumlah baris dataset.
+        """
+        cube = _aggregate("medal_cube", _build_medal_cube)
+        start = 0 if from_year is None else np.searchsorted(cube["years"], from_year, side="left")
+        stop = len(cube["years"]) if to_year is None else np.searchsorted(cube["years"], to_year, side="right")
+        stop = max(start, stop)
+
+        window = cube["cumulative"][:, stop] - cube["cumulative"][:, start]
+        window = _select_season(window, cube["seasons"], season, axis=1)
+
+        present = window[:, _ROWS] > 0
+        index = pd.CategoricalIndex(cube["regions"][present], categories=cube["regions"], name="region")
+        medals = pd.DataFrame({
+            "medal_Gold": window[present, _GOLD],
+            "medal_Silver": window[present, _SILVER],
+            "medal_Bronze": window[present, _BRONZE],
+        }, index=index)
+        newdata = _rank_medals(medals)
+
+        if region == "All":
+            display_medal = newdata.copy()
+        else:
+            display_medal = newdata[newdata["Region"] == region]
+
+        return display_medal
+
+    def total_athlete(self, fromm, too, country, sport):
+        """
+        Baris atlet dari irisan tahun dan posting list wilayah/cabang olahraga.
+        """
+        data = clear_data()
+
+        if country == "All" and sport == "All":
+            start, stop = _year_rows(fromm, too)
+            return data.iloc[start:stop]
+
+        return data.take(_athlete_rows(fromm, too, country, sport))
+
+    def sex_data_sport(self, sport):
+        """
+        Komposisi jenis kelamin per tahun dari tabel hitungan (cabang olahraga, tahun).
+        """
+        counts = _aggregate("sex_counts", _build_sex_counts)
+        sex_compotation = counts.loc[counts["Sport"] == sport, ["Year", "Male", "Female"]].reset_index(drop=True)
+        sex_compotation["Total"] = sex_compotation["Male"] + sex_compotation["Female"]
+        return sex_compotation
+
+    def data_height_vs_weight(self, sport, region):
+        """
+        Baris atlet dari posting list wilayah/cabang olahraga.
+        """
+        data = clear_data()
+        rows = _posting(region, sport)
+
+        if rows is None:
+            return data
+
+        sport_subset = data.take(rows)
+
+        return sport_subset
+
+_PANDAS = PandasBackend()
+
+def query_backend(name=None):
+    """
+    Mengambil backend query. Backend SQL dibangun sekali per sidik jari dataset.
+
+    Args:
+    name (str): "pandas", "sqlite", atau "duckdb". Defaultnya BACKEND.
+
+    Returns:
+    object: Backend dengan method `subset_and_display_medal`, `total_athlete`, `sex_data_sport`,
+        dan `data_height_vs_weight`.
+    """
+    name = name or BACKEND
+    if name == "pandas":
+        return _PANDAS
+
+    import sqlbackend
+
+    return _aggregate(f"backend/{name}", lambda: sqlbackend.SQLBackend(name))
+
+# Agregat yang dibangun oleh `precompute`: nama -> builder. Setiap builder hanya membaca
+# dataset bersih, jadi semuanya bisa dijalankan paralel.
+_PRECOMPUTE = {
+    "year_index": _build_year_index,
+    "keys": _build_keys,
+    "postings": _build_postings,
+    "medal_cube": _build_medal_cube,
+    "games_dimension": _build_games_dimension,
+    "athlete_per_country": _build_athlete_per_country,
+    "medal_ledger": _build_medal_ledger,
+    "sex_counts": _build_sex_counts,
+}
@@ -0,0 +1,282 @@
+import argparse
+import atexit
+import json
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import preprocessing
+import helper
+
+# Set OLYMPICS_PREWARM=1 agar app mengisi cache untuk state widget default di thread latar saat mulai.
+ENABLED = os.environ.get("OLYMPICS_PREWARM", "0") == "1"
+
+# Jumlah thread pemanasan. Satu sudah cukup: pekerjaannya berebut GIL dengan sesi yang sedang dilayani.
+WORKERS = int(os.environ.get("OLYMPICS_PREWARM_WORKERS", 1))
+
+# Jumlah wilayah dan cabang olahraga terpopuler dari log akses yang ikut dipanaskan.
+TOP_N = int(os.environ.get("OLYMPICS_PREWARM_TOP", 5))
+
+# Log akses: hitungan pilihan wilayah dan cabang olahraga, digabung oleh semua proses server.
+ACCESS_LOG_PATH = os.path.join(preprocessing.DATA_DIR, "access_log.json")
+
+# Rentang tahun default slider di app.
+DEFAULT_YEARS = (1988, 2015)
+
+# Selang minimum antara dua penulisan log akses, dalam detik.
+FLUSH_SECONDS = 30
+
+_STATE = {"executor": None, "jobs": 0, "done": 0, "failed": 0, "started": None, "finished": None}
+_STATE_LOCK = threading.Lock()
+
+# Jumlah rerun yang sedang berjalan. Pekerja pemanasan menunggu sampai nol sebelum setiap tugas.
+_LIVE = {"active": 0}
+_IDLE = threading.Condition()
+
+# Hitungan akses yang belum ditulis ke ACCESS_LOG_PATH.
+_PENDING = {"counts": {"region": Counter(), "sport": Counter()}, "flushed": time.monotonic()}
+_LOG_LOCK = threading.Lock()
+
+
+@contextmanager
+def live_request():
+    """
+    Menandai rerun yang sedang melayani pengguna. Selama ada rerun aktif, pekerja pemanasan
+    tidak memulai tugas baru; tugas yang sedang berjalan tetap selesai dan hasilnya ikut dipakai
+    rerun tersebut lewat penggabungan panggilan di `preprocessing` dan cache figure.
+    """
+    with _IDLE:
+        _LIVE["active"] += 1
+    try:
+        yield
+    finally:
+        with _IDLE:
+            _LIVE["active"] -= 1
+            if _LIVE["active"] == 0:
+                _IDLE.notify_all()
+
+
+def _wait_idle():
+    with _IDLE:
+        _IDLE.wait_for(lambda: _LIVE["active"] == 0)
+
+
+def record(kind, value):
+    """
+    Mencatat satu pilihan widget di log akses. Hitungan ditulis ke disk paling sering sekali per FLUSH_SECONDS.
+
+    Tidak melakukan apa-apa bila pemanasan tidak diaktifkan.
+
+    Args:
+    kind (str): "region" atau "sport".
+    value (str): Nilai yang dipilih. "All" tidak dicatat karena sudah termasuk state default.
+    """
+    if not ENABLED or value == "All":
+        return
+    with _LOG_LOCK:
+        _PENDING["counts"][kind][value] += 1
+        due = time.monotonic() - _PENDING["flushed"] >= FLUSH_SECONDS
+    if due:
+        flush()
+
+
+def read_log():
+    """
+    Membaca log akses yang tersimpan.
+
+    Returns:
+    dict: "region" dan "sport", masing-masing dict nilai -> jumlah akses. Kosong bila belum ada.
+    """
+    try:
+        with open(ACCESS_LOG_PATH) as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        stored = {}
+    return {kind: dict(stored.get(kind, {})) for kind in ("region", "sport")}
+
+
+def flush():
+    """
+    Menambahkan hitungan yang tertunda ke log akses di disk. Beberapa proses bisa menulis
+    bersamaan; penulisan atomik menjaga file tetap valid, dan hitungan yang sesekali hilang
+    tidak masalah untuk memilih nilai terpopuler.
+    """
+    with _LOG_LOCK:
+        pending = _PENDING["counts"]
+        _PENDING["counts"] = {"region": Counter(), "sport": Counter()}
+        _PENDING["flushed"] = time.monotonic()
+    if not any(pending.values()):
+        return
+
+    log = read_log()
+    for kind, counts in pending.items():
+        for value, count in counts.items():
+            log[kind][value] = log[kind].get(value, 0) + count
+    tmp_path = f"{ACCESS_LOG_PATH}.tmp-{os.getpid()}"
+    with open(tmp_path, "w") as f:
+        json.dump(log, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, ACCESS_LOG_PATH)
+
+
+atexit.register(flush)
+
+
+def popular(kind, n=TOP_N):
+    """
+    Mengambil nilai terpopuler dari log akses yang masih ada di dataset.
+
+    Args:
+    kind (str): "region" atau "sport".
+    n (int): Jumlah nilai.
+
+    Returns:
+    list: Nilai terurut dari yang paling sering diakses.
+    """
+    options = set(helper.region_options() if kind == "region" else helper.sport_options())
+    counts = read_log()[kind]
+    ranked = sorted((value for value in counts if value in options), key=lambda value: (-counts[value], value))
+    return ranked[:n]
+
+
+def jobs():
+    """
+    Menyusun daftar pemanasan: figure pra-render, state widget default setiap halaman, lalu wilayah
+    dan cabang olahraga terpopuler dari log akses.
+
+    Returns:
+    list: Tuple (fungsi, argumen), tanpa duplikat, sesuai urutan prioritas.
+    """
+    year_from, year_to = DEFAULT_YEARS
+    # Nilai awal selectbox dan slider di app: pilihan pertama dan tahun minimum.
+    first_year = helper.year_scale()[0]
+    country = helper.region_options()[0]
+    sport = helper.sport_options()[0]
+    measured_sport = helper.sport_options_nall()[0]
+
+    def athletes(region, sport):
+        # Jumlah atlet dan halaman pertama tabel atlet (urutan default: Year, menaik).
+        return [
+            (preprocessing.total_athlete_count, (year_from, year_to, region, sport)),
+            (preprocessing.total_athlete_page, (year_from, year_to, region, sport, 1, preprocessing.PAGE_SIZE, "Year", True)),
+        ]
+
+    # Figure pra-render yang filenya tidak ada atau basi dirender di sini, bukan di rerun pertama.
+    tasks = [(getattr(helper, name), ()) for name in helper.PRERENDERED]
+    tasks += [
+        (preprocessing.subset_and_display_medal, (country, "All Season", year_from, year_to)),
+        (helper.plot_medal, (country, year_from, year_to)),
+        *athletes(country, sport),
+        (helper.sport_vil, (year_from, year_to, country, sport)),
+        (preprocessing.data_sport_top, (sport, first_year)),
+        (helper.top30_medal_vil, (sport, first_year)),
+        (preprocessing.sex_data_sport, (sport,)),
+        (helper.sex_vil_sport, (sport,)),
+        (helper.plot_height_weight, (measured_sport, country)),
+    ]
+    for region in popular("region"):
+        tasks += [
+            (preprocessing.subset_and_display_medal, (region, "All Season", year_from, year_to)),
+            (helper.plot_medal, (region, year_from, year_to)),
+            *athletes(region, sport),
+            (helper.sport_vil, (year_from, year_to, region, sport)),
+        ]
+    for sport in popular("sport"):
+        tasks += [
+            *athletes(country, sport),
+            (helper.sport_vil, (year_from, year_to, country, sport)),
+            (preprocessing.data_sport_top, (sport, first_year)),
+            (helper.top30_medal_vil, (sport, first_year)),
+        ]
+
+    unique = []
+    for task in tasks:
+        if task not in unique:
+            unique.append(task)
+    return unique
+
+
+def _run(function, args):
+    _wait_idle()
+    try:
+        function(*args)
+    except Exception:  # noqa: BLE001  (pemanasan bersifat opsional; kegagalannya tidak boleh mengganggu app)
+        with _STATE_LOCK:
+            _STATE["failed"] += 1
+    else:
+        with _STATE_LOCK:
+            _STATE["done"] += 1
+    finally:
+        with _STATE_LOCK:
+            if _STATE["done"] + _STATE["failed"] == _STATE["jobs"]:
+                _STATE["finished"] = time.time()
+
+
+def _schedule(executor):
+    _wait_idle()
+    tasks = jobs()
+    with _STATE_LOCK:
+        _STATE["jobs"] = len(tasks)
+        if not tasks:
+            _STATE["finished"] = time.time()
+    return [executor.submit(_run, function, args) for function, args in tasks]
+
+
+def start(workers=WORKERS):
+    """
+    Memulai pemanasan di thread pool latar. Hanya berjalan sekali per proses; panggilan
+    berikutnya (misalnya dari rerun Streamlit lain) tidak melakukan apa-apa.
+
+    Args:
+    workers (int): Jumlah thread pemanasan.
+
+    Returns:
+    Future: Future yang selesai setelah daftar tugas disusun dan dikirim, atau None bila sudah dimulai.
+    """
+    with _STATE_LOCK:
+        if _STATE["executor"] is not None:
+            return None
+        _STATE["executor"] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prewarm")
+        _STATE["started"] = time.time()
+    return _STATE["executor"].submit(_schedule, _STATE["executor"])
+
+
+def status():
+    """
+    Mengambil kemajuan pemanasan.
+
+    Returns:
+    dict: Jumlah tugas, yang selesai, yang gagal, dan lama pemanasan dalam detik (None bila belum selesai).
+    """
+    with _STATE_LOCK:
+        seconds = None if _STATE["finished"] is None else _STATE["finished"] - _STATE["started"]
+        return {"jobs": _STATE["jobs"], "done": _STATE["done"], "failed": _STATE["failed"], "seconds": seconds}
+
+
+def main(argv=None):
+    """
+    Entry point command line: menjalankan pemanasan sampai selesai dan mencetak waktu setiap tugas.
+
+    Args:
+    argv (list): Argumen command line. Defaultnya sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Pemanasan cache dashboard Olimpiade.")
+    parser.add_argument("--list", action="store_true", help="Cetak daftar tugas tanpa menjalankannya.")
+    args = parser.parse_args(argv)
+
+    total = time.perf_counter()
+    for function, call_args in jobs():
+        if args.list:
+            print(f"{function.__module__}.{function.__name__}{call_args}")
+            continue
+        start_time = time.perf_counter()
+        function(*call_args)
+        print(f"{time.perf_counter() - start_time:8.3f}s  {function.__module__}.{function.__name__}{call_args}")
+    if not args.list:
+        print(f"{time.perf_counter() - total:8.3f}s  total")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import functools
+import json
+import os
+import threading
+import time
+
+# Set OLYMPICS_PROFILE=1 untuk mencatat setiap panggilan preprocessing/helper per rerun.
+ENABLED = os.environ.get("OLYMPICS_PROFILE", "0") == "1"
+
+# Path JSONL opsional; setiap trace yang selesai ditulis sebagai satu baris.
+SINK_PATH = os.environ.get("OLYMPICS_PROFILE_LOG")
+
+# Trace yang sedang berjalan, satu per thread (Streamlit menjalankan setiap rerun di thread-nya sendiri).
+_LOCAL = threading.local()
+_SINK_LOCK = threading.Lock()
+
+
+def _rows(value):
+    """
+    Menghitung jumlah baris hasil panggilan: panjang DataFrame/Series/array, jumlah titik
+    figure Plotly, atau panjang elemen pertama bila hasilnya tuple/list berisi DataFrame.
+
+    Returns:
+    int: Jumlah baris, atau None bila tidak bisa dihitung.
+    """
+    if hasattr(value, "data") and hasattr(value, "layout"):
+        return sum(len(trace.x) for trace in value.data if getattr(trace, "x", None) is not None)
+    if isinstance(value, (tuple, list)) and value and hasattr(value[0], "shape"):
+        return len(value[0])
+    if hasattr(value, "shape") or isinstance(value, (list, tuple, dict)):
+        return len(value)
+    return None
+
+
+def start_trace(label):
+    """
+    Memulai trace baru untuk thread ini, misalnya satu rerun Streamlit.
+
+    Args:
+    label (str): Nama trace, misalnya halaman yang sedang dirender.
+    """
+    _LOCAL.trace = {"label": label, "started": time.time(), "calls": []}
+    _LOCAL.stack = []
+
+
+def end_trace():
+    """
+    Menutup trace thread ini dan menuliskannya ke sink JSONL bila dikonfigurasi.
+
+    Returns:
+    dict: Trace dengan label, waktu mulai, total detik, dan daftar panggilan. None bila tidak ada trace.
+    """
+    trace = getattr(_LOCAL, "trace", None)
+    _LOCAL.trace = None
+    if trace is None:
+        return None
+    trace["seconds"] = time.time() - trace["started"]
+    if SINK_PATH:
+        with _SINK_LOCK, open(SINK_PATH, "a") as f:
+            f.write(json.dumps(trace, default=str) + "\n")
+    return trace
+
+
+def _wrap(module_name, function):
+    """
+    Membungkus fungsi agar setiap panggilannya tercatat di trace thread yang sedang berjalan.
+    """
+    name = f"{module_name}.{function.__name__}"
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        trace = getattr(_LOCAL, "trace", None)
+        if trace is None:
+            return function(*args, **kwargs)
+
+        record = {"name": name, "depth": len(_LOCAL.stack), "seconds": 0.0, "rows_in": 0, "rows_out": None,
+                  "clear_data_calls": 0, "loads": 0}
+        trace["calls"].append(record)
+        _LOCAL.stack.append(record)
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            _LOCAL.stack.pop()
+        record["rows_out"] = _rows(result)
+        if name == "preprocessing.clear_data":
+            # Dataset yang dibaca dihitung sebagai rows_in untuk semua pemanggil di atasnya.
+            for parent in _LOCAL.stack:
+                parent["rows_in"] += len(result)
+                parent["clear_data_calls"] += 1
+        return result
+
+    wrapper._profiled = True
+    return wrapper
+
+
+def _count_loads(load):
+    """
+    Membungkus `preprocessing._load` agar pemuatan dataset dicatat di trace thread yang
+    menjalankannya. Hitungan global `_CACHE["misses"]` tidak bisa dipakai: sesi lain yang
+    berjalan bersamaan akan ikut terhitung.
+    """
+    import preprocessing
+
+    @functools.wraps(load)
+    def wrapper(columns):
+        # Kondisi yang sama dengan awal `_load`: bila kolomnya sudah lengkap, tidak ada yang dimuat.
+        loads = not preprocessing._complete(preprocessing._CACHE["frame"], columns)
+        result = load(columns)
+        if loads:
+            for parent in getattr(_LOCAL, "stack", []):
+                parent["loads"] += 1
+        return result
+
+    wrapper._profiled = True
+    return wrapper
+
+
+def instrument(*modules):
+    """
+    Mengganti fungsi publik modul dengan versi yang tercatat. Tidak melakukan apa-apa bila
+    profiling tidak diaktifkan, jadi tanpa OLYMPICS_PROFILE tidak ada biaya tambahan.
+
+    Karena modul memanggil fungsinya sendiri lewat nama global, panggilan bersarang
+    (misalnya `clear_data()` di dalam `participant_data()`) juga tercatat.
+
+    Args:
+    modules (module): Modul yang diinstrumentasi, misalnya preprocessing dan helper.
+    """
+    if not ENABLED:
+        return
+    for module in modules:
+        for attribute, value in list(vars(module).items()):
+            if callable(value) and not attribute.startswith("_") and not isinstance(value, type) \
+                    and getattr(value, "__module__", None) == module.__name__ and not getattr(value, "_profiled", False) \
+                    and attribute != "cached_figure":
+                setattr(module, attribute, _wrap(module.__name__, value))
+        load = getattr(module, "_load", None)
+        if module.__name__ == "preprocessing" and not getattr(load, "_profiled", False):
+            setattr(module, "_load", _count_loads(load))
+
+
+def summary(trace):
+    """
+    Meringkas trace per fungsi untuk ditampilkan.
+
+    Args:
+    trace (dict): Trace dari `end_trace`.
+
+    Returns:
+    list: Satu dict per panggilan dengan indentasi sesuai kedalaman, diurutkan seperti urutan pemanggilan.
+    """
+    return [
+        {
+            "call": "  " * call["depth"] + call["name"],
+            "ms": round(call["seconds"] * 1000, 2),
+            "rows in": call["rows_in"],
+            "rows out": call["rows_out"],
+            "clear_data calls": call["clear_data_calls"],
+            "loads": call["loads"],
+        }
+        for call in trace["calls"]
+    ]
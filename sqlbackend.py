@@ -0,0 +1,213 @@
+import os
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+import preprocessing
+
+# Naikkan bila skema tabel berubah agar file database lama dibangun ulang.
+TABLE_VERSION = 2
+
+# File database per mesin. Dibangun ulang bila sidik jari dataset atau TABLE_VERSION berubah.
+PATHS = {
+    "sqlite": os.path.join(preprocessing.DATA_DIR, "olympics.sqlite"),
+    "duckdb": os.path.join(preprocessing.DATA_DIR, "olympics.duckdb"),
+}
+
+# Indeks SQLite untuk pola filter dashboard: rentang tahun, wilayah, cabang olahraga, dan kombinasinya.
+# Indeks medali parsial dan mencakup semua kolom query tabel medali, jadi tabelnya tidak perlu dibaca.
+# DuckDB tidak memakai indeks ini (indeks parsial tidak didukung): tabelnya disimpan terurut `pos`,
+# yang juga terurut tahun, jadi filter tahun dipangkas oleh statistik min/max per row group.
+_INDEXES = {
+    "athletes_year": "(Year)",
+    "athletes_region_year": "(region, Year)",
+    "athletes_sport_year": "(Sport, Year)",
+    "athletes_sport_region": "(Sport, region)",
+    "athletes_medal": "(region, Year, Season, Medal) WHERE first_of_key = 1",
+}
+
+
+def _connect(engine, path):
+    """
+    Membuka koneksi ke mesin SQL. DuckDB opsional dan baru diimpor saat dipakai.
+    """
+    if engine == "sqlite":
+        return sqlite3.connect(path, check_same_thread=False)
+    if engine == "duckdb":
+        try:
+            import duckdb
+        except ImportError:
+            raise ImportError("OLYMPICS_BACKEND=duckdb membutuhkan paket duckdb (pip install duckdb)") from None
+        return duckdb.connect(path)
+    raise ValueError(f"backend tidak dikenal: {engine}")
+
+
+class SQLBackend:
+    """
+    Backend query di atas tabel `athletes` di SQLite atau DuckDB.
+
+    Tabel berisi dataset bersih dengan kolom kategori disimpan sebagai kode kategorinya
+    (-1 untuk nilai kosong), posisi baris di `clear_data()` sebagai `pos`, dan penanda
+    `first_of_key` untuk baris pertama setiap kunci medali. Filter dan agregasi dijalankan
+    oleh mesin SQL; hasilnya didekode kembali ke tipe dataset bersih, jadi identik dengan
+    `preprocessing.PandasBackend`.
+    """
+
+    def __init__(self, engine):
+        self.name = engine
+        self._lock = threading.Lock()
+
+        data = preprocessing.clear_data()
+        self._dtypes = data.dtypes
+        self._columns = list(data.columns)
+
+        version = f"{preprocessing.fingerprint()}/{TABLE_VERSION}"
+        path = PATHS[engine]
+        self._connection = _connect(engine, path)
+        if self._stored_version() != version:
+            self._load(data, version)
+
+    def _stored_version(self):
+        try:
+            row = self._connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        except Exception:  # noqa: BLE001  (tabel meta belum ada: database baru atau rusak)
+            return None
+        return row[0] if row else None
+
+    def _load(self, data, version):
+        """
+        Membangun ulang tabel `athletes` dan indeksnya dari dataset bersih.
+        """
+        table = pd.DataFrame({"pos": np.arange(len(data), dtype=np.int64)})
+        for column in self._columns:
+            series = data[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                table[column] = series.cat.codes.to_numpy().astype(np.int32)
+            else:
+                table[column] = series.to_numpy()
+        # Deduplikasi medali per pasangan (atlet, acara), sama seperti `preprocessing.medal_data`.
+        table["first_of_key"] = preprocessing._aggregate("keys", preprocessing._build_keys)["medal_first"].astype(np.int8)
+
+        connection = self._connection
+        connection.execute("DROP TABLE IF EXISTS athletes")
+        connection.execute("DROP TABLE IF EXISTS meta")
+        if self.name == "duckdb":
+            connection.register("athletes_source", table)
+            connection.execute("CREATE TABLE athletes AS SELECT * FROM athletes_source ORDER BY pos")
+            connection.unregister("athletes_source")
+        else:
+            columns = ", ".join(f'"{column}"' for column in table.columns)
+            connection.execute(f"CREATE TABLE athletes ({columns}, PRIMARY KEY (pos))")
+            # NaN dari kolom float disimpan sebagai NULL.
+            rows = table.astype(object).where(table.notna(), None).itertuples(index=False, name=None)
+            connection.executemany(f"INSERT INTO athletes VALUES ({', '.join('?' * len(table.columns))})", rows)
+            for name, definition in _INDEXES.items():
+                connection.execute(f"CREATE INDEX {name} ON athletes {definition}")
+        connection.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        connection.execute("INSERT INTO meta VALUES ('version', ?)", [version])
+        connection.commit()
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._connection.execute(sql, list(params)).fetchall()
+
+    def _code(self, column, value):
+        """
+        Mengubah nilai kategori menjadi kodenya. Nilai yang tidak dikenal menjadi -2, yang tidak
+        cocok dengan baris mana pun (-1 dipakai untuk nilai kosong).
+        """
+        code = self._dtypes[column].categories.get_indexer([value])[0]
+        return int(code) if code >= 0 else -2
+
+    def _filters(self, region, sport):
+        clauses, params = [], []
+        if region != "All":
+            clauses.append("region = ?")
+            params.append(self._code("region", region))
+        if sport != "All":
+            clauses.append("Sport = ?")
+            params.append(self._code("Sport", sport))
+        return clauses, params
+
+    def _years(self, from_year, to_year):
+        """
+        Klausa rentang tahun. Batas None berarti rentang terbuka di sisi itu.
+        """
+        clauses, params = [], []
+        if from_year is not None:
+            clauses.append("Year >= ?")
+            params.append(int(from_year))
+        if to_year is not None:
+            clauses.append("Year <= ?")
+            params.append(int(to_year))
+        return clauses, params
+
+    def _rows(self, clauses, params):
+        """
+        Mengambil baris dataset bersih yang cocok dengan filter, terurut berdasarkan posisi barisnya.
+        """
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        columns = ", ".join(f'"{column}"' for column in ["pos"] + self._columns)
+        rows = self._query(f"SELECT {columns} FROM athletes {where} ORDER BY pos", params)
+        values = list(zip(*rows)) if rows else [()] * (len(self._columns) + 1)
+
+        frame = {}
+        for column, column_values in zip(self._columns, values[1:]):
+            dtype = self._dtypes[column]
+            if isinstance(dtype, pd.CategoricalDtype):
+                frame[column] = pd.Categorical.from_codes(np.array(column_values, dtype=np.int32), dtype=dtype)
+            else:
+                # NULL menjadi NaN lewat float64 sebelum dikembalikan ke tipe aslinya.
+                frame[column] = np.array(column_values, dtype=np.float64).astype(dtype)
+        return pd.DataFrame(frame, index=pd.Index(np.array(values[0], dtype=np.int64)))
+
+    def subset_and_display_medal(self, region, season, from_year, to_year):
+        """
+        Tabel medali per wilayah dari jumlah bersyarat pada baris pertama setiap kunci medali.
+        """
+        clauses, params = self._years(from_year, to_year)
+        clauses = ["first_of_key = 1", "region >= 0"] + clauses
+        if season != "All Season":
+            clauses.append("Season = ?")
+            params.append(self._code("Season", season))
+
+        rows = self._query(
+            "SELECT region, SUM(CASE WHEN Medal = 0 THEN 1 ELSE 0 END), SUM(CASE WHEN Medal = 1 THEN 1 ELSE 0 END), "
+            f"SUM(CASE WHEN Medal = 2 THEN 1 ELSE 0 END) FROM athletes WHERE {' AND '.join(clauses)} "
+            "GROUP BY region ORDER BY region",
+            params,
+        )
+        regions, gold, silver, bronze = (np.array(values, dtype=np.int64) for values in (zip(*rows) if rows else [()] * 4))
+        categories = self._dtypes["region"].categories
+        index = pd.CategoricalIndex(pd.Categorical.from_codes(regions, categories=categories), name="region")
+        medals = pd.DataFrame({"medal_Gold": gold, "medal_Silver": silver, "medal_Bronze": bronze}, index=index)
+        newdata = preprocessing._rank_medals(medals)
+
+        if region == "All":
+            return newdata.copy()
+        return newdata[newdata["Region"] == region]
+
+    def total_athlete(self, fromm, too, country, sport):
+        year_clauses, year_params = self._years(fromm, too)
+        clauses, params = self._filters(country, sport)
+        return self._rows(year_clauses + clauses, year_params + params)
+
+    def sex_data_sport(self, sport):
+        rows = self._query(
+            "SELECT Year, SUM(CASE WHEN Sex = 1 THEN 1 ELSE 0 END), SUM(CASE WHEN Sex = 0 THEN 1 ELSE 0 END) "
+            "FROM athletes WHERE Sport = ? AND Sex >= 0 GROUP BY Year ORDER BY Year",
+            [self._code("Sport", sport)],
+        )
+        year, male, female = zip(*rows) if rows else [()] * 3
+        sex_compotation = pd.DataFrame({
+            "Year": np.array(year, dtype=self._dtypes["Year"]),
+            "Male": np.array(male, dtype=np.int64),
+            "Female": np.array(female, dtype=np.int64),
+        })
+        sex_compotation["Total"] = sex_compotation["Male"] + sex_compotation["Female"]
+        return sex_compotation
+
+    def data_height_vs_weight(self, sport, region):
+        return self._rows(*self._filters(region, sport))